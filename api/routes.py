@@ -18,6 +18,7 @@ from schematic.manifest.generator import ManifestGenerator
 from schematic.models.metadata import MetadataModel
 from schematic.schemas.generator import SchemaGenerator
 from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.schema_diff import diff_data_models
 from schematic.store.synapse import SynapseStorage
 from flask_cors import CORS, cross_origin
 from schematic.schemas.explorer import SchemaExplorer
@@ -254,6 +255,10 @@ def get_manifest_route(schema_url, title, oauth, use_annotations, dataset_ids=No
         sg = SchemaGenerator(path_to_json_ld=jsonld)
         component_digraph = sg.se.get_digraph_by_edge_type('requiresComponent')
         components = component_digraph.nodes()
+        # generate the JSON schemas of all components in one pass; the manifest generators below reuse them
+        sg.compile_all_component_schemas(
+            schema_names={component: f'{title}.{component}.manifest' for component in components}
+        )
         for component in components:
             t = f'{title}.{component}.manifest'
             result = create_single_manifest(data_type = component)
@@ -275,10 +280,13 @@ def get_manifest_route(schema_url, title, oauth, use_annotations, dataset_ids=No
     return all_results
 
 
-def validate_manifest_route(schema_url, data_type, json_str=None):
+def validate_manifest_route(schema_url, data_type, json_str=None, n_workers=1, chunksize=None):
     # call config_handler()
     config_handler()
 
+    # processes are forked from the server for each request: never more than the CPUs of the server
+    n_workers = max(1, min(n_workers, os.cpu_count() or 1))
+
     #Get path to temp file where manifest file contents will be saved
     jsc = JsonConverter()
 
@@ -295,7 +303,7 @@ def validate_manifest_route(schema_url, data_type, json_str=None):
     )
 
     errors, warnings = metadata_model.validateModelManifest(
-        manifestPath=temp_path, rootNode=data_type
+        manifestPath=temp_path, rootNode=data_type, n_workers=n_workers, chunksize=chunksize
     )
     
     res_dict = {"errors": errors, "warnings": warnings}
@@ -523,11 +531,9 @@ def get_schema_pickle(schema_url):
 def get_subgraph_by_edge_type(schema_url, relationship):
     # use schema generator and schema explorer
     sg = SchemaGenerator(path_to_json_ld=schema_url)
-    se = SchemaExplorer()
-    se.load_schema(schema_url)
 
     # get the schema graph 
-    schema_graph = se.get_nx_schema()
+    schema_graph = sg.se.get_nx_schema()
 
     # relationship subgraph
     relationship_subgraph = sg.get_subgraph_by_edge_type(schema_graph, relationship)
@@ -541,6 +547,13 @@ def get_subgraph_by_edge_type(schema_url, relationship):
     return Arr
 
 
+def get_schema_diff(old_schema_url, new_schema_url):
+    # compare the versions of the data model
+    schema_diff = diff_data_models(old_schema_url, new_schema_url)
+
+    return schema_diff.to_dict()
+
+
 def find_class_specific_properties(schema_url, schema_class):
     # use schema explorer
     se = SchemaExplorer()
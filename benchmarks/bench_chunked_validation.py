@@ -0,0 +1,86 @@
+"""Benchmark validating a large manifest whole and in chunks of rows, in time and peak memory.
+
+Times MetadataModel.validateModelManifest with restrict_rules, reading the whole manifest at once and reading it in
+chunks of rows, on a manifest of a component of a synthetic data model (see synthetic_model.py) with a few invalid
+values, measures the peak memory allocated with tracemalloc (which slows both down), and checks that both report the
+same errors:
+
+    python benchmarks/bench_chunked_validation.py --attributes 30 --rows 50000 --chunksize 5000
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+from schematic import CONFIG
+from schematic.models.metadata import MetadataModel
+
+from bench_parallel_validation import write_manifest
+from synthetic_model import write_model_jsonld
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "config.yml")
+
+
+def measure(function) -> (float, float, object):
+    """Time a function, and measure the peak memory it allocates, in MB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak / 2**20, result
+
+
+def get_invalid_cells(errors: list) -> list:
+    """Rows and columns of errors, one per invalid cell, in order."""
+    cells = []
+    for error in errors:
+        rows = error[0] if isinstance(error[0], list) else [error[0]]
+        cells.extend((str(row), str(error[1])) for row in rows)
+
+    return sorted(cells)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--attributes", type=int, default=30, help="attributes of the component")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--chunksize", type=int, default=5_000)
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    parser.add_argument("--model-dir", help="directory the synthetic data model is written to / reused from")
+    args = parser.parse_args()
+
+    # one log record per error would dominate the timings
+    logging.disable(logging.ERROR)
+    CONFIG.load_config(CONFIG_PATH)
+
+    model_dir = args.model_dir or tempfile.mkdtemp()
+    jsonld_path = write_model_jsonld(model_dir, n_components=1, attributes_per_component=args.attributes)
+    metadata_model = MetadataModel(inputMModelLocation=jsonld_path, inputMModelLocationType="local")
+
+    manifest_path = os.path.join(model_dir, f"manifest_{args.attributes}x{args.rows}.csv")
+    write_manifest(manifest_path, metadata_model.sg, "Component0", args.rows, args.error_rate)
+
+    print(f"{args.rows} rows, {os.path.getsize(manifest_path) / 2**20:.0f} MB, error rate {args.error_rate}")
+
+    whole, whole_peak, (expected_errors, _) = measure(
+        lambda: metadata_model.validateModelManifest(manifest_path, "Component0", restrict_rules=True)
+    )
+    print(f"whole manifest:           {whole:8.2f} s, peak {whole_peak:8.0f} MB, {len(expected_errors)} errors")
+
+    chunked, chunked_peak, (errors, _) = measure(
+        lambda: metadata_model.validateModelManifest(
+            manifest_path, "Component0", restrict_rules=True, chunksize=args.chunksize
+        )
+    )
+    # rules reporting all invalid rows of a column in one error (e.g. inRange) report them per chunk
+    assert get_invalid_cells(errors) == get_invalid_cells(expected_errors)
+    print(f"chunks of {args.chunksize:7d} rows: {chunked:8.2f} s, peak {chunked_peak:8.0f} MB, {len(errors)} errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark validating content rules (unique, inRange, protectAges, recommended) with and without Great Expectations.
+
+Times ValidateManifest.validate_manifest_rules on a manifest with a large column per content rule of the example data
+model of the tests, with Great Expectations (its in-memory context and suite being built by a first validation), and
+with restrict_rules, which validates the rules in house, and checks that both report the same errors and warnings:
+
+    python benchmarks/bench_content_rules.py --rows 1000000
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from schematic import CONFIG
+from schematic.models.validate_manifest import ValidateManifest
+from schematic.models.validation_plan import get_validation_plan
+from schematic.schemas.generator import SchemaGenerator
+
+ROOT = os.path.join(os.path.dirname(__file__), os.pardir)
+CONFIG_PATH = os.path.join(ROOT, "config.yml")
+MODEL_PATH = os.path.join(ROOT, "tests", "data", "example.model.jsonld")
+
+
+def make_manifest(rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Manifest with a column per content rule, with a few invalid values, as load_df gives them."""
+    return pd.DataFrame(
+        {
+            # a few duplicates
+            "Check Unique": pd.Series(rng.integers(0, rows * 100, rows)).map("id{}".format).astype(object),
+            # inRange 50 100, ages in days: a few out of range
+            "Check Range": pd.Series(rng.integers(50, 101, rows), dtype=object).where(rng.random(rows) > 0.001, 30),
+            "Check Ages": pd.Series(rng.integers(6550, 32850, rows), dtype=object).where(rng.random(rows) > 0.001, 40000),
+            # recommended, and empty
+            "Check Recommended": pd.Series("", index=range(rows), dtype=object),
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # one log record per error would dominate the timings
+    logging.disable(logging.ERROR)
+    CONFIG.load_config(CONFIG_PATH)
+
+    sg = SchemaGenerator(MODEL_PATH)
+    manifest = make_manifest(args.rows, np.random.default_rng(0))
+    # Great Expectations writes a censored copy of the manifest next to it on protectAges warnings
+    manifest_path = os.path.join(tempfile.mkdtemp(), "manifest.csv")
+    vm = ValidateManifest([], manifest, manifest_path, sg, None, get_validation_plan(sg, "MockComponent"))
+
+    print(f"{args.rows} rows x {len(manifest.columns)} columns")
+
+    results = {}
+    for restrict_rules, name in [(False, "Great Expectations"), (True, "in house")]:
+        times = []
+        for _ in range(2):
+            start = time.perf_counter()
+            _, errors, warnings = vm.validate_manifest_rules(manifest.copy(), sg, restrict_rules, None)
+            times.append(time.perf_counter() - start)
+
+        results[restrict_rules] = (errors, warnings)
+        print(f"{name:20s} first {times[0]:8.2f} s, then {times[1]:8.2f} s, {len(errors)} errors, {len(warnings)} warnings")
+
+    assert results[True] == results[False]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark converting a data model from CSV to JSON-LD (`schematic schema convert`).
+
+Converts a synthetic data model (see synthetic_model.py), by default one with about 10k attributes, then converts it
+again after editing one of its rows, reusing the conversion cache:
+
+    python benchmarks/bench_convert.py --components 500 --attributes 18
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from schematic import CONFIG
+from schematic.schemas.df_parser import _convert_csv_to_data_model
+
+from synthetic_model import write_model_csv
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "config.yml")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=500)
+    parser.add_argument("--attributes", type=int, default=18, help="attributes per component")
+    args = parser.parse_args()
+
+    CONFIG.load_config(CONFIG_PATH)
+
+    model_dir = tempfile.mkdtemp()
+    csv_path = os.path.join(model_dir, "synthetic.model.csv")
+    n_rows = write_model_csv(csv_path, args.components, args.attributes)
+
+    start = time.perf_counter()
+    se = _convert_csv_to_data_model(csv_path)
+    convert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    se.export_schema(os.path.join(model_dir, "synthetic.model.jsonld"))
+    export_time = time.perf_counter() - start
+
+    cache_path = os.path.join(model_dir, "synthetic.model.jsonld.cache")
+    _convert_csv_to_data_model(csv_path, cache_path=cache_path)
+
+    model_df = pd.read_csv(csv_path)
+    model_df.loc[n_rows // 2, "Description"] = "Edited description"
+    model_df.to_csv(csv_path, index=False)
+
+    start = time.perf_counter()
+    _convert_csv_to_data_model(csv_path, cache_path=cache_path)
+    incremental_time = time.perf_counter() - start
+
+    print(f"model: {csv_path} ({n_rows} attributes)")
+    print(f"convert CSV to data model: {convert_time:.2f} s")
+    print(f"export JSON-LD:            {export_time:.2f} s")
+    print(f"convert after a one-line edit, with the conversion cache: {incremental_time:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark building Great Expectations checkpoints and running them on manifests, per validation.
+
+Compares, over repeated validations of a manifest of a component of a synthetic data model (see synthetic_model.py),
+a filesystem data context rendering data docs on every validation, as GreatExpectationsHelpers used to, with the
+in-memory context of the process and its cached suites and checkpoints, and checks that both give the same results:
+
+    python benchmarks/bench_ge_context.py --attributes 50 --rows 1000 --repeat 5
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from schematic import CONFIG
+from schematic.models.GE_Helpers import GreatExpectationsHelpers
+from schematic.models.validation_plan import UNIMPLEMENTED_EXPECTATIONS
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.generator import SchemaGenerator
+from schematic.utils.df_utils import load_df
+
+from bench_parallel_validation import write_manifest
+from synthetic_model import write_model_jsonld
+
+CONFIG_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "config.yml"))
+
+
+def validate(sg, manifest, manifest_path: str, data_docs: bool) -> list:
+    """Validate a manifest with Great Expectations, as ValidateManifest.validate_manifest_rules does."""
+    ge_helpers = GreatExpectationsHelpers(
+        sg, UNIMPLEMENTED_EXPECTATIONS, manifest, manifest_path, component="Component0", data_docs=data_docs,
+    )
+    ge_helpers.build_context()
+    ge_helpers.build_expectation_suite()
+    ge_helpers.build_checkpoint()
+
+    results = ge_helpers.run_checkpoint()
+
+    return [
+        (result["expectation_config"]["kwargs"]["column"], result["success"])
+        for result in results.list_validation_results()[0]["results"]
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--attributes", type=int, default=50, help="attributes of the component")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    parser.add_argument("--model-dir", help="directory the synthetic data model is written to / reused from")
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    CONFIG.load_config(CONFIG_PATH)
+
+    model_dir = args.model_dir or tempfile.mkdtemp()
+    jsonld_path = write_model_jsonld(model_dir, n_components=1, attributes_per_component=args.attributes)
+
+    se = SchemaExplorer()
+    se.load_schema(jsonld_path)
+    sg = SchemaGenerator(schema_explorer=se)
+
+    manifest_path = os.path.join(model_dir, f"manifest_{args.attributes}x{args.rows}.csv")
+    write_manifest(manifest_path, sg, "Component0", args.rows, args.error_rate)
+    manifest = load_df(manifest_path, preserve_raw_input=False, dtype="string")
+
+    # the filesystem context is written to ./great_expectations
+    os.chdir(tempfile.mkdtemp())
+
+    print(f"{args.rows} rows x {len(manifest.columns)} columns, {args.repeat} validations")
+
+    expected_results = None
+    for data_docs, name in [(True, "filesystem context, data docs"), (False, "in-memory context, cached suites")]:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = validate(sg, manifest, manifest_path, data_docs)
+            times.append(time.perf_counter() - start)
+
+            if expected_results is None:
+                expected_results = results
+            assert results == expected_results
+
+        print(f"{name:34s} first {times[0]:6.2f} s, then {min(times[1:] or times):6.2f} s per validation")
+
+
+if __name__ == "__main__":
+    main()
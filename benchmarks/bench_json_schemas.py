@@ -0,0 +1,65 @@
+"""Benchmark generating the JSON schemas of all components of a data model.
+
+Compares calling SchemaGenerator.get_json_schema_requirements for every component with
+SchemaGenerator.compile_all_component_schemas, on a synthetic data model (see synthetic_model.py):
+
+    python benchmarks/bench_json_schemas.py --components 300 --attributes 10
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from schematic import CONFIG
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.generator import SchemaGenerator, _json_schema_cache
+
+from synthetic_model import write_model_jsonld
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "config.yml")
+
+
+def time_per_component(sg: SchemaGenerator, components: list) -> float:
+    _json_schema_cache.clear()
+    start = time.perf_counter()
+    for component in components:
+        sg.get_json_schema_requirements(component, f"{component}_validation")
+    return time.perf_counter() - start
+
+
+def time_all_components(sg: SchemaGenerator) -> float:
+    _json_schema_cache.clear()
+    start = time.perf_counter()
+    sg.compile_all_component_schemas()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=300)
+    parser.add_argument("--attributes", type=int, default=10, help="attributes per component")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--model-dir", help="directory the synthetic data model is written to / reused from")
+    args = parser.parse_args()
+
+    CONFIG.load_config(CONFIG_PATH)
+
+    model_dir = args.model_dir or tempfile.mkdtemp()
+    jsonld_path = write_model_jsonld(model_dir, args.components, args.attributes)
+
+    se = SchemaExplorer()
+    se.load_schema(jsonld_path)
+    # without a JSON-LD path, no JSON schema log files are written
+    sg = SchemaGenerator(schema_explorer=se)
+    components = list(se.get_digraph_by_edge_type("requiresComponent").nodes())
+
+    per_component = min(time_per_component(sg, components) for _ in range(args.repeat))
+    all_components = min(time_all_components(sg) for _ in range(args.repeat))
+
+    print(f"model: {jsonld_path} ({len(components)} components)")
+    print(f"get_json_schema_requirements per component: {per_component * 1000:.1f} ms")
+    print(f"compile_all_component_schemas:              {all_components * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark ValidateManifest.validate_manifest_values on a large manifest.
+
+Compares serializing the manifest to JSON and creating a validator for every row, as validate_manifest_values used to,
+with the current implementation, sequentially and in parallel, on a manifest of a component of a synthetic data model
+(see synthetic_model.py) with a few invalid or missing values:
+
+    python benchmarks/bench_manifest_values.py --rows 100000 --workers 4
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from jsonschema import Draft7Validator, exceptions
+
+from schematic import CONFIG
+from schematic.models.validate_manifest import ValidateManifest
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.generator import SchemaGenerator
+
+from synthetic_model import write_model_jsonld
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "config.yml")
+
+
+def per_row_validator(manifest: pd.DataFrame, json_schema: dict) -> list:
+    """Previous implementation: JSON round trip of the manifest, and one validator per row."""
+    errors = []
+    annotations = json.loads(manifest.to_json(orient="records"))
+    for i, annotation in enumerate(annotations):
+        v = Draft7Validator(json_schema)
+        for error in sorted(v.iter_errors(annotation), key=exceptions.relevance):
+            errors.append(
+                [
+                    i + 2,
+                    error.path[-1] if len(error.path) > 0 else "Wrong schema",
+                    error.message[0:500],
+                    error.instance if len(error.path) > 0 else "Wrong schema",
+                ]
+            )
+    return errors
+
+
+def make_manifest(rows: int, json_schema: dict, error_rate: float, rng: random.Random) -> pd.DataFrame:
+    """Manifest of `rows` rows with valid values, except for a few invalid or missing ones; as load_df gives them."""
+    columns = {}
+    for name, schema in json_schema["properties"].items():
+        if "enum" in schema:
+            choices = schema["enum"]
+        elif "items" in schema:
+            choices = [", ".join(schema["items"]["enum"][:2])]
+        else:
+            choices = [f"{name} value {v}" for v in range(10)]
+
+        values = [rng.choice(choices) for _ in range(rows)]
+        for i in range(rows):
+            if rng.random() < error_rate:
+                values[i] = rng.choice(["not a valid value", np.nan])
+        columns[name] = values
+
+    manifest = pd.DataFrame(columns)
+    # list attributes, split as the list rule does
+    for name, schema in json_schema["properties"].items():
+        if "items" in schema:
+            manifest[name] = manifest[name].map(lambda v: v.split(", ") if isinstance(v, str) else v)
+
+    return manifest
+
+
+def best_time(function, repeat: int) -> (float, object):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--model-dir", help="directory the synthetic data model is written to / reused from")
+    args = parser.parse_args()
+
+    # one log record per error would dominate the timings
+    logging.disable(logging.ERROR)
+    CONFIG.load_config(CONFIG_PATH)
+
+    model_dir = args.model_dir or tempfile.mkdtemp()
+    jsonld_path = write_model_jsonld(model_dir, n_components=5, attributes_per_component=10)
+
+    se = SchemaExplorer()
+    se.load_schema(jsonld_path)
+    sg = SchemaGenerator(schema_explorer=se)
+    json_schema = sg.get_json_schema_requirements("Component0", "Component0_validation")
+
+    manifest = make_manifest(args.rows, json_schema, args.error_rate, random.Random(0))
+    vm = ValidateManifest([], manifest, None, sg, json_schema)
+
+    print(f"{args.rows} rows x {len(manifest.columns)} columns, error rate {args.error_rate}")
+
+    previous, expected_errors = best_time(lambda: per_row_validator(manifest, json_schema), args.repeat)
+    print(f"per row validator:               {previous:8.2f} s")
+
+    for n_workers in sorted({1, args.workers}):
+        current, (errors, _) = best_time(
+            lambda: vm.validate_manifest_values(manifest.copy(), json_schema, n_workers=n_workers), args.repeat
+        )
+        assert errors == expected_errors
+        print(
+            f"validate_manifest_values, {n_workers:2d} workers: {current:8.2f} s "
+            f"({args.rows / current:,.0f} rows/s, {previous / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
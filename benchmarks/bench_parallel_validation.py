@@ -0,0 +1,115 @@
+"""Benchmark validating a wide manifest with in-house rules, with 1 to N processes.
+
+Times validate_all (in-house rules column by column, then the JSON schema row by row) with restrict_rules, on a
+manifest of a component of a synthetic data model (see synthetic_model.py) with a few invalid values, for an
+increasing number of processes, and checks that all of them report the same errors:
+
+    python benchmarks/bench_parallel_validation.py --attributes 250 --rows 20000 --max-workers 8
+"""
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+
+import pandas as pd
+
+from schematic import CONFIG
+from schematic.models.validate_manifest import validate_all
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.generator import SchemaGenerator
+from schematic.utils.df_utils import load_df
+
+from synthetic_model import write_model_jsonld
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "config.yml")
+
+
+def make_value(rule: str, valid_values: list, rng: random.Random) -> str:
+    """Valid value of an attribute, as entered in a manifest."""
+    if valid_values:
+        return ", ".join(rng.sample(valid_values, 2)) if rule == "list" else rng.choice(valid_values)
+    if rule == "int" or rule.startswith("regex") or rule.startswith("inRange"):
+        return str(rng.randint(0, 100))
+    if rule == "float":
+        return str(rng.random() * 100)
+    return f"value {rng.randint(0, 1000)}"
+
+
+def write_manifest(path: str, sg: SchemaGenerator, component: str, rows: int, error_rate: float, seed: int = 0):
+    """Write a manifest of a component, with a few invalid values."""
+    rng = random.Random(seed)
+    json_schema = sg.get_json_schema_requirements(component, f"{component}_validation")
+
+    # attributes of the component, and their conditional dependencies
+    attributes = sg.get_node_dependencies(component)
+    attributes += [col for col in json_schema["properties"] if col not in attributes]
+
+    columns = {}
+    for col in attributes:
+        rules = sg.get_node_validation_rules(col)
+        rule = rules[0] if rules else ""
+        schema = json_schema["properties"].get(col, {})
+        valid_values = [v for v in schema.get("enum", schema.get("items", {}).get("enum", [])) if v]
+
+        if col == "Component":
+            columns[col] = [component] * rows
+            continue
+        columns[col] = [
+            "not valid; 1.5" if rng.random() < error_rate else make_value(rule, valid_values, rng)
+            for _ in range(rows)
+        ]
+
+    pd.DataFrame(columns).to_csv(path, index=False)
+
+    return json_schema
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--attributes", type=int, default=250, help="attributes of the component")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--model-dir", help="directory the synthetic data model is written to / reused from")
+    args = parser.parse_args()
+
+    # one log record per error would dominate the timings
+    logging.disable(logging.ERROR)
+    CONFIG.load_config(CONFIG_PATH)
+
+    model_dir = args.model_dir or tempfile.mkdtemp()
+    jsonld_path = write_model_jsonld(model_dir, n_components=1, attributes_per_component=args.attributes)
+
+    se = SchemaExplorer()
+    se.load_schema(jsonld_path)
+    sg = SchemaGenerator(schema_explorer=se)
+
+    manifest_path = os.path.join(model_dir, f"manifest_{args.attributes}x{args.rows}.csv")
+    json_schema = write_manifest(manifest_path, sg, "Component0", args.rows, args.error_rate)
+    manifest = load_df(manifest_path, preserve_raw_input=False, dtype="string")
+
+    print(f"{args.rows} rows x {len(manifest.columns)} columns, error rate {args.error_rate}")
+
+    n_workers = 1
+    expected_errors = None
+    while n_workers <= max(args.max_workers, 1):
+        start = time.perf_counter()
+        errors, warnings, _ = validate_all(
+            None, [], [], manifest.copy(), manifest_path, sg, json_schema,
+            restrict_rules=True, project_scope=None, rootNode="Component0", n_workers=n_workers,
+        )
+        elapsed = time.perf_counter() - start
+
+        if expected_errors is None:
+            expected_errors = errors
+            sequential = elapsed
+        assert errors == expected_errors
+
+        print(f"{n_workers:3d} workers: {elapsed:8.2f} s ({sequential / elapsed:.1f}x), {len(errors)} errors")
+        n_workers *= 2
+
+
+if __name__ == "__main__":
+    main()
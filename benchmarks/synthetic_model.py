@@ -0,0 +1,124 @@
+"""Synthetic data models for the benchmarks in this directory.
+
+Models have `n_components` components, each depending on `attributes_per_component` attributes of its own and ten
+attributes drawn from a pool shared by all components. About a third of the attributes have valid values (some of
+them lists), some valid values have conditional dependencies, and about half of the components depend on the previous
+component.
+"""
+import csv
+import os
+import random
+
+from schematic.schemas.df_parser import _convert_csv_to_data_model
+
+COLUMNS = [
+    "Attribute",
+    "Description",
+    "Valid Values",
+    "DependsOn",
+    "Properties",
+    "Required",
+    "Parent",
+    "DependsOn Component",
+    "Source",
+    "Validation Rules",
+]
+
+# attributes that components have in common
+SHARED_ATTRIBUTES = 50
+SHARED_ATTRIBUTES_PER_COMPONENT = 10
+
+VALIDATION_RULES = ["int", "float", "str", "unique error", "regex search [0-9]+", "inRange 0 100"]
+
+
+def _row(attribute, **values):
+    row = dict.fromkeys(COLUMNS, "")
+    row.update({"Attribute": attribute, "Required": "FALSE"})
+    row.update(values)
+    return row
+
+
+def _attribute_rows(rng: random.Random, name: str) -> list:
+    """Rows of an attribute, and of the conditional dependency of one of its valid values if it has one."""
+    valid_values = ""
+    rule = ""
+
+    kind = rng.random()
+    if kind < 0.3:
+        valid_values = ", ".join(f"{name} Val {v}" for v in range(rng.randint(2, 6)))
+        if rng.random() < 0.3:
+            rule = "list"
+    elif kind < 0.4:
+        rule = rng.choice(VALIDATION_RULES)
+
+    rows = [
+        _row(
+            name,
+            Description=f"desc {name}",
+            Required=rng.choice(["TRUE", "FALSE"]),
+            Parent="DataProperty",
+            **{"Valid Values": valid_values, "Validation Rules": rule},
+        )
+    ]
+
+    # conditional dependency on one of the valid values
+    if valid_values and rng.random() < 0.2:
+        conditional = f"{name} Cond"
+        rows.append(_row(valid_values.split(", ")[0], DependsOn=conditional))
+        rows.append(
+            _row(conditional, Required=rng.choice(["TRUE", "FALSE"]), Parent="DataProperty")
+        )
+
+    return rows
+
+
+def write_model_csv(
+    path: str, n_components: int, attributes_per_component: int, seed: int = 0
+) -> int:
+    """Write a synthetic data model in CSV format; returns the number of rows (attributes) in the model."""
+    rng = random.Random(seed)
+
+    rows = []
+    shared = [f"Shared Attr {i}" for i in range(SHARED_ATTRIBUTES)]
+    for name in shared:
+        rows += _attribute_rows(rng, name)
+
+    for c in range(n_components):
+        attributes = [f"C{c} Attr {a}" for a in range(attributes_per_component)]
+        depends_on = attributes + rng.sample(shared, SHARED_ATTRIBUTES_PER_COMPONENT) + ["Component"]
+        depends_on_component = f"Component {c - 1}" if c > 0 and rng.random() < 0.5 else ""
+        rows.append(
+            _row(
+                f"Component {c}",
+                DependsOn=", ".join(depends_on),
+                Parent="DataType",
+                **{"DependsOn Component": depends_on_component},
+            )
+        )
+
+        for name in attributes:
+            rows += _attribute_rows(rng, name)
+
+    rows += [_row("Component"), _row("DataType"), _row("DataProperty")]
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return len(rows)
+
+
+def write_model_jsonld(
+    directory: str, n_components: int, attributes_per_component: int, seed: int = 0
+) -> str:
+    """Write a synthetic data model in JSON-LD format (converted from CSV); returns the path of the JSON-LD file."""
+    name = f"synthetic_{n_components}x{attributes_per_component}_{seed}"
+    csv_path = os.path.join(directory, f"{name}.model.csv")
+    jsonld_path = os.path.join(directory, f"{name}.model.jsonld")
+
+    if not os.path.exists(jsonld_path):
+        write_model_csv(csv_path, n_components, attributes_per_component, seed)
+        _convert_csv_to_data_model(csv_path).export_schema(jsonld_path)
+
+    return jsonld_path
@@ -141,6 +141,16 @@ model_commands = {
             "project_scope": (
                 "Specify a comma-separated list of projects to search through for cross manifest validation."
             ),
+            "n_workers": (
+                "Number of processes validating the manifest in parallel: the columns validated with in-house rules, "
+                "and batches of rows validated against the JSON schema, are distributed among them. "
+                "By default, the manifest is validated in a single process."
+            ),
+            "chunksize": (
+                "Number of rows of the manifest read and validated at once, so that large manifests do not have to fit "
+                "in memory. Rules are then validated in house, as with --restrict_rules. "
+                "By default, the whole manifest is read at once."
+            ),
         },
     }
 }
@@ -159,7 +169,21 @@ schema_commands = {
             "output_jsonld": (
                 "Path to where the generated JSON-LD file needs to be outputted."
             ),
-        }
+            "no_cache": (
+                "Convert the whole data model, without reading or writing the conversion cache. By default, the "
+                "state of each conversion is cached in the cache directory of the user "
+                "(~/.cache/schematic/conversions), and the next conversion to the same JSON-LD file only "
+                "regenerates the parts of the data model that changed, when possible."
+            ),
+        },
+        "diff": {
+            "short_help": (
+                "Compare two versions of a JSON-LD data model, and list the components affected by the changes."
+            ),
+            "output_json": (
+                "Path to where the changes are stored, in JSON format. By default, they are printed."
+            ),
+        },
     }
 }
 
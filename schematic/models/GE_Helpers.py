@@ -1,9 +1,12 @@
 
 from statistics import mode
 from tabnanny import check
+import itertools
 import logging
 import os
 import re
+import threading
+from collections import Counter, OrderedDict
 import numpy as np
 
 # allows specifying explicit variable types
@@ -19,14 +22,67 @@ from ruamel import yaml
 import great_expectations as ge
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.data_context import BaseDataContext
-from great_expectations.data_context.types.base import DataContextConfig, DatasourceConfig, FilesystemStoreBackendDefaults
+from great_expectations.data_context.types.base import DataContextConfig, FilesystemStoreBackendDefaults, InMemoryStoreBackendDefaults
 from great_expectations.data_context.types.resource_identifiers import ExpectationSuiteIdentifier
 
-from schematic.models.validate_attribute import GenerateError
+from schematic.models.validate_attribute import GenerateError, MIN_AGE, MAX_AGE
 from schematic.utils.validate_utils import rule_in_rule_list
 
 logger = logging.getLogger(__name__)
 
+# datasource the manifests are given to checkpoints through
+DATASOURCE_CONFIG = {
+    "name": "example_datasource",
+    "class_name": "Datasource",
+    "module_name": "great_expectations.datasource",
+    "execution_engine": {
+        "module_name": "great_expectations.execution_engine",
+        "class_name": "PandasExecutionEngine",
+    },
+    "data_connectors": {
+        "default_runtime_data_connector_name": {
+            "class_name": "RuntimeDataConnector",
+            "batch_identifiers": ["default_identifier_name"],
+        },
+    },
+}
+
+# number of expectation suites, and their checkpoints, kept in the in-memory data context
+MAX_CACHED_SUITES = 32
+
+# in-memory data context of the process, built on first use
+_in_memory_context = None
+# ids of the suites (and checkpoints) built in the in-memory data context, by data model hash, component, manifest
+# columns and unimplemented expectations; least recently used first
+_cached_suites = OrderedDict()
+_suite_ids = itertools.count()
+# validations running the checkpoint of each suite, by suite id; suites evicted while in use are only deleted once
+# the last of their validations releases them
+_suites_in_use = Counter()
+_evicted_suites = set()
+_context_lock = threading.Lock()
+
+
+def get_in_memory_context():
+    """Get the in-memory data context of the process, with the datasource manifests are validated through.
+
+    It is built on the first call, and shared by all validations of the process: its stores are in memory, and it
+    renders no data docs, so that validations do not write (nor race on) ./great_expectations.
+    """
+    global _in_memory_context
+
+    with _context_lock:
+        if _in_memory_context is None:
+            data_context_config = DataContextConfig(
+                store_backend_defaults=InMemoryStoreBackendDefaults(),
+            )
+            context = BaseDataContext(project_config=data_context_config)
+            context.add_datasource(**DATASOURCE_CONFIG)
+            _in_memory_context = context
+
+    return _in_memory_context
+
+
 class GreatExpectationsHelpers(object):
     """
         Great Expectations helper class
@@ -39,7 +95,9 @@ class GreatExpectationsHelpers(object):
         sg,
         unimplemented_expectations,
         manifest,
-        manifestPath
+        manifestPath,
+        component = None,
+        data_docs = False,
         ):
         """
             Purpose:
@@ -53,11 +111,24 @@ class GreatExpectationsHelpers(object):
                     manifest being validated
                 manifestPath:
                     path to manifest being validated            
+                component:
+                    component the manifest is validated against
+                data_docs:
+                    if True, the suite and validation results are stored under ./great_expectations,
+                    and data docs are rendered; otherwise, the in-memory data context of the process is
+                    used, and suites and checkpoints are built once per data model, component and
+                    manifest columns
         """
         self.unimplemented_expectations = unimplemented_expectations
         self.sg = sg
         self.manifest = manifest
         self.manifestPath = manifestPath
+        self.component = component
+        self.data_docs = data_docs
+
+        self.expectation_suite_name = "Manifest_test_suite"
+        self.checkpoint_name = "manifest_checkpoint"
+        self.suite_id = None
 
     def  build_context(self):
         """
@@ -66,48 +137,19 @@ class GreatExpectationsHelpers(object):
             Returns:
                 saves dataContext and datasource to self
         """
-        self.context=ge.get_context()
-
-        #create datasource configuration
-        datasource_config = {
-            "name": "example_datasource",
-            "class_name": "Datasource",
-            "module_name": "great_expectations.datasource",
-            "execution_engine": {
-                "module_name": "great_expectations.execution_engine",
-                "class_name": "PandasExecutionEngine",
-            },
-            "data_connectors": {
-                "default_runtime_data_connector_name": {
-                    "class_name": "RuntimeDataConnector",
-                    "batch_identifiers": ["default_identifier_name"],
-                },
-            },
-        }
+        if not self.data_docs:
+            self.context = get_in_memory_context()
+            return
 
         #create data context configuration
         data_context_config = DataContextConfig(
-            datasources={
-                "pandas": DatasourceConfig(
-                    class_name="Datasource",
-                    execution_engine={
-                        "class_name": "PandasExecutionEngine"
-                    },
-                    data_connectors={
-                        "default_runtime_data_connector_name": {
-                            "class_name": "RuntimeDataConnector",
-                            "batch_identifiers": ["default_identifier_name"],
-                        }
-                    },
-                )
-            },
             store_backend_defaults=FilesystemStoreBackendDefaults(root_directory=os.path.join(os.getcwd(),'great_expectations')),
         )
 
         #build context and add data source
         self.context=BaseDataContext(project_config=data_context_config)
-        #self.context.test_yaml_config(yaml.dump(datasource_config))
-        self.context.add_datasource(**datasource_config)
+        #self.context.test_yaml_config(yaml.dump(DATASOURCE_CONFIG))
+        self.context.add_datasource(**DATASOURCE_CONFIG)
 
         
     def build_expectation_suite(self,):
@@ -139,20 +181,139 @@ class GreatExpectationsHelpers(object):
             #"matchExactlyOne": "expect_foreign_keys_in_column_a_to_exist_in_column_b",
         }
         
+        if not self.data_docs:
+            # suites only have expectations for the columns of the manifest
+            suite_key = (
+                self.sg.se.schema_hash,
+                self.component,
+                tuple(self.manifest.columns),
+                tuple(self.unimplemented_expectations),
+            )
+
+            with _context_lock:
+                suite_id = _cached_suites.get(suite_key)
+                if suite_id is not None:
+                    _cached_suites.move_to_end(suite_key)
+                    self._set_names(suite_id)
+                    self.suite = self.context.get_expectation_suite(self.expectation_suite_name)
+                    # in use until released, once the checkpoint has run
+                    _suites_in_use[suite_id] += 1
+                    return
+
+                suite_id = next(_suite_ids)
+                self._set_names(suite_id)
+                self.suite = self.context.create_expectation_suite(
+                    expectation_suite_name=self.expectation_suite_name,
+                    overwrite_existing=True
+                )
+                self._add_expectations(validation_expectation)
+                self.context.save_expectation_suite(expectation_suite=self.suite, expectation_suite_name=self.expectation_suite_name)
+
+                _cached_suites[suite_key] = suite_id
+                _suites_in_use[suite_id] += 1
+                while len(_cached_suites) > MAX_CACHED_SUITES:
+                    _, evicted_id = _cached_suites.popitem(last=False)
+                    if evicted_id in _suites_in_use:
+                        # another validation is about to run its checkpoint
+                        _evicted_suites.add(evicted_id)
+                    else:
+                        self._delete_suite(evicted_id)
+
+            return
+
         #create blank expectation suite
-        expectation_suite_name = "Manifest_test_suite"       
+        expectation_suite_name = self.expectation_suite_name
         self.suite = self.context.create_expectation_suite(
             expectation_suite_name=expectation_suite_name,
             overwrite_existing=True
         )    
 
+        self._add_expectations(validation_expectation)
+            
+        self.context.save_expectation_suite(expectation_suite=self.suite, expectation_suite_name=expectation_suite_name)
+
+        suite_identifier = ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
+        self.context.build_data_docs(resource_identifiers=[suite_identifier])
+        ##Webpage DataDocs opened here:
+        #self.context.open_data_docs(resource_identifier=suite_identifier) 
+
+    def run_checkpoint(self):
+        """
+            Purpose:
+                Run the checkpoint on the manifest, then release its suite and checkpoint
+            Returns:
+                results of the checkpoint
+        """
+        if self.data_docs:
+            try:
+                return self._run_checkpoint()
+            finally:
+                self.release()
+
+        try:
+            # runtime batches of all manifests have the same id, and are loaded into the execution engine of the
+            # datasource, which all validations of the process share: checkpoints run one at a time
+            with _context_lock:
+                try:
+                    return self._run_checkpoint()
+                finally:
+                    # the manifest is not kept in the context once validated
+                    batch_manager = self.context.datasources["example_datasource"].execution_engine.batch_manager
+                    batch_manager.batch_data_cache.clear()
+                    batch_manager.reset_batch_cache()
+        finally:
+            # the suite and checkpoint can be deleted from the context once evicted
+            self.release()
+
+    def _run_checkpoint(self):
+        return self.context.run_checkpoint(
+            checkpoint_name=self.checkpoint_name,
+            batch_request={
+                "runtime_parameters": {"batch_data": self.manifest},
+                "batch_identifiers": {
+                    "default_identifier_name": "manifestID"
+                },
+            },
+            result_format={'result_format': 'COMPLETE'},
+        )
+
+    def release(self):
+        """
+            Purpose:
+                Release the suite and checkpoint of the in-memory data context the validation used, once
+                its checkpoint has run, so they can be deleted if they were evicted meanwhile
+        """
+        if self.suite_id is None:
+            return
+
+        with _context_lock:
+            _suites_in_use[self.suite_id] -= 1
+            if _suites_in_use[self.suite_id] <= 0:
+                del _suites_in_use[self.suite_id]
+                if self.suite_id in _evicted_suites:
+                    _evicted_suites.remove(self.suite_id)
+                    self._delete_suite(self.suite_id)
+
+        self.suite_id = None
+
+    def _set_names(self, suite_id: int):
+        self.suite_id = suite_id
+        self.expectation_suite_name = f"Manifest_test_suite_{suite_id}"
+        self.checkpoint_name = f"manifest_checkpoint_{suite_id}"
+
+    def _delete_suite(self, suite_id: int):
+        """Delete a suite, and its checkpoint, from the in-memory data context."""
+        self.context.delete_expectation_suite(f"Manifest_test_suite_{suite_id}")
+        if f"manifest_checkpoint_{suite_id}" in self.context.list_checkpoints():
+            self.context.delete_checkpoint(f"manifest_checkpoint_{suite_id}")
+
+    def _add_expectations(self, validation_expectation: Dict):
+        """Add the expectations of the rules of the manifest columns to self.suite."""
         #build expectation configurations for each expecation
         for col in self.manifest.columns:
             args={}
             meta={}
             
-            # remove trailing/leading whitespaces from manifest
-            self.manifest.applymap(lambda x: x.strip() if isinstance(x, str) else x)
             validation_rules = self.sg.get_node_validation_rules(col)
 
             #check if attribute has any rules associated with it
@@ -272,14 +433,6 @@ class GreatExpectationsHelpers(object):
                         meta=meta,
                         validation_expectation=validation_expectation,
                     )
-        
-            
-        self.context.save_expectation_suite(expectation_suite=self.suite, expectation_suite_name=expectation_suite_name)
-
-        suite_identifier = ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
-        self.context.build_data_docs(resource_identifiers=[suite_identifier])
-        ##Webpage DataDocs opened here:
-        #self.context.open_data_docs(resource_identifier=suite_identifier) 
 
     def add_expectation(
         self,
@@ -325,7 +478,7 @@ class GreatExpectationsHelpers(object):
                 adds checkpoint to self 
         """
         #create manifest checkpoint
-        checkpoint_name = "manifest_checkpoint"  
+        checkpoint_name = self.checkpoint_name
         checkpoint_config={
             "name": checkpoint_name,
             "config_version": 1,
@@ -337,11 +490,30 @@ class GreatExpectationsHelpers(object):
                         "data_connector_name": "default_runtime_data_connector_name",
                         "data_asset_name": "Manifest",
                     },
-                    "expectation_suite_name": "Manifest_test_suite",
+                    "expectation_suite_name": self.expectation_suite_name,
                 }
             ],
         }
 
+        if not self.data_docs:
+            # validation results are neither stored nor rendered; checkpoints need an action, and suites
+            # have no evaluation parameters to store
+            checkpoint_config["class_name"] = "Checkpoint"
+            checkpoint_config["action_list"] = [
+                {
+                    "name": "store_evaluation_params",
+                    "action": {"class_name": "StoreEvaluationParametersAction"},
+                },
+            ]
+
+            with _context_lock:
+                # checkpoints are built once, with their suite
+                if checkpoint_name in self.context.list_checkpoints():
+                    return
+                self.context.add_checkpoint(**checkpoint_config)
+
+            return
+
         #self.context.test_yaml_config(yaml.dump(checkpoint_config),return_mode="report_object")        
         self.context.add_checkpoint(**checkpoint_config)
     
@@ -465,8 +637,8 @@ class GreatExpectationsHelpers(object):
             
         """        
 
-        min_age = 6550      #days
-        max_age = 32849     #days
+        min_age = MIN_AGE      #days
+        max_age = MAX_AGE      #days
 
         return min_age, max_age
 
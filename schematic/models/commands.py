@@ -190,8 +190,22 @@ def submit_manifest(
     callback=parse_synIDs,
     help=query_dict(model_commands, ("model", "validate", "project_scope")),
 )
+@click.option(
+    "-nw",
+    "--n_workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help=query_dict(model_commands, ("model", "validate", "n_workers")),
+)
+@click.option(
+    "-cs",
+    "--chunksize",
+    default=None,
+    type=click.IntRange(min=1),
+    help=query_dict(model_commands, ("model", "validate", "chunksize")),
+)
 @click.pass_obj
-def validate_manifest(ctx, manifest_path, data_type, json_schema, restrict_rules,project_scope):
+def validate_manifest(ctx, manifest_path, data_type, json_schema, restrict_rules,project_scope, n_workers, chunksize):
     """
     Running CLI for manifest validation.
     """
@@ -223,6 +237,7 @@ def validate_manifest(ctx, manifest_path, data_type, json_schema, restrict_rules
 
     errors, warnings = metadata_model.validateModelManifest(
         manifestPath=manifest_path, rootNode=data_type, jsonSchema=json_schema, restrict_rules=restrict_rules, project_scope=project_scope,
+        n_workers=n_workers, chunksize=chunksize,
     )
 
     if not errors:
@@ -0,0 +1,373 @@
+import numbers
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+# keywords that do not affect validation
+ANNOTATION_KEYWORDS = {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+
+# expressions checking the JSON type of a value, as jsonschema's Draft 7 type checker does
+JSON_TYPE_EXPRESSIONS = {
+    "null": "{var} is None",
+    "boolean": "isinstance({var}, bool)",
+    "string": "isinstance({var}, str)",
+    "array": "isinstance({var}, list)",
+    "object": "isinstance({var}, dict)",
+    "number": "(isinstance({var}, Number) and not isinstance({var}, bool))",
+    "integer": (
+        "(isinstance({var}, int) and not isinstance({var}, bool)"
+        " or isinstance({var}, float) and {var}.is_integer())"
+    ),
+}
+
+
+class UndecidedInstance(Exception):
+    """A compiled check cannot decide whether an instance is valid; it has to be validated by jsonschema."""
+
+
+class UnsupportedSchema(Exception):
+    """A JSON schema uses keywords the compiled checks do not implement."""
+
+
+def compile_validity_check(schema: Dict) -> Optional[Callable[[Any], bool]]:
+    """Compile a JSON schema into a Python function checking if an instance is valid, with the Draft 7 semantics
+    of jsonschema.
+
+    Only the keywords of the schemas SchemaGenerator.get_json_schema_requirements generates (properties, required,
+    enum, type, not, minLength, items, maxItems, allOf and if/then, plus a few related ones) are supported. The check
+    is meant to skip valid rows cheaply: it raises UndecidedInstance for values it does not handle exactly (e.g.
+    non-string values compared to an enum), and errors are reported by validating the remaining rows with jsonschema.
+
+    Args:
+        schema: JSON schema.
+
+    Returns:
+        The check, or None if the schema uses keywords that are not supported.
+    """
+    code_generator = _CheckCodeGenerator()
+    try:
+        function_name = code_generator.add_function(schema)
+    except UnsupportedSchema:
+        return None
+
+    namespace = {"Number": numbers.Number, "UndecidedInstance": UndecidedInstance}
+    namespace.update(code_generator.constants)
+    exec(compile("\n".join(code_generator.lines), "<json schema check>", "exec"), namespace)
+
+    return namespace[function_name]
+
+
+class _CheckCodeGenerator(object):
+    """Generate the source code of the functions checking a JSON schema and its subschemas.
+
+    Each (sub)schema is translated into statements returning False as soon as the value they check is not valid;
+    properties, items and allOf subschemas are inlined, and other subschemas (e.g. of "not" and "if") get their own
+    function.
+    """
+
+    def __init__(self) -> None:
+        self.lines = []
+        self.constants = {}
+        self.n_functions = 0
+
+    def add_function(self, schema) -> str:
+        """Generate a function checking a schema; returns its name."""
+        name = f"check_{self.n_functions}"
+        self.n_functions += 1
+        body = []
+        self._add_checks(schema, "value", body, indent=1, depth=0)
+
+        self.lines += [f"def {name}(value):"] + body + ["    return True", ""]
+
+        return name
+
+    def _add_constant(self, value) -> str:
+        name = f"constant_{len(self.constants)}"
+        self.constants[name] = value
+
+        return name
+
+    def _add_checks(self, schema, var: str, lines: List[str], indent: int, depth: int) -> None:
+        pad = "    " * indent
+
+        if schema is True:
+            return
+        if schema is False:
+            lines.append(f"{pad}return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(schema)
+
+        for keyword, value in schema.items():
+            if keyword in ANNOTATION_KEYWORDS or keyword in ("then", "else"):
+                continue
+
+            if keyword == "type":
+                types = [value] if isinstance(value, str) else value
+                if any(json_type not in JSON_TYPE_EXPRESSIONS for json_type in types):
+                    raise UnsupportedSchema(value)
+                type_check = " or ".join(JSON_TYPE_EXPRESSIONS[json_type] for json_type in types)
+                lines.append(f"{pad}if not ({type_check.format(var=var)}):")
+                lines.append(f"{pad}    return False")
+
+            elif keyword == "enum":
+                # strings only equal strings; other values follow the jsonschema equality rules (e.g. True != 1)
+                strings = self._add_constant(frozenset(v for v in value if isinstance(v, str)))
+                lines.append(f"{pad}if isinstance({var}, str):")
+                lines.append(f"{pad}    if {var} not in {strings}:")
+                lines.append(f"{pad}        return False")
+                lines.append(f"{pad}elif {var} is None:")
+                lines.append(f"{pad}    {'pass' if any(v is None for v in value) else 'return False'}")
+                if not any(isinstance(v, (list, dict)) for v in value):
+                    # arrays and objects only equal arrays and objects
+                    lines.append(f"{pad}elif isinstance({var}, (list, dict)):")
+                    lines.append(f"{pad}    return False")
+                lines.append(f"{pad}else:")
+                lines.append(f"{pad}    raise UndecidedInstance({var})")
+
+            elif keyword in ("minLength", "maxLength", "minItems", "maxItems"):
+                json_type = "str" if keyword.endswith("Length") else "list"
+                operator = "<" if keyword.startswith("min") else ">"
+                lines.append(f"{pad}if isinstance({var}, {json_type}) and len({var}) {operator} {int(value)}:")
+                lines.append(f"{pad}    return False")
+
+            elif keyword == "not":
+                lines.append(f"{pad}if {self.add_function(value)}({var}):")
+                lines.append(f"{pad}    return False")
+
+            elif keyword == "items":
+                if isinstance(value, list):
+                    raise UnsupportedSchema(keyword)
+                item = f"item_{depth}"
+                lines.append(f"{pad}if isinstance({var}, list):")
+                lines.append(f"{pad}    for {item} in {var}:")
+                self._add_checks(value, item, lines, indent + 2, depth + 1)
+                lines.append(f"{pad}        pass")
+
+            elif keyword == "properties":
+                prop = f"prop_{depth}"
+                lines.append(f"{pad}if isinstance({var}, dict):")
+                for (name, subschema) in value.items():
+                    if subschema == {} or subschema is True:
+                        continue
+                    lines.append(f"{pad}    if {name!r} in {var}:")
+                    lines.append(f"{pad}        {prop} = {var}[{name!r}]")
+                    self._add_checks(subschema, prop, lines, indent + 2, depth + 1)
+                lines.append(f"{pad}    pass")
+
+            elif keyword == "required":
+                if value:
+                    missing = " or ".join(f"{name!r} not in {var}" for name in value)
+                    lines.append(f"{pad}if isinstance({var}, dict) and ({missing}):")
+                    lines.append(f"{pad}    return False")
+
+            elif keyword == "allOf":
+                for subschema in value:
+                    self._add_checks(subschema, var, lines, indent, depth)
+
+            elif keyword == "anyOf":
+                any_of = " or ".join(f"{self.add_function(subschema)}({var})" for subschema in value)
+                lines.append(f"{pad}if not ({any_of}):")
+                lines.append(f"{pad}    return False")
+
+            elif keyword == "if":
+                lines.append(f"{pad}if {self.add_function(value)}({var}):")
+                self._add_checks(schema.get("then", True), var, lines, indent + 1, depth)
+                lines.append(f"{pad}    pass")
+                lines.append(f"{pad}else:")
+                self._add_checks(schema.get("else", True), var, lines, indent + 1, depth)
+                lines.append(f"{pad}    pass")
+
+            else:
+                raise UnsupportedSchema(keyword)
+
+
+def get_valid_rows(schema: Dict, manifest: pd.DataFrame) -> Optional[np.ndarray]:
+    """Find the rows of a manifest that are valid against a JSON schema, column by column.
+
+    The constructs of the schemas SchemaGenerator.get_json_schema_requirements generates are translated into
+    operations on whole columns: "enum" properties into Series.isin, "required" lists into column lookups, and "allOf"
+    if/then blocks into boolean masks; other property schemas are checked value by value with the check of
+    compile_validity_check. Rows are the JSON instances of validate_manifest_values, i.e. missing values are null.
+
+    Args:
+        schema: JSON schema of the component.
+        manifest: Manifest, with its values as validated against the schema.
+
+    Returns:
+        A mask of the rows that are certainly valid; the other rows have to be validated with jsonschema. None if the
+        schema cannot be translated.
+    """
+    if not manifest.columns.is_unique:
+        return None
+
+    try:
+        return _ColumnChecks(manifest).get_valid_rows(schema)
+    except UnsupportedSchema:
+        return None
+
+
+class _ColumnChecks(object):
+    """Check the rows of a manifest against JSON schemas, column by column."""
+
+    def __init__(self, manifest: pd.DataFrame) -> None:
+        self.manifest = manifest
+        self.n_rows = len(manifest)
+        self._columns = {}
+
+    def _get_column(self, name: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the values of a column, and the masks of its missing (null) and string values."""
+        if name not in self._columns:
+            manifest_col = self.manifest[name]
+            values = manifest_col.to_numpy(dtype=object)
+            missing = manifest_col.isna().to_numpy()
+            if infer_dtype(values, skipna=True) in ("string", "empty"):
+                strings = ~missing
+            else:
+                strings = np.fromiter(
+                    map(isinstance, values, repeat(str)), dtype=bool, count=len(values)
+                )
+            self._columns[name] = (values, missing, strings)
+
+        return self._columns[name]
+
+    def _fill(self, value: bool) -> np.ndarray:
+        return np.full(self.n_rows, value, dtype=bool)
+
+    def get_valid_rows(self, schema) -> np.ndarray:
+        """Get the mask of the rows certainly valid against a schema of the rows (objects)."""
+        if schema is True or schema is False:
+            return self._fill(schema)
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(schema)
+
+        valid = self._fill(True)
+        for keyword, value in schema.items():
+            if keyword in ANNOTATION_KEYWORDS:
+                continue
+
+            if keyword == "type":
+                if value != "object":
+                    raise UnsupportedSchema(keyword)
+
+            elif keyword == "properties":
+                for (name, subschema) in value.items():
+                    if name in self.manifest.columns:
+                        valid &= self._get_valid_values(name, subschema)
+
+            elif keyword == "required":
+                if not all(name in self.manifest.columns for name in value):
+                    return self._fill(False)
+
+            elif keyword == "allOf":
+                for subschema in value:
+                    valid &= self.get_valid_rows(subschema)
+
+            elif keyword == "if":
+                matches, decided = self._get_row_matches(value)
+                valid &= decided & np.where(
+                    matches,
+                    self.get_valid_rows(schema.get("then", True)),
+                    self.get_valid_rows(schema.get("else", True)),
+                )
+
+            elif keyword not in ("then", "else"):
+                raise UnsupportedSchema(keyword)
+
+        return valid
+
+    def _get_row_matches(self, schema) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the masks of the rows valid against the schema of an "if" block, and of the rows that mask is exact
+        for.
+        """
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(schema)
+
+        conditions = []
+        for keyword, value in schema.items():
+            if keyword in ANNOTATION_KEYWORDS:
+                continue
+
+            if keyword == "properties":
+                for (name, subschema) in value.items():
+                    if name not in self.manifest.columns or subschema == {}:
+                        continue
+                    if set(subschema) != {"enum"}:
+                        raise UnsupportedSchema(subschema)
+                    conditions.append(self._get_enum_matches(name, subschema["enum"]))
+
+            elif keyword == "required":
+                has_columns = all(name in self.manifest.columns for name in value)
+                conditions.append((self._fill(has_columns), self._fill(True)))
+
+            else:
+                raise UnsupportedSchema(keyword)
+
+        matches = self._fill(True)
+        decided = self._fill(True)
+        mismatches = self._fill(False)
+        for (condition_matches, condition_decided) in conditions:
+            matches &= condition_matches
+            decided &= condition_decided
+            mismatches |= condition_decided & ~condition_matches
+
+        # a row that certainly does not match one of the conditions does not match
+        return matches & ~mismatches, decided | mismatches
+
+    def _get_enum_matches(self, name: str, enum: List) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the masks of the values of a column in an enum, and of the values that mask is exact for (strings,
+        nulls, and arrays and objects if the enum has none; other values follow the jsonschema equality rules).
+        """
+        values, missing, strings = self._get_column(name)
+
+        matches = missing & any(v is None for v in enum)
+        matches[strings] = pd.Series(values[strings], dtype=object).isin(
+            [v for v in enum if isinstance(v, str)]
+        ).to_numpy()
+
+        decided = strings | missing
+        if not any(isinstance(v, (list, dict)) for v in enum) and not decided.all():
+            decided |= np.fromiter(
+                map(isinstance, values, repeat((list, dict))), dtype=bool, count=len(values)
+            )
+
+        return matches, decided
+
+    def _get_valid_values(self, name: str, schema) -> np.ndarray:
+        """Get the mask of the values of a column certainly valid against a property schema."""
+        if schema is True or schema == {}:
+            return self._fill(True)
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(schema)
+
+        values, missing, strings = self._get_column(name)
+
+        vectorized = set(schema) - ANNOTATION_KEYWORDS <= {"enum", "not", "minLength"}
+        if vectorized and schema.get("not", {"type": "null"}) == {"type": "null"}:
+            valid = self._fill(True)
+            if "enum" in schema:
+                matches, decided = self._get_enum_matches(name, schema["enum"])
+                valid &= matches & decided
+            if "not" in schema:
+                valid &= ~missing
+            if "minLength" in schema:
+                valid[strings] &= pd.Series(values[strings], dtype=object).str.len().to_numpy() >= schema["minLength"]
+            return valid
+
+        # other schemas (e.g. of list attributes) are checked value by value
+        is_valid = compile_validity_check(schema)
+        if is_valid is None:
+            return self._fill(False)
+
+        def is_certainly_valid(value):
+            try:
+                return is_valid(value)
+            except UndecidedInstance:
+                return False
+
+        return np.fromiter(
+            map(is_certainly_valid, np.where(missing, None, values)), dtype=bool, count=self.n_rows
+        )
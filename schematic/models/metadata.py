@@ -10,7 +10,7 @@ from jsonschema import Draft7Validator, exceptions, validate, ValidationError, F
 from os.path import exists
 
 # allows specifying explicit variable types
-from typing import Any, Dict, Optional, Text, List
+from typing import Any, Dict, Iterator, Optional, Text, List, Tuple
 
 # handle schema logic; to be refactored as SchemaExplorer matures into a package
 # as collaboration with Biothings progresses
@@ -23,10 +23,10 @@ from schematic.schemas.generator import SchemaGenerator
 # we shouldn't need to expose Synapse functionality explicitly
 from schematic.store.synapse import SynapseStorage
 
-from schematic.utils.df_utils import load_df
+from schematic.utils.df_utils import load_df, load_df_chunks
 
 from schematic.models.validate_attribute import ValidateAttribute
-from schematic.models.validate_manifest import validate_all
+from schematic.models.validate_manifest import validate_all, ChunkedManifestValidation
 
 
 logger = logging.getLogger(__name__)
@@ -187,6 +187,7 @@ class MetadataModel(object):
     # TODO: abstract validation in its own module
     def validateModelManifest(
         self, manifestPath: str, rootNode: str, restrict_rules: bool = False, jsonSchema: str = None, project_scope: List = None,
+        n_workers: int = 1, chunksize: int = None,
     ) -> List[str]:
         """Check if provided annotations manifest dataframe satisfies all model requirements.
 
@@ -194,6 +195,8 @@ class MetadataModel(object):
             rootNode: a schema node label (i.e. term).
             manifestPath: a path to the manifest csv file containing annotations.
             restrict_rules: bypass great expectations and restrict rule options to those implemented in house
+            n_workers: number of processes validating columns (and rows) in parallel; validation runs in this process if 1.
+            chunksize: if given, the manifest is read and validated in chunks of this many rows, see validateModelManifestChunks.
 
         Returns:
             A validation status message; if there is an error the message.
@@ -202,6 +205,22 @@ class MetadataModel(object):
         Raises:
             ValueError: rootNode not found in metadata model.
         """
+        errors = []
+        warnings = []
+
+        if chunksize:
+            if not restrict_rules:
+                logging.warning(
+                    "Great Expectations cannot validate a manifest in chunks; rules are validated in house."
+                )
+            for chunk_errors, chunk_warnings in self.validateModelManifestChunks(
+                manifestPath, rootNode, chunksize, jsonSchema, project_scope, n_workers,
+            ):
+                errors.extend(chunk_errors)
+                warnings.extend(chunk_warnings)
+
+            return errors, warnings
+
         # get validation schema for a given node in the data model, if the user has not provided input validation schema
         
         if not jsonSchema:
@@ -209,9 +228,6 @@ class MetadataModel(object):
                 rootNode, rootNode + "_validation"
             )
 
-        errors = []
-        warnings = []
-
         load_args={
             "dtype":"string",
             }
@@ -222,6 +238,59 @@ class MetadataModel(object):
 
         # handler for mismatched components/data types
         # throw TypeError if the value(s) in the "Component" column differ from the selected template type
+        component_errors = self._get_component_errors(manifest, rootNode)
+        if component_errors:
+            errors.extend(component_errors)
+            return errors, warnings
+
+        errors, warnings, manifest = validate_all(self, errors, warnings, manifest, manifestPath, self.sg, jsonSchema, restrict_rules, project_scope, rootNode, n_workers)
+        return errors, warnings
+
+    def validateModelManifestChunks(
+        self, manifestPath: str, rootNode: str, chunksize: int, jsonSchema: str = None, project_scope: List = None,
+        n_workers: int = 1,
+    ) -> Iterator[Tuple[List, List]]:
+        """Check if provided annotations manifest satisfies all model requirements, reading and validating it in
+        chunks of rows, so that memory use does not grow with the size of the manifest.
+
+        Rules are validated in house (i.e. as with restrict_rules). The errors and warnings of each chunk are given as
+        soon as the chunk is validated; those of rules depending on all the values of a column (e.g. unique) are
+        given once all chunks are validated. If the 'Component' column of a chunk does not match rootNode, only
+        such errors are given from then on.
+
+        Args:
+            manifestPath: a path to the manifest csv file containing annotations.
+            rootNode: a schema node label (i.e. term).
+            chunksize: number of rows of the manifest read at once.
+            n_workers: number of processes validating each chunk in parallel; validation runs in this process if 1.
+
+        Returns:
+            An iterator over the errors and warnings of each chunk, and finally of the rules depending on all rows.
+        """
+        if not jsonSchema:
+            jsonSchema = self.sg.get_json_schema_requirements(
+                rootNode, rootNode + "_validation"
+            )
+
+        component_mismatch = False
+
+        # the worker processes are shared by all chunks
+        with ChunkedManifestValidation(manifestPath, self.sg, jsonSchema, rootNode, n_workers) as chunked_validation:
+            for manifest in load_df_chunks(manifestPath, chunksize, preserve_raw_input=False, dtype="string"):
+                component_errors = self._get_component_errors(manifest, rootNode)
+                if component_errors or component_mismatch:
+                    component_mismatch = True
+                    yield component_errors, []
+                else:
+                    yield chunked_validation.validate_chunk(manifest, project_scope)
+
+        if not component_mismatch:
+            yield chunked_validation.validate_cross_row_rules(project_scope)
+
+    def _get_component_errors(self, manifest: pd.DataFrame, rootNode: str) -> List[List]:
+        """Get the errors of the rows of the manifest whose 'Component' value is not rootNode."""
+        errors = []
+
         if ("Component" in manifest.columns) and (
             (len(manifest["Component"].unique()) > 1)
             or (manifest["Component"].unique()[0] != rootNode)
@@ -231,12 +300,8 @@ class MetadataModel(object):
                 f"selected template type '{rootNode}'."
             )
 
-            # row indexes for all rows where 'Component' is rootNode
-            row_idxs = manifest.index[manifest["Component"] != rootNode].tolist()
-            # column index value for the 'Component' column
-            col_idx = manifest.columns.get_loc("Component")
-            # Series with index and 'Component' values from manifest
-            mismatched_ser = manifest.iloc[row_idxs, col_idx]
+            # Series with index and 'Component' values from manifest, for all rows where 'Component' is not rootNode
+            mismatched_ser = manifest.loc[manifest["Component"] != rootNode, "Component"]
             for index, component in mismatched_ser.items():
                 errors.append(
                     [
@@ -249,10 +314,7 @@ class MetadataModel(object):
                     ]
                 )
 
-            return errors, warnings
-
-        errors, warnings, manifest = validate_all(self, errors, warnings, manifest, manifestPath, self.sg, jsonSchema, restrict_rules, project_scope)
-        return errors, warnings
+        return errors
 
     def populateModelManifest(self, title, manifestPath: str, rootNode: str) -> str:
         """Populate an existing annotations manifest based on a dataframe.
@@ -1,19 +1,23 @@
 import builtins
+from functools import lru_cache
+import itertools
 from jsonschema import ValidationError
 import logging
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import infer_dtype
 import re
 import sys
 from os import getenv
 
 # allows specifying explicit variable types
-from typing import Any, Dict, Optional, Text, List
+from typing import Any, Dict, Optional, Pattern, Text, List, Tuple
 from urllib.parse import urlparse
 from urllib.request import urlopen, OpenerDirector, HTTPDefaultErrorHandler
 from urllib.request import Request
 from urllib import error
+from warnings import catch_warnings, simplefilter
 
 from schematic.store.synapse import SynapseStorage
 from schematic.store.base import BaseStorage
@@ -25,6 +29,90 @@ from schematic.utils.validate_utils import parse_str_series_to_list
 
 logger = logging.getLogger(__name__)
 
+# ages, in days, that protectAges does not censor: 18 to 90 years
+MIN_AGE = 6550
+MAX_AGE = 32849
+
+@lru_cache(maxsize=None)
+def _compile_regex_rule(val_rule: str, attribute_name: str) -> Tuple[str, str, Pattern]:
+    """Parse a 'regex module regular_expression' validation rule, and compile its regular expression once.
+
+    Returns:
+        The name of the re module function, the regular expression, and the compiled pattern.
+    """
+    reg_exp_rules = val_rule.split(" ")
+
+    try:
+        getattr(re, reg_exp_rules[1])
+        reg_expression = reg_exp_rules[2]
+    except:
+        raise ValidationError(
+            f"The regex rules were not provided properly for attribute {attribute_name}."
+            f" They should be provided as follows ['regex', 'module name', 'regular expression']"
+        )
+
+    return reg_exp_rules[1], reg_expression, re.compile(reg_expression)
+
+
+def _match_regex_column(values: pd.Series, module_name: str, reg_pattern: Pattern) -> np.ndarray:
+    """Check which of the (str) values of a column re.<module_name>(pattern, value) finds a match in."""
+    # the pandas string methods for the re functions they are equivalent to
+    if module_name == "match":
+        matches = values.str.match(reg_pattern)
+    elif module_name == "fullmatch":
+        matches = values.str.fullmatch(reg_pattern)
+    elif module_name == "search":
+        with catch_warnings():
+            # pandas warns that the groups of patterns with groups are not extracted
+            simplefilter("ignore", UserWarning)
+            matches = values.str.contains(reg_pattern, regex=True)
+    else:
+        matches = values.map(lambda value: bool(getattr(reg_pattern, module_name)(value)))
+
+    return matches.to_numpy(dtype=bool)
+
+
+def _get_regex_mismatches(values: pd.Series, module_name: str, reg_pattern: Pattern) -> np.ndarray:
+    """Check which of the (str) values of a column are not empty and do not match a regex rule.
+
+    Manifest columns repeat values, so each distinct value is only matched once.
+    """
+    codes, unique_values = pd.factorize(values)
+    unique_values = pd.Series(unique_values, dtype=object)
+
+    unique_mismatches = ~_match_regex_column(unique_values, module_name, reg_pattern) & (
+        unique_values.str.len() > 0
+    ).to_numpy()
+
+    return unique_mismatches[codes]
+
+
+def get_rule_message_level(val_rule: str, required: bool) -> Optional[str]:
+    """Get the level of the messages of a content rule: "error", "warning", or None when no message is raised.
+
+    Args:
+        val_rule: the rule, as in the data model.
+        required: whether the attribute the rule is of is required; recommended rules raise no message then.
+    """
+    rule_parts = val_rule.split(" ")
+
+    if val_rule.startswith('recommended') and required:
+        level = None
+
+    #if not required, use the message level specified in the rule
+    elif rule_parts[-1].lower() == 'error':
+        level = 'error'
+
+    elif rule_parts[-1].lower() == 'warning':
+        level = 'warning'
+
+    #if no level specified, the default level is warning
+    else:
+        level = 'warning'
+
+    return level
+
+
 class GenerateError:
     def generate_schema_error(row_num: str, attribute_name: str, error_msg: str)-> List[str]:
         '''
@@ -349,24 +437,10 @@ class GenerateError:
         """
 
         
-        rule_parts = val_rule.split(" ")
-        
         #See if the node is required, if it is and the column is missing then a requirement error will be raised later; no error or waring logged here if recommended and required but missing        
-        if val_rule.startswith('recommended') and sg.is_node_required(node_display_name=attribute_name):
-            level = None
-        
-        #if not required, use the message level specified in the rule
-        elif rule_parts[-1].lower() == 'error':
-            level = 'error'
+        required = val_rule.startswith('recommended') and sg.is_node_required(node_display_name=attribute_name)
 
-        elif rule_parts[-1].lower() == 'warning':
-            level = 'warning'
-        
-        #if no level specified, the default level is warning
-        else:
-            level = 'warning'
-
-        return level
+        return get_rule_message_level(val_rule, required)
 
 class ValidateAttribute(object):
     """
@@ -376,6 +450,7 @@ class ValidateAttribute(object):
         type_validation
         url_validation
         cross_validation
+        content_validation
         get_target_manifests - helper function
     See functions for more details.
     TODO:
@@ -447,10 +522,10 @@ class ValidateAttribute(object):
                     errors.append(
                         GenerateError.generate_list_error(
                             list_string,
-                            row_num=str(i + 2),
+                            row_num=str(manifest_col.index[i] + 2),
                             attribute_name=manifest_col.name,
                             list_error=list_error,
-                            invalid_entry=manifest_col[i]
+                            invalid_entry=list_string
                         )
                     )
                 
@@ -487,60 +562,47 @@ class ValidateAttribute(object):
             move validation to convert step.
         """
 
-        reg_exp_rules = val_rule.split(" ")
-
-        try:
-            module_to_call = getattr(re, reg_exp_rules[1])
-            reg_expression = reg_exp_rules[2]
-        except:
-            raise ValidationError(
-                f"The regex rules were not provided properly for attribute {manifest_col.name}."
-                f" They should be provided as follows ['regex', 'module name', 'regular expression']"
-            )
+        module_name, reg_expression, reg_pattern = _compile_regex_rule(val_rule, manifest_col.name)
 
         errors = []
         warnings = []
-        validation_rules=self.sg.se.get_class_validation_rules(self.sg.se.get_class_label_from_display_name(manifest_col.name))
         # Handle case where validating re's within a list.
-        if re.search('list',"|".join(validation_rules)):
-            if type(manifest_col[0]) == str:
-                # Convert string to list.
-                manifest_col = parse_str_series_to_list(manifest_col)
-
-            for i, row_values in enumerate(manifest_col):
-                for j, re_to_check in enumerate(row_values):
-                    re_to_check = str(re_to_check)
-                    if not bool(module_to_call(reg_expression, re_to_check)) and bool(
-                        re_to_check
-                    ):
-                        errors.append(
-                            GenerateError.generate_regex_error(
-                                val_rule,
-                                reg_expression,
-                                row_num=str(i + 2),
-                                module_to_call=reg_exp_rules[1],
-                                attribute_name=manifest_col.name,
-                                invalid_entry=manifest_col[i]
-                            )
-                        )
+        if self.validation_plan.get_column(manifest_col.name).is_list:
+            if len(manifest_col) and type(manifest_col.iloc[0]) == str:
+                # Convert string to list, as parse_str_series_to_list does, once per distinct string
+                row_codes, unique_rows = pd.factorize(manifest_col.astype(str))
+                unique_lists = [[s.strip() for s in row.split(",")] for row in unique_rows]
+                row_values = [unique_lists[code] for code in row_codes]
+            else:
+                row_values = manifest_col.to_numpy()
+
+            # one entry per list element, with the position of the row it is in
+            row_positions = np.repeat(
+                np.arange(len(row_values)), [len(values) for values in row_values]
+            )
+            values_to_check = pd.Series(
+                list(itertools.chain.from_iterable(row_values)), dtype=object
+            ).astype(str)
 
         # Validating single re's
         else:
-            manifest_col = manifest_col.astype(str)
-            for i, re_to_check in enumerate(manifest_col):
-                if not bool(module_to_call(reg_expression, re_to_check)) and bool(
-                    re_to_check
-                ):
-                    errors.append(
-                        GenerateError.generate_regex_error(
-                            val_rule,
-                            reg_expression,
-                            row_num=str(i + 2),
-                            module_to_call=reg_exp_rules[1],
-                            attribute_name=manifest_col.name,
-                            invalid_entry=manifest_col[i]
-                        )
-                    )
+            row_values = manifest_col.astype(str).to_numpy()
+            row_positions = np.arange(len(row_values))
+            values_to_check = pd.Series(row_values, dtype=object)
+
+        invalid_mask = _get_regex_mismatches(values_to_check, module_name, reg_pattern)
+
+        for i in row_positions[invalid_mask]:
+            errors.append(
+                GenerateError.generate_regex_error(
+                    val_rule,
+                    reg_expression,
+                    row_num=str(manifest_col.index[i] + 2),
+                    module_to_call=module_name,
+                    attribute_name=manifest_col.name,
+                    invalid_entry=row_values[i]
+                )
+            )
 
         return errors, warnings
 
@@ -573,29 +635,44 @@ class ValidateAttribute(object):
 
         errors = []
         warnings = []
-        # num indicates either a float or int.
-        if val_rule == "num":
-            for i, value in enumerate(manifest_col):
-                if bool(value) and not isinstance(value, specified_type[val_rule]):
-                    errors.append(
-                        GenerateError.generate_type_error(
-                            val_rule,
-                            row_num=str(i + 2),
-                            attribute_name=manifest_col.name,
-                            invalid_entry=str(manifest_col[i])
-                        )
-                    )
-        elif val_rule in ["int", "float", "str"]:
-            for i, value in enumerate(manifest_col):
-                if bool(value) and not isinstance(value, specified_type[val_rule]):
-                    errors.append(
-                        GenerateError.generate_type_error(
-                            val_rule,
-                            row_num=str(i + 2),
-                            attribute_name=manifest_col.name,
-                            invalid_entry=str(manifest_col[i])
-                        )
+        if val_rule not in specified_type:
+            return errors, warnings
+
+        # classify the column by the (few) distinct types of its values, instead of checking every value;
+        # values of a numeric dtype are all checked as the python scalar type of the dtype (e.g. int for int64)
+        if manifest_col.dtype.kind in "biuf":
+            values = manifest_col.to_numpy()
+            value_type = type(manifest_col.dtype.type(0).item())
+            invalid_mask = np.full(
+                len(values), not issubclass(value_type, specified_type[val_rule])
+            )
+        elif val_rule == "str" and infer_dtype(manifest_col, skipna=False) == "string":
+            values = manifest_col.to_numpy()
+            invalid_mask = np.zeros(len(values), dtype=bool)
+        else:
+            # the values, as iterating over the column gives them
+            values = manifest_col.to_numpy() if manifest_col.dtype == object else list(manifest_col)
+            value_types = list(map(type, values))
+            invalid_types = {
+                value_type
+                for value_type in set(value_types)
+                if not issubclass(value_type, specified_type[val_rule])
+            }
+            invalid_mask = np.fromiter(
+                map(invalid_types.__contains__, value_types), dtype=bool, count=len(values)
+            )
+
+        # empty values are not checked; only evaluated for values of the wrong type
+        for i in np.flatnonzero(invalid_mask):
+            if bool(values[i]):
+                errors.append(
+                    GenerateError.generate_type_error(
+                        val_rule,
+                        row_num=str(manifest_col.index[i] + 2),
+                        attribute_name=manifest_col.name,
+                        invalid_entry=str(values[i])
                     )
+                )
         return errors, warnings
 
     def url_validation(self, val_rule: str, manifest_col: str) -> (List[List[str]], List[List[str]]):
@@ -634,10 +711,10 @@ class ValidateAttribute(object):
                     GenerateError.generate_url_error(
                         url,
                         url_error=url_error,
-                        row_num=str(i + 2),
+                        row_num=str(manifest_col.index[i] + 2),
                         attribute_name=manifest_col.name,
                         argument=url_args,
-                        invalid_entry=manifest_col[i]
+                        invalid_entry=manifest_col.iloc[i]
                     )
                 )
             else:
@@ -658,10 +735,10 @@ class ValidateAttribute(object):
                         GenerateError.generate_url_error(
                             url,
                             url_error=url_error,
-                            row_num=str(i + 2),
+                            row_num=str(manifest_col.index[i] + 2),
                             attribute_name=manifest_col.name,
                             argument=url_args,
-                            invalid_entry=manifest_col[i]
+                            invalid_entry=manifest_col.iloc[i]
                         )
                     )
                 if valid_url == True:
@@ -674,10 +751,10 @@ class ValidateAttribute(object):
                                 GenerateError.generate_url_error(
                                     url,
                                     url_error=url_error,
-                                    row_num=str(i + 2),
+                                    row_num=str(manifest_col.index[i] + 2),
                                     attribute_name=manifest_col.name,
                                     argument=arg,
-                                    invalid_entry=manifest_col[i]
+                                    invalid_entry=manifest_col.iloc[i]
                                 )
                             )
         return errors, warnings
@@ -819,4 +896,71 @@ class ValidateAttribute(object):
 
         return errors, warnings
 
+    def content_validation(
+        self, val_rule: str, manifest_col: pd.core.series.Series
+    ) -> (List[List[str]], List[List[str]]):
+        """
+        Purpose:
+            Validate the content of a manifest attribute as a whole, as the Great Expectations
+            expectation of the rule does, so that it can be validated without Great Expectations:
+                - unique: values are unique.
+                - recommended: the column has a value that is not empty.
+                - protectAges: ages are between 18 and 90 years, in days.
+                - inRange: numbers are between the two arguments of the rule.
+            Missing values are not checked. Values compared to bounds are only checked if they are
+            numbers: Great Expectations fails on strings, and type rules report them.
+        Input:
+            - val_rule: str, Validation rule
+            - manifest_col: pd.core.series.Series, column for a given
+                attribute in the manifest
+        Returns:
+            - The error or warning of GenerateError.generate_content_error, if the content is
+            not valid; all rows that are not valid are in a single message.
+        """
+        errors = []
+        warnings = []
+
+        rule_parts = val_rule.split(" ")
+        values = manifest_col[manifest_col.notna()]
+
+        if rule_parts[0] == "recommended":
+            # values matching '^$', as in expect_column_values_to_not_match_regex_list
+            if len(values) == 0 or not values.astype(str).str.contains("^$").all():
+                return errors, warnings
+            invalid_values = values
+
+        elif rule_parts[0] == "unique":
+            invalid_values = values[values.duplicated(keep=False)]
 
+        elif rule_parts[0] in ("protectAges", "inRange"):
+            if rule_parts[0] == "protectAges":
+                min_value, max_value = MIN_AGE, MAX_AGE
+            else:
+                min_value, max_value = float(rule_parts[1]), float(rule_parts[2])
+
+            if values.dtype.kind not in "biuf":
+                values = pd.to_numeric(
+                    values[~values.map(lambda value: isinstance(value, str))], errors="coerce"
+                ).dropna()
+            # values, as entered, rather than as compared
+            invalid_values = manifest_col[values.index[~((min_value <= values) & (values <= max_value))]]
+
+        else:
+            return errors, warnings
+
+        if invalid_values.empty:
+            return errors, warnings
+
+        content_error, content_warning = GenerateError.generate_content_error(
+            val_rule=val_rule,
+            attribute_name=manifest_col.name,
+            sg=self.sg,
+            row_num=list(invalid_values.index.to_numpy() + 2),
+            error_val=invalid_values.tolist(),
+        )
+        if content_error:
+            errors.append(content_error)
+        elif content_warning:
+            warnings.append(content_warning)
+
+        return errors, warnings
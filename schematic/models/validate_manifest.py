@@ -1,4 +1,7 @@
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import repeat
 from statistics import mode
 from tabnanny import check
 from jsonschema import Draft7Validator, exceptions, ValidationError
@@ -7,6 +10,7 @@ import logging
 import numpy as np
 import os
 import pandas as pd
+from pandas.api.types import infer_dtype
 import re
 import sys
 
@@ -21,18 +25,27 @@ from schematic.models.validate_attribute import ValidateAttribute, GenerateError
 from schematic.schemas.generator import SchemaGenerator
 from schematic.store.synapse import SynapseStorage
 from schematic.models.GE_Helpers import GreatExpectationsHelpers
-from schematic.utils.validate_rules_utils import validation_rule_info
-from schematic.utils.validate_utils import rule_in_rule_list
+from schematic.models.json_schema_checks import compile_validity_check, get_valid_rows, UndecidedInstance
+from schematic.models.validation_plan import ValidationPlan, get_validation_plan, UNIMPLEMENTED_EXPECTATIONS
 
 logger = logging.getLogger(__name__)
 
 class ValidateManifest(object):
-    def __init__(self, errors, manifest, manifestPath, sg, jsonSchema):
+    def __init__(self, errors, manifest, manifestPath, sg, jsonSchema, validation_plan: ValidationPlan = None):
         self.errors = errors
         self.manifest = manifest
         self.manifestPath = manifestPath
         self.sg = sg
-        self.jsonSchema = jsonSchema       
+        self.jsonSchema = jsonSchema
+        self._validation_plan = validation_plan
+
+    @property
+    def validation_plan(self) -> ValidationPlan:
+        """Parsed validation rules of the manifest columns; the plan of the data model is used if none was given."""
+        if self._validation_plan is None:
+            self._validation_plan = get_validation_plan(self.sg)
+
+        return self._validation_plan
 
     def get_multiple_types_error(
         self, validation_rules: list, attribute_name: str, error_type: str
@@ -62,6 +75,7 @@ class ValidateManifest(object):
 
     def validate_manifest_rules(
         self, manifest: pd.core.frame.DataFrame, sg: SchemaGenerator, restrict_rules: bool, project_scope: List,
+        n_workers: int = 1, skip_cross_row_rules: bool = False, executor: ProcessPoolExecutor = None,
     ) -> (pd.core.frame.DataFrame, List[List[str]]):
         """
         Purpose:
@@ -73,6 +87,15 @@ class ValidateManifest(object):
                 contains metadata input from user for each attribute.
             sg: SchemaGenerator
                 initialized within models/metadata.py
+            n_workers: int
+                number of processes validating columns in parallel;
+                columns are validated in this process if 1.
+            skip_cross_row_rules: bool
+                skip the in-house rules that depend on all the values of
+                a column, when the manifest is a chunk of rows.
+            executor: ProcessPoolExecutor
+                pool of n_workers processes, made by create_worker_pool, to
+                validate columns in; one is made for the call if None.
         Returns:
             manifest: pd.core.frame.DataFrame
                 If a 'list' validatior is run, the manifest needs to be 
@@ -89,36 +112,10 @@ class ValidateManifest(object):
                 generation script.
         """
 
-        # for each type of rule that can be spefified (key) point
-        # to the type of validation that will be run.
-
-        validation_types = validation_rule_info()
-
-        type_dict={
-            "float64": float,
-            "int64": int,
-            "str": str,
-        }
-
-        unimplemented_expectations=[
-            "url",
-            "list",
-            "regex.*",
-            "matchAtLeastOne.*",
-            "matchExactlyOne.*",
-            ]
-
-        in_house_rules = [
-            "int",
-            "float",
-            "num",
-            "str",
-            "regex.*",
-            "url",
-            "list",
-            "matchAtLeastOne.*",
-            "matchExactlyOne.*",
-        ]
+        # validation rules of each column, parsed and routed to GE or
+        # in-house validation once per data model and component.
+        validation_plan = self.validation_plan
+        validation_types = validation_plan.rule_info
 
         # initialize error and warning handling lists.
         errors = []   
@@ -128,9 +125,10 @@ class ValidateManifest(object):
             #operations necessary to set up and run ge suite validation
             ge_helpers=GreatExpectationsHelpers(
                 sg=sg,
-                unimplemented_expectations=unimplemented_expectations,
+                unimplemented_expectations=UNIMPLEMENTED_EXPECTATIONS,
                 manifest = manifest,
                 manifestPath = self.manifestPath,
+                component = validation_plan.component,
                 )
 
             ge_helpers.build_context()
@@ -138,16 +136,7 @@ class ValidateManifest(object):
             ge_helpers.build_checkpoint()
 
         #run GE validation
-            results = ge_helpers.context.run_checkpoint(
-                checkpoint_name="manifest_checkpoint",
-                batch_request={
-                    "runtime_parameters": {"batch_data": manifest},
-                    "batch_identifiers": {
-                        "default_identifier_name": "manifestID"
-                    },
-                },
-                result_format={'result_format': 'COMPLETE'},
-            )        
+            results = ge_helpers.run_checkpoint()
         
             #print(results)       
             #results.list_validation_results()
@@ -165,11 +154,38 @@ class ValidateManifest(object):
             logging.info("Great Expetations suite will not be utilized.")  
 
 
-        regex_re=re.compile('regex.*')
+        # columns with rules validated in house, and the other columns
+        in_house_columns = [
+            col
+            for col in manifest.columns
+            if any(
+                validation_rule.is_validated_in_house(restrict_rules)
+                for validation_rule in validation_plan.get_column(col).rules
+            )
+        ]
+
+        if n_workers > 1 and len(in_house_columns) > 1:
+            # each process validates whole columns, as rules of a column run in order on the column
+            # the previous rule (e.g. list) returned; results are merged in column order
+            with _use_worker_pool(executor, self.manifestPath, self.sg, validation_plan, n_workers) as executor:
+                column_results = dict(
+                    zip(
+                        in_house_columns,
+                        executor.map(
+                            _validate_column_in_worker,
+                            [manifest[col] for col in in_house_columns],
+                            repeat(restrict_rules),
+                            repeat(project_scope),
+                            repeat(skip_cross_row_rules),
+                        ),
+                    )
+                )
+        else:
+            column_results = {}
+
         for col in manifest.columns:
-            # remove trailing/leading whitespaces from manifest
-            manifest.applymap(lambda x: x.strip() if isinstance(x, str) else x)
-            validation_rules = sg.get_node_validation_rules(col)
+            column_plan = validation_plan.get_column(col)
+            validation_rules = [validation_rule.rule for validation_rule in column_plan.rules]
 
             # Check that attribute rules conform to limits:
             # no more than two rules for an attribute. 
@@ -181,43 +197,92 @@ class ValidateManifest(object):
                     )
                 )
 
-            # Given a validation rule, run validation. Skip validations already performed by GE
-            for rule in validation_rules:
-                validation_type = rule.split(" ")[0]
-                if rule_in_rule_list(rule,unimplemented_expectations) or (rule_in_rule_list(rule,in_house_rules) and restrict_rules):
-                    if not rule_in_rule_list(rule,in_house_rules):
-                        logging.warning(f"Validation rule {rule.split(' ')[0]} has not been implemented in house and cannnot be validated without Great Expectations.")
-                        continue  
-
-                    #Validate for each individual validation rule.
-                    validation_method = getattr(
-                            ValidateAttribute, validation_types[validation_type]['type']
-                        )
-
-                    if validation_type == "list":
-                        vr_errors, vr_warnings, manifest_col = validation_method(
-                            self, rule, manifest[col]
-                        )
-                        manifest[col] = manifest_col
-                    elif validation_type.lower().startswith("match"):
-                        vr_errors, vr_warnings = validation_method(
-                            self, rule, manifest[col], project_scope,
-                        )
-                    else:
-                        vr_errors, vr_warnings = validation_method(
-                            self, rule, manifest[col]
-                        )
-                    # Check for validation rule errors and add them to other errors.
-                    if vr_errors:
-                        errors.extend(vr_errors)
-                    if vr_warnings:
-                        warnings.extend(vr_warnings)
+            if col in column_results:
+                vr_errors, vr_warnings, manifest_col = column_results[col]
+            else:
+                vr_errors, vr_warnings, manifest_col = self.validate_column_rules(
+                    manifest[col], restrict_rules, project_scope, skip_cross_row_rules
+                )
+
+            # the list rule splits the values of the column into lists
+            if column_plan.is_list:
+                manifest[col] = manifest_col
+            errors.extend(vr_errors)
+            warnings.extend(vr_warnings)
 
         return manifest, errors, warnings
 
-    def validate_manifest_values(self, manifest, jsonSchema
+    def validate_column_rules(
+        self, manifest_col: pd.Series, restrict_rules: bool, project_scope: List, skip_cross_row_rules: bool = False,
+    ) -> (List[List[str]], List[List[str]], pd.Series):
+        """Validate a manifest column against the rules of its attribute that are validated in house.
+
+        Args:
+            manifest_col: Column of the manifest, named after the attribute.
+            restrict_rules: True if Great Expectations is not used.
+            project_scope: Projects to search through for cross manifest validation.
+            skip_cross_row_rules: True if the column is a chunk of rows of the manifest column; rules that depend on
+                all its values are then skipped, see ChunkedManifestValidation.
+
+        Returns:
+            The errors and warnings of the rules, and the column, with its values split into lists if it has a list
+            rule.
+        """
+        errors = []
+        warnings = []
+
+        # Given a validation rule, run validation. Skip validations already performed by GE
+        for validation_rule in self.validation_plan.get_column(manifest_col.name).rules:
+            rule = validation_rule.rule
+            validation_type = validation_rule.rule_type
+            if skip_cross_row_rules and validation_rule.cross_row:
+                continue
+            if validation_rule.is_validated_in_house(restrict_rules):
+                if not validation_rule.in_house:
+                    logging.warning(f"Validation rule {validation_type} has not been implemented in house and cannnot be validated without Great Expectations.")
+                    continue  
+
+                #Validate for each individual validation rule.
+                validation_method = getattr(
+                        ValidateAttribute, validation_rule.method
+                    )
+
+                if validation_type == "list":
+                    vr_errors, vr_warnings, manifest_col = validation_method(
+                        self, rule, manifest_col
+                    )
+                elif validation_type.lower().startswith("match"):
+                    vr_errors, vr_warnings = validation_method(
+                        self, rule, manifest_col, project_scope,
+                    )
+                else:
+                    vr_errors, vr_warnings = validation_method(
+                        self, rule, manifest_col
+                    )
+                # Check for validation rule errors and add them to other errors.
+                if vr_errors:
+                    errors.extend(vr_errors)
+                if vr_warnings:
+                    warnings.extend(vr_warnings)
+
+        return errors, warnings, manifest_col
+
+    def validate_manifest_values(self, manifest, jsonSchema, n_workers: int = 1, executor: ProcessPoolExecutor = None,
     ) -> (List[List[str]], List[List[str]]):
-        
+        """Validate each row of the manifest against the JSON schema of its component.
+
+        Args:
+            manifest: Manifest to validate.
+            jsonSchema: JSON schema of the component.
+            n_workers: Number of processes validating batches of rows in parallel; rows are validated in this process
+                if 1.
+            executor: Pool of n_workers processes, made by create_worker_pool, to validate rows in; one is made for
+                the call if None.
+
+        Returns:
+            The [error_row, error_col, error_message, error_val] records of the errors, in row order, and the
+            warnings.
+        """
         errors = []
         warnings = []
         col_attr = {} # save the mapping between column index and attribute name
@@ -225,20 +290,38 @@ class ValidateManifest(object):
         # numerical values need to be type string for the jsonValidator
         for col in manifest.select_dtypes(include=[int, np.int64, float, np.float64]).columns:
             manifest[col]=manifest[col].astype('string')
-        manifest = manifest.applymap(lambda x: str(x) if isinstance(x, (int, np.int64, float, np.float64)) else x, na_action='ignore')
-
-        annotations = json.loads(manifest.to_json(orient="records"))
-        for i, annotation in enumerate(annotations):
-            v = Draft7Validator(jsonSchema)
-            for error in sorted(v.iter_errors(annotation), key=exceptions.relevance):
-                errorRow = i + 2
-                errorCol = error.path[-1] if len(error.path) > 0 else "Wrong schema"
-                errorColName = error.path[0] if len(error.path) > 0 else "Wrong schema"
-                errorMsg = error.message[0:500]
-                errorVal = error.instance if len(error.path) > 0 else "Wrong schema"
-
-                errors.append([errorRow, errorCol, errorMsg, errorVal])
-                col_attr[errorCol] = errorColName
+        for col in manifest.columns[manifest.dtypes == object]:
+            if infer_dtype(manifest[col], skipna=True) not in ("string", "empty"):
+                manifest[col] = manifest[col].map(lambda x: str(x) if isinstance(x, (int, np.int64, float, np.float64)) else x, na_action='ignore')
+
+        # rows the JSON schema is checked on column by column are only validated row by row if they are not valid
+        valid_rows = get_valid_rows(jsonSchema, manifest)
+        if valid_rows is None:
+            row_positions = np.arange(len(manifest))
+        else:
+            row_positions = np.flatnonzero(~valid_rows)
+
+        annotations = _get_manifest_instances(manifest.iloc[row_positions])
+        row_numbers = (manifest.index.to_numpy()[row_positions] + 2).tolist()
+
+        if n_workers > 1 and len(annotations) > 1:
+            # a few batches per process, so that processes finishing early pick up more work
+            batch_size = -(-len(annotations) // (n_workers * 4))
+            starts = range(0, len(annotations), batch_size)
+            with _use_worker_pool(executor, self.manifestPath, self.sg, self.validation_plan, n_workers) as executor:
+                batch_errors = executor.map(
+                    _validate_instances,
+                    repeat(jsonSchema),
+                    [annotations[start:start + batch_size] for start in starts],
+                    [row_numbers[start:start + batch_size] for start in starts],
+                )
+                row_errors = [error for batch in batch_errors for error in batch]
+        else:
+            row_errors = _validate_instances(jsonSchema, annotations, row_numbers)
+
+        for errorRow, errorCol, errorColName, errorMsg, errorVal in row_errors:
+            errors.append([errorRow, errorCol, errorMsg, errorVal])
+            col_attr[errorCol] = errorColName
         if errors: 
             for error in errors: 
                 row_num = error[0]
@@ -250,18 +333,294 @@ class ValidateManifest(object):
         return errors, warnings
 
 
-def validate_all(self, errors, warnings, manifest, manifestPath, sg, jsonSchema, restrict_rules, project_scope: List):
-    vm = ValidateManifest(errors, manifest, manifestPath, sg, jsonSchema)
-    manifest, vmr_errors, vmr_warnings = vm.validate_manifest_rules(manifest, sg, restrict_rules, project_scope)
+def create_worker_pool(
+    manifestPath: str, sg: SchemaGenerator, validation_plan: ValidationPlan, n_workers: int
+) -> ProcessPoolExecutor:
+    """Make a pool of processes validating the columns and rows of manifests validated against a validation plan, so
+    that the phases of a validation (and the chunks of a chunked validation) share the processes.
+    """
+    return ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_column_worker,
+        initargs=(manifestPath, sg, validation_plan),
+    )
+
+
+@contextmanager
+def _use_worker_pool(
+    executor: Optional[ProcessPoolExecutor], manifestPath: str, sg: SchemaGenerator, validation_plan: ValidationPlan,
+    n_workers: int,
+):
+    """Use the pool of processes of the validation, or one made for this phase only."""
+    if executor is not None:
+        yield executor
+        return
+
+    with create_worker_pool(manifestPath, sg, validation_plan, n_workers) as executor:
+        yield executor
+
+
+# validator of the columns sent to a worker process, sharing the data model and validation plan
+_column_validator = None
+
+
+def _init_column_worker(manifestPath: str, sg: SchemaGenerator, validation_plan: ValidationPlan) -> None:
+    global _column_validator
+    _column_validator = ValidateManifest([], None, manifestPath, sg, None, validation_plan)
+
+
+def _validate_column_in_worker(
+    manifest_col: pd.Series, restrict_rules: bool, project_scope: List, skip_cross_row_rules: bool
+) -> (List[List[str]], List[List[str]], pd.Series):
+    return _column_validator.validate_column_rules(manifest_col, restrict_rules, project_scope, skip_cross_row_rules)
+
+
+def _get_manifest_instances(manifest: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Get the rows of a manifest as JSON instances, as `json.loads(manifest.to_json(orient="records"))` would,
+    without serializing the manifest: missing values become None, and other values are kept as they are.
+    """
+    columns = [str(col) for col in manifest.columns]
+
+    column_values = []
+    for (_, manifest_col) in manifest.items():
+        values = manifest_col.to_numpy(dtype=object)
+        missing = manifest_col.isna().to_numpy()
+        if missing.any():
+            values = values.copy()
+            values[missing] = None
+        column_values.append(values)
+
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
+
+
+def _validate_instances(jsonSchema: Dict, instances: List[Dict[str, Any]], row_numbers: List[int]) -> List[tuple]:
+    """Validate manifest rows against a JSON schema, with a single validator, and report the errors of the rows
+    that are not valid with jsonschema.
+
+    Args:
+        jsonSchema: JSON schema of the component.
+        instances: Rows of the manifest, as JSON instances.
+        row_numbers: Row numbers of the instances in the manifest file (i.e. counting the header).
+
+    Returns:
+        The (error_row, error_col, attribute_name, error_message, error_val) of each error, in row order and by
+        relevance within a row.
+    """
+    validator = Draft7Validator(jsonSchema)
+    # most rows are valid; the compiled check skips them without building the errors jsonschema raises internally
+    is_valid = compile_validity_check(jsonSchema)
+
+    errors = []
+    for errorRow, instance in zip(row_numbers, instances):
+        if is_valid is not None:
+            try:
+                if is_valid(instance):
+                    continue
+            except UndecidedInstance:
+                pass
+
+        for error in sorted(validator.iter_errors(instance), key=exceptions.relevance):
+            errorCol = error.path[-1] if len(error.path) > 0 else "Wrong schema"
+            errorColName = error.path[0] if len(error.path) > 0 else "Wrong schema"
+            errorMsg = error.message[0:500]
+            errorVal = error.instance if len(error.path) > 0 else "Wrong schema"
+
+            errors.append((errorRow, errorCol, errorColName, errorMsg, errorVal))
+
+    return errors
+
+
+def validate_all(self, errors, warnings, manifest, manifestPath, sg, jsonSchema, restrict_rules, project_scope: List, rootNode: str = None, n_workers: int = 1):
+    validation_plan = get_validation_plan(sg, rootNode)
+    vm = ValidateManifest(errors, manifest, manifestPath, sg, jsonSchema, validation_plan)
+
+    # both phases share the worker processes
+    with (
+        create_worker_pool(manifestPath, sg, validation_plan, n_workers) if n_workers > 1 else nullcontext()
+    ) as executor:
+        manifest, vmr_errors, vmr_warnings = vm.validate_manifest_rules(
+            manifest, sg, restrict_rules, project_scope, n_workers, executor=executor,
+        )
+        vmv_errors, vmv_warnings = vm.validate_manifest_values(manifest, jsonSchema, n_workers, executor=executor)
+
     if vmr_errors:
         errors.extend(vmr_errors)
     if vmr_warnings:
         warnings.extend(vmr_warnings)
 
-    vmv_errors, vmv_warnings = vm.validate_manifest_values(manifest, jsonSchema)
     if vmv_errors:
         errors.extend(vmv_errors)
     if vmv_warnings:
         warnings.extend(vmv_warnings)
 
     return errors, warnings, manifest
+
+
+class ChunkedManifestValidation(object):
+    """Validation of a manifest chunk of rows by chunk of rows, so that the manifest does not have to fit in memory.
+
+    Rules are validated in house, as Great Expectations validates whole manifests; rules reporting all invalid rows of
+    a column in one message (e.g. inRange) give a message per chunk. Rules that depend on all the values of a column
+    (see CROSS_ROW_RULES) carry their state across chunks: the values seen by unique, whether a column recommended has
+    a value, and the columns of cross manifest rules. They are validated once all chunks were.
+
+    With n_workers, chunks are validated in a pool of processes made on the first chunk, and shut down by close (or
+    when exiting a 'with' statement).
+    """
+
+    def __init__(
+        self, manifestPath: str, sg: SchemaGenerator, jsonSchema: Dict, rootNode: str = None, n_workers: int = 1
+    ) -> None:
+        """
+        Args:
+            manifestPath: Path of the manifest.
+            sg: SchemaGenerator of the data model.
+            jsonSchema: JSON schema of the component.
+            rootNode: Component the manifest is validated against.
+            n_workers: Number of processes validating each chunk in parallel; chunks are validated in this process
+                if 1.
+        """
+        self.manifestPath = manifestPath
+        self.sg = sg
+        self.jsonSchema = jsonSchema
+        self.validation_plan = get_validation_plan(sg, rootNode)
+        self.n_workers = n_workers
+
+        # worker processes shared by all chunks
+        self._executor = None
+
+        # columns of the manifest, in order
+        self._columns = {}
+        # unique: first row of each value of a column, and the (row, value) of each duplicated value
+        self._first_rows = {}
+        self._duplicates = {}
+        # recommended: columns with values, and columns with a value that is not empty
+        self._columns_with_values = set()
+        self._filled_columns = set()
+        # cross manifest rules: chunks of the column, as the other rules of the column returned it
+        self._column_chunks = {}
+
+    def __enter__(self):
+        """Return the validation when entering 'with' statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shut down the worker processes when exiting 'with' statement."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes of the validation, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def validate_chunk(self, manifest: pd.DataFrame, project_scope: List) -> (List[List[str]], List[List[str]]):
+        """Validate a chunk of rows of the manifest, and add its values to the state of the rules that depend on all
+        the values of a column.
+
+        Args:
+            manifest: Chunk of rows of the manifest, indexed by their position in the manifest, as load_df_chunks
+                gives them.
+            project_scope: Projects to search through for cross manifest validation.
+
+        Returns:
+            The errors and warnings of the rows of the chunk.
+        """
+        for col in manifest.columns:
+            self._columns[col] = None
+            for validation_rule in self.validation_plan.get_column(col).rules:
+                if validation_rule.rule_type == "unique":
+                    self._add_unique_values(manifest[col])
+                elif validation_rule.rule_type == "recommended":
+                    self._add_recommended_values(manifest[col])
+
+        if self.n_workers > 1 and self._executor is None:
+            self._executor = create_worker_pool(self.manifestPath, self.sg, self.validation_plan, self.n_workers)
+
+        vm = ValidateManifest([], manifest, self.manifestPath, self.sg, self.jsonSchema, self.validation_plan)
+        manifest, errors, warnings = vm.validate_manifest_rules(
+            manifest, self.sg, True, project_scope, self.n_workers, skip_cross_row_rules=True, executor=self._executor,
+        )
+        vmv_errors, vmv_warnings = vm.validate_manifest_values(
+            manifest, self.jsonSchema, self.n_workers, executor=self._executor,
+        )
+        errors.extend(vmv_errors)
+        warnings.extend(vmv_warnings)
+
+        for col in manifest.columns:
+            if any(
+                validation_rule.rule_type.startswith("match")
+                for validation_rule in self.validation_plan.get_column(col).rules
+            ):
+                self._column_chunks.setdefault(col, []).append(manifest[col])
+
+        return errors, warnings
+
+    def validate_cross_row_rules(self, project_scope: List) -> (List[List[str]], List[List[str]]):
+        """Validate the rules that depend on all the values of a column, once all chunks were validated.
+
+        Args:
+            project_scope: Projects to search through for cross manifest validation.
+
+        Returns:
+            The errors and warnings of the rules, column by column.
+        """
+        errors = []
+        warnings = []
+
+        vm = ValidateManifest([], None, self.manifestPath, self.sg, self.jsonSchema, self.validation_plan)
+        for col in self._columns:
+            for validation_rule in self.validation_plan.get_column(col).rules:
+                rule = validation_rule.rule
+                if validation_rule.rule_type.startswith("match"):
+                    vr_errors, vr_warnings = ValidateAttribute.cross_validation(
+                        vm, rule, pd.concat(self._column_chunks[col]), project_scope,
+                    )
+                    errors.extend(vr_errors)
+                    warnings.extend(vr_warnings)
+                    continue
+
+                if validation_rule.rule_type == "unique" and self._duplicates.get(col):
+                    rows, values = zip(*sorted(self._duplicates[col], key=lambda duplicate: duplicate[0]))
+                    content_error, content_warning = GenerateError.generate_content_error(
+                        val_rule=rule, attribute_name=col, sg=self.sg, row_num=list(rows), error_val=list(values),
+                    )
+                elif (
+                    validation_rule.rule_type == "recommended"
+                    and col in self._columns_with_values
+                    and col not in self._filled_columns
+                ):
+                    content_error, content_warning = GenerateError.generate_content_error(
+                        val_rule=rule, attribute_name=col, sg=self.sg,
+                    )
+                else:
+                    continue
+
+                if content_error:
+                    errors.append(content_error)
+                elif content_warning:
+                    warnings.append(content_warning)
+
+        return errors, warnings
+
+    def _add_unique_values(self, manifest_col: pd.Series) -> None:
+        first_rows = self._first_rows.setdefault(manifest_col.name, {})
+        duplicates = self._duplicates.setdefault(manifest_col.name, [])
+
+        # missing values are not checked, as in Great Expectations
+        values = manifest_col[manifest_col.notna()]
+        for row, value in zip((values.index + 2).tolist(), values):
+            first_row = first_rows.setdefault(value, row)
+            if first_row != row:
+                if first_row is not None:
+                    # the first duplicate of the value; its first row is reported too
+                    duplicates.append((first_row, value))
+                    first_rows[value] = None
+                duplicates.append((row, value))
+
+    def _add_recommended_values(self, manifest_col: pd.Series) -> None:
+        values = manifest_col[manifest_col.notna()]
+        if len(values):
+            self._columns_with_values.add(manifest_col.name)
+        if (values != "").any():
+            self._filled_columns.add(manifest_col.name)
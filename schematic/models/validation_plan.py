@@ -0,0 +1,174 @@
+import logging
+from typing import NamedTuple, Optional, Tuple
+
+from schematic.models.validate_attribute import get_rule_message_level
+from schematic.schemas.generator import SchemaGenerator
+from schematic.utils.cache_utils import LRUCache
+from schematic.utils.validate_rules_utils import validation_rule_info
+from schematic.utils.validate_utils import rule_in_rule_list
+
+logger = logging.getLogger(__name__)
+
+# rules that Great Expectations has no expectation for; validated in house
+UNIMPLEMENTED_EXPECTATIONS = [
+    "url",
+    "list",
+    "regex.*",
+    "matchAtLeastOne.*",
+    "matchExactlyOne.*",
+]
+
+# rules implemented by ValidateAttribute
+IN_HOUSE_RULES = [
+    "int",
+    "float",
+    "num",
+    "str",
+    "regex.*",
+    "url",
+    "list",
+    "matchAtLeastOne.*",
+    "matchExactlyOne.*",
+    "recommended.*",
+    "protectAges.*",
+    "unique.*",
+    "inRange.*",
+]
+
+# rules that depend on all the values of a column, rather than on each value on its own
+CROSS_ROW_RULES = [
+    "unique.*",
+    "recommended.*",
+    "matchAtLeastOne.*",
+    "matchExactlyOne.*",
+]
+
+
+class ValidationRule(NamedTuple):
+    """A validation rule of an attribute, parsed once."""
+
+    # the rule, as in the data model (e.g. "regex search [a-f]")
+    rule: str
+    # the type of the rule (e.g. "regex"), and its arguments
+    rule_type: str
+    args: Tuple[str, ...]
+    # ValidateAttribute method validating rules of this type (e.g. "regex_validation"); None if the type is unknown
+    method: Optional[str]
+    # level of the messages of content rules: "error", "warning", or None when no message is raised
+    message_level: Optional[str]
+    # whether Great Expectations has an expectation for the rule, and whether ValidateAttribute implements it
+    great_expectations: bool
+    in_house: bool
+    # whether the rule depends on all the values of the column (e.g. unique), so that it cannot be validated on chunks
+    # of rows of a manifest independently
+    cross_row: bool
+
+    def is_validated_in_house(self, restrict_rules: bool) -> bool:
+        """Check if the rule is routed to the in-house validation, rather than to Great Expectations.
+
+        Args:
+            restrict_rules: True if Great Expectations is not used.
+        """
+        return not self.great_expectations or (self.in_house and restrict_rules)
+
+
+class ColumnPlan(NamedTuple):
+    """Validation rules of a manifest column."""
+
+    column: str
+    rules: Tuple[ValidationRule, ...]
+    # whether the values of the column are lists (i.e. it has a "list" rule)
+    is_list: bool
+
+
+class ValidationPlan(object):
+    """Validation rules of the columns of manifests, parsed once per data model and component.
+
+    Columns are compiled on first use, so that manifest columns that are not attributes of the component are
+    compiled too; the attributes of the component are compiled when the plan is built. Plans are not tied to a
+    manifest, and are shared by the validations of all manifests of a component; see get_validation_plan.
+    """
+
+    def __init__(self, sg: SchemaGenerator, component: str = None) -> None:
+        """
+        Args:
+            sg: SchemaGenerator of the data model.
+            component: Label of the component the manifests are validated against; None if unknown.
+        """
+        # plans are cached, and only keep the (read-only) index of the data model they need, not the whole model
+        self.compiled_schema = sg.se.get_compiled_schema()
+        self.component = component
+        self.rule_info = validation_rule_info()
+
+        self._columns = {}
+
+        if component is not None and component in self.compiled_schema:
+            for column in sg.get_node_dependencies(component):
+                self.get_column(column)
+
+    def get_column(self, column: str) -> ColumnPlan:
+        """Get the validation rules of a manifest column.
+
+        Args:
+            column: Name of the column, i.e. display name of the attribute.
+        """
+        try:
+            return self._columns[column]
+        except KeyError:
+            pass
+
+        # as SchemaGenerator.get_node_validation_rules
+        node_label = self.compiled_schema.get_node_label(column)
+        rules = list(self.compiled_schema.get_node(node_label).validation_rules) if node_label else []
+
+        column_plan = ColumnPlan(
+            column=column,
+            rules=tuple(self._parse_rule(rule, column) for rule in rules),
+            is_list=bool(rule_in_rule_list("list", rules)),
+        )
+        self._columns[column] = column_plan
+
+        return column_plan
+
+    def _parse_rule(self, rule: str, column: str) -> ValidationRule:
+        rule_parts = rule.split(" ")
+        rule_type = rule_parts[0]
+
+        return ValidationRule(
+            rule=rule,
+            rule_type=rule_type,
+            args=tuple(rule_parts[1:]),
+            method=self.rule_info[rule_type]["type"] if rule_type in self.rule_info else None,
+            message_level=get_rule_message_level(rule, self._is_required(rule, column)),
+            great_expectations=not rule_in_rule_list(rule, UNIMPLEMENTED_EXPECTATIONS),
+            in_house=bool(rule_in_rule_list(rule, IN_HOUSE_RULES)),
+            cross_row=bool(rule_in_rule_list(rule, CROSS_ROW_RULES)),
+        )
+
+    def _is_required(self, rule: str, column: str) -> bool:
+        # as GenerateError.get_message_level: only recommended rules depend on it
+        if not rule.startswith("recommended"):
+            return False
+
+        return self.compiled_schema.is_required(self.compiled_schema.get_node_label(column))
+
+
+# validation plans, by data model hash and component
+_validation_plan_cache = LRUCache(max_size=32)
+
+
+def get_validation_plan(sg: SchemaGenerator, component: str = None) -> ValidationPlan:
+    """Get the validation plan of a component of a data model, compiled on the first validation against it.
+
+    Args:
+        sg: SchemaGenerator of the data model.
+        component: Label of the component manifests are validated against; None if unknown.
+    """
+    cache_key = (sg.se.schema_hash, component)
+
+    validation_plan = _validation_plan_cache.get(cache_key)
+    if validation_plan is None:
+        validation_plan = ValidationPlan(sg, component)
+        _validation_plan_cache.set(cache_key, validation_plan)
+
+    return validation_plan
@@ -0,0 +1,93 @@
+from itertools import islice
+from typing import FrozenSet, Iterator, List, Optional, Tuple
+
+import networkx as nx
+
+
+class ClassHierarchyIndex(object):
+    """Ancestor index over the class hierarchy (the parentOf DiGraph) of a data model.
+
+    Parent and child pointers are taken once from the DiGraph, so that ancestors of a class and the paths leading to
+    it from the roots of the hierarchy are found by walking the hierarchy itself, instead of sorting it and searching
+    the whole data model graph. Ancestors and paths are memoized per class.
+    """
+
+    def __init__(self, digraph: nx.DiGraph) -> None:
+        """
+        Args:
+            digraph: DiGraph on the parentOf edges of the data model graph; edges go from parent to child class.
+        """
+        self._parents = {node: tuple(digraph.predecessors(node)) for node in digraph}
+        self._children = {node: tuple(digraph.successors(node)) for node in digraph}
+
+        # classes without parents, in graph order
+        self._roots = tuple(node for node, parents in self._parents.items() if not parents)
+
+        self._ancestors = {}
+        self._paths = {}
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._parents
+
+    def get_ancestors(self, node: str) -> FrozenSet[str]:
+        """Get all classes a class inherits from, directly or not; empty if the class is not in the hierarchy."""
+        if node not in self._ancestors:
+            ancestors = set()
+            to_visit = list(self._parents.get(node, ()))
+            while to_visit:
+                parent = to_visit.pop()
+                if parent not in ancestors:
+                    ancestors.add(parent)
+                    to_visit.extend(self._parents[parent])
+
+            self._ancestors[node] = frozenset(ancestors)
+
+        return self._ancestors[node]
+
+    def _iter_paths(self, node: str) -> Iterator[Tuple[str, ...]]:
+        """Iterate over the simple paths from the roots of the hierarchy to a class, the class excluded.
+
+        Paths are walked down from the roots, depth first and in graph order, only through ancestors of the class, so
+        every branch that is explored leads to a path.
+        """
+        ancestors = self.get_ancestors(node)
+
+        for root in self._roots:
+            if root not in ancestors:
+                continue
+
+            path = [root]
+            # iterators over the children left to explore, one per class in the path
+            to_explore = [iter(self._children[root])]
+            while to_explore:
+                child = next(to_explore[-1], None)
+                if child is None:
+                    to_explore.pop()
+                    path.pop()
+                elif child == node:
+                    yield tuple(path)
+                elif child in ancestors and child not in path:
+                    path.append(child)
+                    to_explore.append(iter(self._children[child]))
+
+    def get_paths(self, node: str, max_paths: Optional[int] = None) -> List[List[str]]:
+        """Get the paths from the roots of the hierarchy to a class.
+
+        Args:
+            node: label of the class.
+            max_paths: if set, at most this many paths are returned; hierarchies where classes have several parents can
+                have a number of paths exponential in their depth.
+
+        Returns:
+            Paths from a root to the class, the class excluded, in the order they are reached by a depth-first walk down
+            from the roots; empty if the class is a root or is not in the hierarchy.
+        """
+        if node in self._paths:
+            paths = self._paths[node][:max_paths]
+        elif max_paths is not None:
+            paths = list(islice(self._iter_paths(node), max_paths))
+        else:
+            paths = self._paths[node] = list(self._iter_paths(node))
+
+        # callers may modify the paths they get
+        return [list(path) for path in paths]
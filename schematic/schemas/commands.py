@@ -2,11 +2,14 @@
 
 import click
 import click_log
+import json
 import logging
 import sys
 import re
 
+from schematic.schemas.convert_cache import get_conversion_cache_path
 from schematic.schemas.df_parser import _convert_csv_to_data_model
+from schematic.schemas.schema_diff import diff_data_models
 from schematic.utils.cli_utils import query_dict
 from schematic.help import schema_commands
 
@@ -47,14 +50,16 @@ def schema():  # use as `schematic model ...`
     metavar="<OUTPUT_PATH>",
     help=query_dict(schema_commands, ("schema", "convert", "output_jsonld")),
 )
-def convert(schema_csv, base_schema, output_jsonld):
+@click.option(
+    "--no_cache",
+    is_flag=True,
+    help=query_dict(schema_commands, ("schema", "convert", "no_cache")),
+)
+def convert(schema_csv, base_schema, output_jsonld, no_cache):
     """
     Running CLI to convert data model specification in CSV format to
     data model in JSON-LD format.
     """
-    # convert RFC to Data Model
-    base_se = _convert_csv_to_data_model(schema_csv, base_schema)
-
     # output JSON-LD file alongside CSV file by default
     if output_jsonld is None:
         csv_no_ext = re.sub("[.]csv$", "", schema_csv)
@@ -66,6 +71,10 @@ def convert(schema_csv, base_schema, output_jsonld):
             "You can use the `--output_jsonld` argument to specify another file path."
         )
 
+    # convert RFC to Data Model, reusing the previous conversion to the same JSON-LD file
+    cache_path = None if no_cache else get_conversion_cache_path(output_jsonld)
+    base_se = _convert_csv_to_data_model(schema_csv, base_schema, cache_path)
+
     # saving updated schema.org schema
     try:
         base_se.export_schema(output_jsonld)
@@ -73,3 +82,47 @@ def convert(schema_csv, base_schema, output_jsonld):
     except:
         click.echo(f"The Data Model could not be created by using '{output_jsonld}' location. Please check your file path again")
 
+
+@schema.command(
+    "diff",
+    options_metavar="<options>",
+    short_help=query_dict(schema_commands, ("schema", "diff", "short_help")),
+)
+@click_log.simple_verbosity_option(logger)
+@click.argument(
+    "old_jsonld", type=click.Path(exists=True), metavar="<OLD_JSON-LD_SCHEMA>", nargs=1
+)
+@click.argument(
+    "new_jsonld", type=click.Path(exists=True), metavar="<NEW_JSON-LD_SCHEMA>", nargs=1
+)
+@click.option(
+    "--output_json",
+    "-o",
+    metavar="<OUTPUT_PATH>",
+    help=query_dict(schema_commands, ("schema", "diff", "output_json")),
+)
+def diff(old_jsonld, new_jsonld, output_json):
+    """
+    Running CLI to compute the changes between two versions of a data model
+    in JSON-LD format: the nodes and the edges of each relationship that were
+    added, removed or modified, and the components they affect.
+    """
+    schema_diff = diff_data_models(old_jsonld, new_jsonld)
+
+    changes = json.dumps(schema_diff.to_dict(), indent=4)
+
+    if output_json is None:
+        click.echo(changes)
+    else:
+        with open(output_json, "w") as f:
+            f.write(changes)
+
+        click.echo(f"The changes between the Data Models were saved to '{output_json}' location.")
+
+    if schema_diff.is_empty():
+        logger.info("The Data Models are identical.")
+    else:
+        logger.info(
+            f"{len(schema_diff.affected_components)} component(s) affected by the changes: "
+            f"{', '.join(schema_diff.affected_components)}"
+        )
@@ -0,0 +1,305 @@
+import logging
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List
+
+import networkx as nx
+
+from schematic.utils.cli_utils import query_dict
+from schematic import CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+def use_compact_graph() -> bool:
+    """Check whether data model graphs are held by a CompactSchemaGraph (model > compact_graph in the configuration
+    file) instead of a networkx MultiDiGraph.
+    """
+    try:
+        return bool(query_dict(CONFIG.DATA, ("model", "compact_graph")))
+    except AttributeError:
+        # no configuration file has been loaded
+        return False
+
+
+class _CompactNodeView(object):
+    """The `nodes` of a CompactSchemaGraph, looked up the way the nodes of a networkx graph are."""
+
+    def __init__(self, graph: "CompactSchemaGraph") -> None:
+        self._graph = graph
+
+    def __getitem__(self, node: str) -> Dict[str, Any]:
+        return self._graph._get_node_attrs(self._graph._get_id(node))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph._labels)
+
+    def __len__(self) -> int:
+        return len(self._graph._labels)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._graph._ids
+
+    def __call__(self, data: bool = False):
+        if not data:
+            return iter(self._graph._labels)
+
+        return (
+            (label, self._graph._get_node_attrs(i)) for i, label in enumerate(self._graph._labels)
+        )
+
+
+class _CompactEdgeView(object):
+    """The `edges` of a CompactSchemaGraph; like those of a MultiDiGraph, they are (u, v, key) when iterated over, and
+    can be called as `out_edges`.
+    """
+
+    def __init__(self, graph: "CompactSchemaGraph") -> None:
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[tuple]:
+        return self._graph.out_edges(keys=True)
+
+    def __len__(self) -> int:
+        return self._graph.number_of_edges()
+
+    def __call__(self, nbunch=None, data=False, keys: bool = False) -> Iterator[tuple]:
+        return self._graph.out_edges(nbunch, data=data, keys=keys)
+
+
+class CompactSchemaGraph(object):
+    """Read-only, array-backed copy of the networkx graph of a data model.
+
+    Nodes are numbered, edges are stored as CSR (compressed sparse row) arrays of node numbers, for all edges and for
+    the edges of each edge key (relationship), and node attributes are stored per attribute (columnar) instead of one
+    dictionary per node. A model takes several times less memory than its MultiDiGraph, and traversals follow arrays
+    instead of nested dictionaries.
+
+    The graph answers the queries SchemaExplorer and SchemaGenerator make on a MultiDiGraph (membership, `nodes`,
+    `successors`, `predecessors`, `edges`, `out_edges`, `in_edges`), in the same order. Node attributes are returned
+    as new dictionaries, so changes to them are not kept; use `to_networkx` to get a graph that can be modified, or
+    passed to networkx algorithms and visualizations.
+    """
+
+    def __init__(self, graph: nx.MultiDiGraph) -> None:
+        """
+        Args:
+            graph: networkx graph of the data model, see schema_utils.load_schema_into_networkx.
+        """
+        self._labels = [sys.intern(label) for label in graph.nodes]
+        self._ids = {label: i for i, label in enumerate(self._labels)}
+
+        self._edge_keys = []
+        edge_key_ids = {}
+
+        # the adjacency dicts of the graph are read directly, its views are several times slower to go through
+        out_offsets, out_nodes, out_keys = [0], [], []
+        key_offsets, key_nodes = [], []
+        for label in self._labels:
+            for neighbor, keys in graph._succ[label].items():
+                j = self._ids[neighbor]
+                for key in keys:
+                    if key not in edge_key_ids:
+                        edge_key_ids[key] = len(self._edge_keys)
+                        self._edge_keys.append(key)
+                        # no edges of this key from the nodes before
+                        key_offsets.append([0] * len(out_offsets))
+                        key_nodes.append([])
+                    out_nodes.append(j)
+                    out_keys.append(edge_key_ids[key])
+                    key_nodes[edge_key_ids[key]].append(j)
+
+            out_offsets.append(len(out_nodes))
+            for offsets, nodes in zip(key_offsets, key_nodes):
+                offsets.append(len(nodes))
+
+        in_offsets, in_nodes, in_keys = [0], [], []
+        for label in self._labels:
+            for neighbor, keys in graph._pred[label].items():
+                j = self._ids[neighbor]
+                for key in keys:
+                    in_nodes.append(j)
+                    in_keys.append(edge_key_ids[key])
+            in_offsets.append(len(in_nodes))
+
+        # CSR arrays: the neighbors of node i are nodes[offsets[i]:offsets[i + 1]], on edges with keys at the same
+        # positions in keys
+        self._out_offsets = array("l", out_offsets)
+        self._out_nodes = array("l", out_nodes)
+        self._out_keys = array("h", out_keys)
+        self._in_offsets = array("l", in_offsets)
+        self._in_nodes = array("l", in_nodes)
+        self._in_keys = array("h", in_keys)
+
+        # successors on the edges of each edge key
+        self._key_offsets = [array("l", offsets) for offsets in key_offsets]
+        self._key_nodes = [array("l", nodes) for nodes in key_nodes]
+
+        # attribute names of each node, in order; nodes share the tuple when their attributes are in the same order
+        layouts = {}
+        self._layouts = []
+        self._node_layouts = array("l")
+        self._columns = {}
+        for i, (label, attrs) in enumerate(graph.nodes(data=True)):
+            layout = tuple(attrs)
+            if layout not in layouts:
+                layouts[layout] = len(self._layouts)
+                self._layouts.append(layout)
+            self._node_layouts.append(layouts[layout])
+
+            for attr, value in attrs.items():
+                if attr not in self._columns:
+                    self._columns[attr] = [None] * len(self._labels)
+                if isinstance(value, str):
+                    value = sys.intern(value)
+                self._columns[attr][i] = value
+
+    def _get_id(self, node: str) -> int:
+        try:
+            return self._ids[node]
+        except (KeyError, TypeError):
+            raise KeyError(node)
+
+    def _get_node_attrs(self, i: int) -> Dict[str, Any]:
+        return {attr: self._columns[attr][i] for attr in self._layouts[self._node_layouts[i]]}
+
+    def _check_node(self, node: str) -> int:
+        if node not in self._ids:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.")
+
+        return self._ids[node]
+
+    @property
+    def nodes(self) -> _CompactNodeView:
+        return _CompactNodeView(self)
+
+    def __contains__(self, node: str) -> bool:
+        try:
+            return node in self._ids
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._labels)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def has_node(self, node: str) -> bool:
+        return node in self
+
+    def number_of_nodes(self) -> int:
+        return len(self._labels)
+
+    def number_of_edges(self) -> int:
+        return len(self._out_nodes)
+
+    def is_directed(self) -> bool:
+        return True
+
+    def is_multigraph(self) -> bool:
+        return True
+
+    def _iter_neighbors(self, offsets: array, nodes: array, i: int) -> Iterator[str]:
+        """Iterate over distinct neighbors, in order; a neighbor is listed once per edge key between the nodes."""
+        return iter([self._labels[j] for j in dict.fromkeys(nodes[offsets[i] : offsets[i + 1]])])
+
+    def successors(self, node: str) -> Iterator[str]:
+        return self._iter_neighbors(self._out_offsets, self._out_nodes, self._check_node(node))
+
+    neighbors = successors
+
+    def predecessors(self, node: str) -> Iterator[str]:
+        return self._iter_neighbors(self._in_offsets, self._in_nodes, self._check_node(node))
+
+    def get_successors_by_edge_key(self, node: str, key: str) -> List[str]:
+        """Get the successors of a node on the edges of a given key (relationship), in order."""
+        if key not in self._edge_keys:
+            return []
+
+        key_id = self._edge_keys.index(key)
+        offsets = self._key_offsets[key_id]
+        i = self._check_node(node)
+
+        return [self._labels[j] for j in self._key_nodes[key_id][offsets[i] : offsets[i + 1]]]
+
+    def _iter_edges(
+        self, nbunch, offsets: array, nodes: array, keys: array, data, with_keys: bool, reverse: bool
+    ) -> Iterator[tuple]:
+        if nbunch is None:
+            node_ids = range(len(self._labels))
+        elif nbunch in self:
+            node_ids = [self._ids[nbunch]]
+        else:
+            node_ids = [self._ids[node] for node in nbunch if node in self]
+
+        for i in node_ids:
+            for position in range(offsets[i], offsets[i + 1]):
+                edge = (self._labels[i], self._labels[nodes[position]])
+                if reverse:
+                    edge = edge[::-1]
+                if with_keys:
+                    edge += (self._edge_keys[keys[position]],)
+                if data is True:
+                    # the edges of a data model graph have no attributes
+                    edge += ({},)
+                elif data is not False:
+                    edge += (None,)
+                yield edge
+
+    def out_edges(self, nbunch=None, data=False, keys: bool = False) -> Iterator[tuple]:
+        """Iterate over the out edges of some nodes (all of them by default), like MultiDiGraph.out_edges."""
+        return self._iter_edges(
+            nbunch, self._out_offsets, self._out_nodes, self._out_keys, data, keys, reverse=False
+        )
+
+    @property
+    def edges(self) -> _CompactEdgeView:
+        return _CompactEdgeView(self)
+
+    def in_edges(self, nbunch=None, data=False, keys: bool = False) -> Iterator[tuple]:
+        """Iterate over the in edges of some nodes (all of them by default), like MultiDiGraph.in_edges."""
+        return self._iter_edges(
+            nbunch, self._in_offsets, self._in_nodes, self._in_keys, data, keys, reverse=True
+        )
+
+    def get_descendants(self, node: str) -> List[str]:
+        """Get all nodes reachable from a node, like nx.descendants."""
+        source = self._check_node(node)
+
+        visited = {source}
+        to_visit = [source]
+        while to_visit:
+            i = to_visit.pop()
+            for j in self._out_nodes[self._out_offsets[i] : self._out_offsets[i + 1]]:
+                if j not in visited:
+                    visited.add(j)
+                    to_visit.append(j)
+
+        visited.discard(source)
+        return [self._labels[i] for i in sorted(visited)]
+
+    def to_networkx(self) -> nx.MultiDiGraph:
+        """Export the graph to a new networkx MultiDiGraph, with the same nodes, edges and attributes in the same order."""
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self.nodes(data=True))
+
+        # adjacency is filled in directly, as the order of successors and of predecessors both follow the order the
+        # edges were added to the original graph
+        for i, u in enumerate(self._labels):
+            succ = graph._succ[u]
+            for position in range(self._out_offsets[i], self._out_offsets[i + 1]):
+                v = self._labels[self._out_nodes[position]]
+                if v not in succ:
+                    succ[v] = graph.edge_key_dict_factory()
+                succ[v][self._edge_keys[self._out_keys[position]]] = graph.edge_attr_dict_factory()
+
+        for i, v in enumerate(self._labels):
+            pred = graph._pred[v]
+            for u in self._in_nodes[self._in_offsets[i] : self._in_offsets[i + 1]]:
+                u = self._labels[u]
+                if u not in pred:
+                    # the same key dict as in successors, as in any MultiDiGraph
+                    pred[u] = graph._succ[u][v]
+
+        return graph
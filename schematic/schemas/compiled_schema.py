@@ -0,0 +1,149 @@
+import logging
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import networkx as nx
+
+from schematic.utils.curie_utils import CurieResolver
+from schematic.utils.general import dict2list
+from schematic.utils.schema_utils import (
+    get_class_label_from_display_name,
+    get_property_label_from_display_name,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaNode(NamedTuple):
+    """Read-only snapshot of the attributes of a single node in the data model graph.
+
+    Attributes that are not set on the node (e.g. "required" on schema.org terms) are stored as None.
+    """
+
+    label: str
+    display_name: Optional[str]
+    comment: Optional[str]
+    required: Optional[bool]
+    validation_rules: Tuple[str, ...]
+    range_values: Tuple[str, ...]
+    dependencies: Tuple[str, ...]
+
+
+def _related_labels(node_attrs: Dict, attr: str, get_name: Callable[[str], str]) -> Tuple[str, ...]:
+    """Get labels referenced by a node attribute (e.g. "rangeIncludes"), in schema order."""
+    if attr not in node_attrs:
+        return ()
+
+    return tuple(
+        get_name(item["@id"])
+        for item in dict2list(node_attrs[attr])
+    )
+
+
+class CompiledSchema(object):
+    """Immutable index over a loaded data model graph.
+
+    Built once from the networkx graph of a data model, so that display name to label resolution and
+    node attribute lookups (validation rules, required, range, dependencies, display name) are dictionary
+    lookups instead of string conversions and graph traversals.
+    """
+
+    def __init__(self, schema_nx: nx.MultiDiGraph, curie_resolver: CurieResolver = None) -> None:
+        """
+        Args:
+            schema_nx: networkx graph of the data model the index is compiled from.
+            curie_resolver: CurieResolver of the data model, whose names are reused; by default a new one.
+        """
+        if curie_resolver is None:
+            curie_resolver = CurieResolver()
+        get_name = curie_resolver.get_name
+
+        self._labels = frozenset(schema_nx.nodes)
+
+        self._nodes = {}
+        for label, attrs in schema_nx.nodes(data=True):
+            # nodes that were only created as the endpoint of an edge carry no attributes
+            if not attrs:
+                continue
+
+            self._nodes[label] = SchemaNode(
+                label=label,
+                display_name=attrs.get("displayName"),
+                comment=attrs.get("comment"),
+                required=attrs.get("required"),
+                validation_rules=tuple(attrs.get("validationRules", ())),
+                range_values=_related_labels(attrs, "rangeIncludes", get_name),
+                dependencies=_related_labels(attrs, "requiresDependency", get_name),
+            )
+
+        # map between the display names of the nodes and their labels, filled once: the index is not modified after
+        # it is built
+        self._display_name_labels = {}
+        for node in self._nodes.values():
+            if node.display_name is not None and node.display_name not in self._display_name_labels:
+                self._display_name_labels[node.display_name] = self._resolve_node_label(node.display_name)
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._labels
+
+    def get_node_label(self, node_display_name: str) -> str:
+        """Get the node label for a given display name.
+
+        Args:
+            node_display_name: Display name of the node which you want to get the label for.
+
+        Returns:
+            Node label associated with given node; empty string if there is no such node in the graph.
+        """
+        try:
+            return self._display_name_labels[node_display_name]
+        except KeyError:
+            # not the display name of a node (e.g. a label, or a name that is not in the data model)
+            return self._resolve_node_label(node_display_name)
+
+    def _resolve_node_label(self, node_display_name: str) -> str:
+        node_class_label = get_class_label_from_display_name(node_display_name)
+        node_property_label = get_property_label_from_display_name(node_display_name)
+
+        if node_class_label in self._labels:
+            return node_class_label
+        elif node_property_label in self._labels:
+            return node_property_label
+        else:
+            return ""
+
+    def get_node(self, node_label: str) -> SchemaNode:
+        """Get the compiled attributes of a node.
+
+        Raises:
+            KeyError: If the node is not in the graph, or carries no attributes.
+        """
+        return self._nodes[node_label]
+
+    def get_display_name(self, node_label: str) -> str:
+        """Get the display name of a node.
+
+        Raises:
+            KeyError: If the node does not have a display name.
+        """
+        display_name = self._nodes[node_label].display_name
+
+        if display_name is None:
+            raise KeyError(node_label)
+
+        return display_name
+
+    def get_display_names(self, node_labels: List[str]) -> List[str]:
+        return [self.get_display_name(label) for label in node_labels]
+
+    def is_required(self, node_label: str) -> bool:
+        """Check if a node is required.
+
+        Raises:
+            KeyError: If the node does not have a "required" attribute.
+        """
+        required = self._nodes[node_label].required
+
+        if required is None:
+            raise KeyError(node_label)
+
+        return required
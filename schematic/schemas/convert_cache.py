@@ -0,0 +1,96 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Optional
+
+from schematic.schemas.model_cache import get_code_fingerprint
+from schematic.utils.io_utils import get_user_cache_dir
+from schematic.version import __version__
+
+logger = logging.getLogger(__name__)
+
+# bump whenever the contents of the conversion cache change
+CONVERSION_CACHE_FORMAT_VERSION = "1"
+
+
+def _get_cache_version() -> tuple:
+    """Get the version a conversion cache is saved with, and must be loaded with.
+
+    __version__ is "unknown" in source checkouts, so caches are also versioned by the code of the conversion (see
+    model_cache.get_code_fingerprint): records built by older code are never reused.
+    """
+    return __version__, CONVERSION_CACHE_FORMAT_VERSION, get_code_fingerprint()
+
+
+def get_conversion_cache_path(output_jsonld: str) -> Optional[str]:
+    """Get the path of the conversion cache of a JSON-LD data model generated from a CSV data model.
+
+    Caches are pickles, so they are kept in the private cache directory of the user (see get_user_cache_dir), keyed
+    by the absolute path of the JSON-LD file, and never alongside it, where anyone able to write there could plant one.
+
+    Returns:
+        Path to the conversion cache, or None if the cache directory cannot be used.
+    """
+    try:
+        cache_dir = get_user_cache_dir("conversions")
+    except OSError as e:
+        logger.warning(f"Conversion cache disabled: {e}")
+        return None
+
+    key = hashlib.sha256(os.path.abspath(output_jsonld).encode()).hexdigest()
+
+    return os.path.join(cache_dir, f"{key}.pickle")
+
+
+def load_conversion_cache(path: str) -> Optional[Dict[str, Any]]:
+    """Load the state saved by a previous conversion of a CSV data model.
+
+    Args:
+        path: Path to the conversion cache.
+
+    Returns:
+        The saved state, or None if there is no cache, it cannot be read, or it was written by another version (or
+        code) of schematic.
+    """
+    try:
+        with open(path, "rb") as f:
+            cache = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable conversion cache {path}: {e}")
+        return None
+
+    if not isinstance(cache, dict) or cache.get("version") != _get_cache_version():
+        logger.debug(f"Ignoring conversion cache {path} of another schematic version.")
+        return None
+
+    return cache["state"]
+
+
+def save_conversion_cache(path: str, state: Dict[str, Any]) -> None:
+    """Save the state of a conversion of a CSV data model, so the next conversion can reuse it.
+
+    Args:
+        path: Path to the conversion cache.
+        state: State to save; see df_parser._update_nx_schema_objects.
+    """
+    cache = {
+        "version": _get_cache_version(),
+        "state": state,
+    }
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # atomic, so an interrupted conversion never leaves a partially written cache behind
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
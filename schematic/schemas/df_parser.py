@@ -5,19 +5,29 @@ import io
 import requests
 import logging
 
+from collections import Counter
 from typing import (
     Any,
     Dict,
+    List,
     Optional,
+    Set,
     Text,
+    Tuple,
 )  # allows specifying explicit variable types
 
 import pandas as pd
 import numpy as np
 
+from schematic.schemas.convert_cache import (
+    load_conversion_cache,
+    save_conversion_cache,
+)
 from schematic.schemas.explorer import SchemaExplorer
 from schematic import LOADER
 
+from schematic.utils.general import dict2list
+from schematic.utils.schema_utils import class_to_node, load_schema_into_networkx
 from schematic.utils.validate_rules_utils import validate_schema_rules
 from schematic.utils.df_utils import load_df
 
@@ -267,275 +277,516 @@ def check_schema_definition(schema_definition: pd.DataFrame) -> bool:
         )
 
 
-def create_nx_schema_objects(
-    schema_extension: pd.DataFrame, se: SchemaExplorer
-) -> SchemaExplorer:
-    """Creates classes for all attributes and adds them to the schema.
-    Args:
-        schema_extension: a pandas dataframe containing schema definition; see example here: https://docs.google.com/spreadsheets/d/1J2brhqO4kpeHIkNytzlqrdIiRanXDr6KD2hqjOTC9hs/edit#gid=0
-        se: a schema explorer object allowing the traversal and modification of a schema graph
-        base_schema_path: a path to a json-ld file containing an existing schema
-    Returns:
-        An updated schema explorer object
+class _SchemaBuilder(object):
+    """Adds classes and properties to a schema in bulk.
+
+    Mirrors SchemaExplorer.add_schema_object_nx / edit_schema_object_nx and the lookups create_nx_schema_objects
+    makes on the schema graph, but keeps the attributes of the graph nodes in a dictionary: the JSON-LD schema is
+    updated as schema objects are added / edited, and the networkx graph is only built from it once, in `build`.
+    Editing the graph in place costs a scan over all of its nodes per edit, i.e. converting a data model is
+    quadratic in its size.
     """
 
-    try:
-        check_schema_definition(schema_extension)
-        logger.debug("Schema definition csv ready for processing!")
-    except:
-        raise ValueError(
-            f"Schema extension headers: {set(list(schema_extension.columns))} "
-            f"do not match required schema headers: {required_headers}"
-        )
+    def __init__(self, se: SchemaExplorer, nodes: Dict[str, dict] = None) -> None:
+        """
+        Args:
+            se: the schema to add schema objects to
+            nodes: attributes of the nodes of the schema graph; by default, taken from the graph of `se`
+        """
+        self.se = se
+
+        # node label -> node attributes; nodes that were only created as the endpoint of an edge have no attributes
+        if nodes is None:
+            nodes = {
+                node: dict(attrs)
+                for node, attrs in se.get_nx_schema().nodes(data=True)
+            }
+        self.nodes = nodes
 
-    rel_dict = {
-        "rdfs:subClassOf": {"parentOf": "in"},
-        "schema:domainIncludes": {"domainValue": "in"},
-        "sms:requiresDependency": {"requiresDependency": "out"},
-        "sms:requiresComponent": {"requiresComponent": "out"},
-        "schema:rangeIncludes": {"rangeValue": "out"},
-    }
+    def _add_referenced_nodes(self, node: str, references: Any) -> None:
+        for reference in dict2list(references) or []:
+            referenced_node = self.se.get_curie_resolver().get_name(reference["@id"])
 
-    # get attributes from Attribute column
-    attributes = schema_extension[list(required_headers)].to_dict("records")
+            # do not allow self-loops
+            if referenced_node != node:
+                self.nodes.setdefault(referenced_node, {})
 
-    # get all properties across all attributes from Properties column
-    props = set(schema_extension[["Properties"]].dropna().values.flatten())
+    def attribute_exists(self, attribute_label: str) -> bool:
+        """See attribute_exists."""
+        return attribute_label in self.nodes
 
-    # clean properties strings
-    all_properties = []
-    for prop in props:
-        all_properties += [p.strip() for p in prop.split(",")]
+    def add_schema_object(self, schema_object: dict, **kwargs: dict) -> None:
+        """See SchemaExplorer.add_schema_object_nx."""
+        node = schema_object["rdfs:label"]
 
-    # get both attributes and their properties (if any)
-    properties = schema_extension[["Attribute", "Properties"]].to_dict("records")
+        self.nodes.setdefault(node, {}).update(
+            class_to_node(class_to_convert=schema_object).nodes[node]
+        )
 
-    # property to class map
-    prop_2_class = {}
-    for record in properties:
-        if not pd.isnull(record["Properties"]):
-            props = record["Properties"].strip().split(",")
-            for p in props:
-                prop_2_class[p.strip()] = record["Attribute"]
+        # relationships add edges, creating the nodes on the other end
+        for rel in kwargs:
+            if rel in schema_object:
+                self._add_referenced_nodes(node, schema_object[rel])
+
+        self.se.add_schema_record(schema_object)
+
+    def edit_schema_object(self, schema_object: dict) -> None:
+        """See SchemaExplorer.edit_schema_object_nx."""
+        node = schema_object["rdfs:label"]
+
+        data = self.nodes.get(node)
+        if data is not None:
+            replace_data = class_to_node(class_to_convert=schema_object).nodes[node]
+
+            if "comment" in data and "comment" in replace_data:
+                data["comment"] = replace_data["comment"]
+                data["description"] = replace_data["description"]
+
+            for key in ["required", "displayName", "validationRules"]:
+                if key in data and key in replace_data:
+                    data[key] = replace_data[key]
+
+            if "subClassOf" in replace_data:
+                self._add_referenced_nodes(node, replace_data["subClassOf"])
+                data["subClassOf"] = replace_data["subClassOf"]
+
+            if "requiresDependency" in replace_data:
+                # dependency edges are only updated on nodes that already had dependencies
+                if "requiresDependency" in data:
+                    self._add_referenced_nodes(node, replace_data["requiresDependency"])
+                data["requiresDependency"] = replace_data["requiresDependency"]
+
+            for key in ["requiresComponent", "rangeIncludes"]:
+                if key in replace_data:
+                    self._add_referenced_nodes(node, replace_data[key])
+                    data[key] = replace_data[key]
+
+        self.se.edit_schema_record(schema_object)
+
+    def explore_class(self, schema_class: str) -> dict:
+        """See SchemaExplorer.explore_class; only gathers the class details used by create_nx_schema_objects."""
+        data = self.nodes[schema_class]
+        get_name = self.se.get_curie_resolver().get_name
+
+        def referenced_labels(key):
+            return [
+                get_name(reference["@id"])
+                for reference in dict2list(data[key])
+            ] if key in data else []
+
+        return {
+            "description": data["description"],
+            "subClassOf": referenced_labels("subClassOf"),
+            "range": referenced_labels("rangeIncludes"),
+            "dependencies": referenced_labels("requiresDependency"),
+            "validation_rules": data.get("validationRules", []),
+            "required": data.get("required", False),
+            "component_dependencies": referenced_labels("requiresComponent"),
+        }
 
-    logger.debug("Adding attributes")
-    for attribute in attributes:
+    def build(self) -> SchemaExplorer:
+        """Build the networkx graph of the schema objects added / edited so far."""
+        self.se.schema_nx = load_schema_into_networkx(self.se.schema)
+
+        return self.se
+
+
+rel_dict = {
+    "rdfs:subClassOf": {"parentOf": "in"},
+    "schema:domainIncludes": {"domainValue": "in"},
+    "sms:requiresDependency": {"requiresDependency": "out"},
+    "sms:requiresComponent": {"requiresComponent": "out"},
+    "schema:rangeIncludes": {"rangeValue": "out"},
+}
+
+
+class _CSVDataModel(object):
+    """The rows of a data model CSV, and the lookups over them used to add the data model to a schema."""
+
+    def __init__(self, schema_extension: pd.DataFrame) -> None:
+        """
+        Args:
+            schema_extension: a pandas dataframe containing schema definition; see create_nx_schema_objects
+        Raises:
+            ValueError: the dataframe does not have the required headers
+        """
+        try:
+            check_schema_definition(schema_extension)
+            logger.debug("Schema definition csv ready for processing!")
+        except:
+            raise ValueError(
+                f"Schema extension headers: {set(list(schema_extension.columns))} "
+                f"do not match required schema headers: {required_headers}"
+            )
 
-        required = None
-        if not pd.isnull(attribute["Required"]):
-            required = attribute["Required"]
+        # get attributes from Attribute column
+        self.attributes = schema_extension[list(required_headers)].to_dict("records")
 
-        if not attribute["Attribute"] in all_properties:
-            display_name = attribute["Attribute"]
+        # get all properties across all attributes from Properties column
+        props = set(schema_extension[["Properties"]].dropna().values.flatten())
 
-            subclass_of = None
-            if not pd.isnull(attribute["Parent"]):
-                subclass_of = [
-                    parent for parent in attribute["Parent"].strip().split(",")
-                ]
+        # clean properties strings
+        all_properties = []
+        for prop in props:
+            all_properties += [p.strip() for p in prop.split(",")]
 
-            new_class = get_class(
-                se,
-                display_name,
-                description=attribute["Description"],
-                subclass_of=subclass_of,
-                required=required,
-            )
+        self.all_properties = set(all_properties)
 
+        # get both attributes and their properties (if any)
+        self.properties = schema_extension[["Attribute", "Properties"]].to_dict(
+            "records"
+        )
+
+        # names and descriptions (of the first row) of the attributes in the Attribute column
+        self.attribute_names = set(schema_extension["Attribute"])
+        self.attribute_descriptions = {}
+        for attribute_name, description in zip(
+            schema_extension["Attribute"], schema_extension["Description"]
+        ):
+            self.attribute_descriptions.setdefault(attribute_name, description)
+
+        # property to class map
+        self.prop_2_class = {}
+        for record in self.properties:
+            if not pd.isnull(record["Properties"]):
+                props = record["Properties"].strip().split(",")
+                for p in props:
+                    self.prop_2_class[p.strip()] = record["Attribute"]
+
+
+def _add_attribute(
+    attribute: dict, model: _CSVDataModel, builder: _SchemaBuilder
+) -> None:
+    """Add the class or property of an attribute (a row of the data model CSV) to the schema."""
+    se = builder.se
+
+    required = None
+    if not pd.isnull(attribute["Required"]):
+        required = attribute["Required"]
+
+    if not attribute["Attribute"] in model.all_properties:
+        display_name = attribute["Attribute"]
+
+        subclass_of = None
+        if not pd.isnull(attribute["Parent"]):
+            subclass_of = [
+                parent for parent in attribute["Parent"].strip().split(",")
+            ]
+
+        new_class = get_class(
+            se,
+            display_name,
+            description=attribute["Description"],
+            subclass_of=subclass_of,
+            required=required,
+        )
+
+        builder.add_schema_object(new_class, **rel_dict)
+
+        """
+        print(se.get_nx_schema().nodes[new_class["rdfs:label"]])
+        # check if attribute doesn't already exist and add it
+        if not attribute_exists(se, new_class["rdfs:label"]):
             se.add_schema_object_nx(new_class, **rel_dict)
+        else:
+            print("ATTRIBUTE EXISTS")
+            print(new_class)
+        """
+
+    else:
+        display_name = attribute["Attribute"]
+
+        new_property = get_property(
+            se,
+            display_name,
+            model.prop_2_class[display_name],
+            description=attribute["Description"],
+            required=required,
+        )
+        # check if attribute doesn't already exist and add it
+        if not builder.attribute_exists(new_property["rdfs:label"]):
+            builder.add_schema_object(new_property, **rel_dict)
+
 
-            """
-            print(se.get_nx_schema().nodes[new_class["rdfs:label"]])
-            # check if attribute doesn't already exist and add it
-            if not attribute_exists(se, new_class["rdfs:label"]):
-                se.add_schema_object_nx(new_class, **rel_dict)
+def _add_properties(
+    prop: dict, model: _CSVDataModel, builder: _SchemaBuilder, label: str = None
+) -> None:
+    """Add or edit the properties listed in the Properties column of a row of the data model CSV.
+
+    Args:
+        prop: the Attribute and Properties of the row
+        model: the data model the row belongs to
+        builder: the schema the properties are added to
+        label: if provided, only the property with this label is added / edited
+    """
+    se = builder.se
+
+    if not pd.isnull(prop["Properties"]):  # a class may have or not have properties
+        for p in (
+            prop["Properties"].strip().split(",")
+        ):  # a class may have multiple properties
+            attribute = prop["Attribute"]
+
+            # check if property is already present as attribute under attributes column
+            # TODO: adjust logic below to compactify code
+            p = p.strip()
+            if (
+                label is not None
+                and se.get_property_label_from_display_name(p) != label
+            ):
+                continue
+
+            if p in model.attribute_names:
+                description = model.attribute_descriptions[p]
+                property_info = se.explore_property(
+                    se.get_property_label_from_display_name(p)
+                )
+                range_values = (
+                    property_info["range"] if "range" in property_info else None
+                )
+                requires_dependencies = (
+                    property_info["dependencies"]
+                    if "dependencies" in property_info
+                    else None
+                )
+                required = (
+                    property_info["required"]
+                    if "required" in property_info
+                    else None
+                )
+
+                new_property = get_property(
+                    se,
+                    p,
+                    property_info["domain"],
+                    description=description,
+                    requires_range=range_values,
+                    requires_dependencies=requires_dependencies,
+                    required=required,
+                )
+                builder.edit_schema_object(new_property)
             else:
-                print("ATTRIBUTE EXISTS")
-                print(new_class)
-            """
+                description = None
+                new_property = get_property(
+                    se, p, attribute, description=description
+                )
+                builder.add_schema_object(new_property, **rel_dict)
+
 
+def _add_attribute_requirements(
+    attribute: dict, model: _CSVDataModel, builder: _SchemaBuilder
+) -> None:
+    """Add the valid values, validation rules, dependencies and component dependencies of an attribute (a row of
+    the data model CSV) to its class or property in the schema.
+    """
+    se = builder.se
+
+    # TODO: refactor processing of multi-valued cells in columns and corresponding schema updates; it would compactify code below if class and property are encapsulated as objects inheriting from a common attribute parent object
+
+    # get values in range for this attribute, if any are specified
+    range_values = attribute["Valid Values"]
+    if not pd.isnull(range_values):
+        # prepare the range values list and split based on appropriate delimiter
+        # if the string "range_values" starts with double quotes, then extract all "valid values" within double quotes
+        range_values_list = []
+        if range_values[0] == '"':
+            range_values_list = re.findall(r'"([^"]*)"', range_values)
         else:
-            display_name = attribute["Attribute"]
+            range_values_list = range_values.strip().split(",")
 
-            new_property = get_property(
-                se,
-                display_name,
-                prop_2_class[display_name],
-                description=attribute["Description"],
-                required=required,
-            )
-            # check if attribute doesn't already exist and add it
-            if not attribute_exists(se, new_property["rdfs:label"]):
-                se.add_schema_object_nx(new_property, **rel_dict)
+        for val in range_values_list:
+            # check if value is in attributes column; add it as a class if not
+            if not val.strip() in model.attribute_names:
 
-    logger.debug("Done adding attributes")
+                # determine parent class of the new value class
+                # if this attribute is not a property, set it as a parent class
+                if not attribute["Attribute"] in model.all_properties:
+                    parent = attribute["Attribute"]
+                else:
+                    # this attribute is a property, set the parent to the domain class of this attribute
+                    parent = se.get_class_by_property(attribute["Attribute"])
+                    if not parent:
+                        raise ValueError(
+                            f"Listed valid value: {val}, for attribute: {attribute['Attribute']} "
+                            "must have a class parent. The extension could not be added to the schema."
+                        )
 
-    # TODO check if schema already contains property - may require property context in csv schema definition
+                new_class = get_class(
+                    se, val, description=None, subclass_of=[parent]
+                )
+                # check if attribute doesn't already exist and add it
+                if not builder.attribute_exists(new_class["rdfs:label"]):
+                    builder.add_schema_object(new_class, **rel_dict)
 
-    logger.debug("Adding and editing properties")
+            # update rangeIncludes of attribute
+            # if attribute is not a property, then assume it is a class
+            if not attribute["Attribute"] in model.all_properties:
+                class_info = builder.explore_class(
+                    se.get_class_label_from_display_name(attribute["Attribute"])
+                )
+                class_info["range"].append(
+                    se.get_class_label_from_display_name(val)
+                )
+                class_range_edit = get_class(
+                    se,
+                    attribute["Attribute"],
+                    description=attribute["Description"],
+                    subclass_of=[attribute["Parent"]],
+                    requires_dependencies=class_info["dependencies"],
+                    requires_range=class_info["range"],
+                    required=class_info["required"],
+                    validation_rules=class_info["validation_rules"],
+                )
+                builder.edit_schema_object(class_range_edit)
 
-    for prop in properties:
-        if not pd.isnull(prop["Properties"]):  # a class may have or not have properties
-            for p in (
-                prop["Properties"].strip().split(",")
-            ):  # a class may have multiple properties
-                attribute = prop["Attribute"]
-
-                # check if property is already present as attribute under attributes column
-                # TODO: adjust logic below to compactify code
-                p = p.strip()
-                if p in list(schema_extension["Attribute"]):
-                    description = schema_extension.loc[
-                        schema_extension["Attribute"] == p
-                    ]["Description"].values[0]
-                    property_info = se.explore_property(
-                        se.get_property_label_from_display_name(p)
-                    )
-                    range_values = (
-                        property_info["range"] if "range" in property_info else None
-                    )
-                    requires_dependencies = (
-                        property_info["dependencies"]
-                        if "dependencies" in property_info
-                        else None
-                    )
-                    required = (
-                        property_info["required"]
-                        if "required" in property_info
-                        else None
-                    )
+            else:
+                # the attribute is a property
+                property_info = se.explore_property(
+                    se.get_property_label_from_display_name(attribute["Attribute"])
+                )
+                property_info["range"].append(
+                    se.get_class_label_from_display_name(val)
+                )
+                property_range_edit = get_property(
+                    se,
+                    attribute["Attribute"],
+                    property_info["domain"],
+                    description=property_info["description"],
+                    requires_dependencies=property_info["dependencies"],
+                    requires_range=property_info["range"],
+                    required=property_info["required"],
+                    validation_rules=property_info["validation_rules"],
+                )
+                builder.edit_schema_object(property_range_edit)
 
-                    new_property = get_property(
-                        se,
-                        p,
-                        property_info["domain"],
-                        description=description,
-                        requires_range=range_values,
-                        requires_dependencies=requires_dependencies,
-                        required=required,
-                    )
-                    se.edit_schema_object_nx(new_property)
-                else:
-                    description = None
-                    new_property = get_property(
-                        se, p, attribute, description=description
-                    )
-                    se.add_schema_object_nx(new_property, **rel_dict)
+            logger.debug(val + " added to value range")
 
-    logger.debug("Done adding properties")
+    # get validation rules for this attribute, if any are specified
+    validation_rules = attribute["Validation Rules"]
 
-    # # set range values and dependency requirements for each attribute
-    # # if not already added, add each attribute in required values and dependencies to the schema extension
-    # print("Editing attributes and properties to add requirements and value ranges")
-    # print("====================================================================================")
+    if not pd.isnull(validation_rules):
 
-    for attribute in attributes:
+        # TODO: make validation rules delimiter configurable parameter
 
-        # TODO: refactor processing of multi-valued cells in columns and corresponding schema updates; it would compactify code below if class and property are encapsulated as objects inheriting from a common attribute parent object
+        validation_rules = [
+            val_rule.strip() for val_rule in validation_rules.strip().split("::")
+        ]
 
-        # get values in range for this attribute, if any are specified
-        range_values = attribute["Valid Values"]
-        if not pd.isnull(range_values):
-            # prepare the range values list and split based on appropriate delimiter
-            # if the string "range_values" starts with double quotes, then extract all "valid values" within double quotes
-            range_values_list = []
-            if range_values[0] == '"':
-                range_values_list = re.findall(r'"([^"]*)"', range_values)
-            else:
-                range_values_list = range_values.strip().split(",")
+        validate_vr = validate_schema_rules(
+                        validation_rules, 
+                        attribute["Attribute"],
+                        input_filetype = 'csv_schema')
 
-            for val in range_values_list:
-                # check if value is in attributes column; add it as a class if not
-                if not val.strip() in list(schema_extension["Attribute"]):
 
-                    # determine parent class of the new value class
+        # update validation rules of attribute
+        # if attribute is not a property, then assume it is a class
+        if not attribute["Attribute"] in model.all_properties:
+            class_info = builder.explore_class(
+                se.get_class_label_from_display_name(attribute["Attribute"])
+            )
+            class_info["validation_rules"] = validation_rules
+            class_val_rule_edit = get_class(
+                se,
+                attribute["Attribute"],
+                description=attribute["Description"],
+                subclass_of=[attribute["Parent"]],
+                requires_dependencies=class_info["dependencies"],
+                requires_range=class_info["range"],
+                required=class_info["required"],
+                validation_rules=class_info["validation_rules"],
+            )
+            builder.edit_schema_object(class_val_rule_edit)
+        else:
+            # the attribute is a property
+            property_info = se.explore_property(
+                se.get_property_label_from_display_name(attribute["Attribute"])
+            )
+            property_info["validation_rules"] = validation_rules
+            property_val_rule_edit = get_property(
+                se,
+                attribute["Attribute"],
+                property_info["domain"],
+                description=property_info["description"],
+                requires_dependencies=property_info["dependencies"],
+                requires_range=property_info["range"],
+                required=property_info["required"],
+                validation_rules=property_info["validation_rules"],
+            )
+            builder.edit_schema_object(property_val_rule_edit)
+        try:
+            logger.debug(val + "validation rules added")
+        except:
+            logger.debug("Validation rules added")
+
+    # get dependencies for this attribute, if any are specified
+    requires_dependencies = attribute["DependsOn"]
+    if not pd.isnull(requires_dependencies):
+
+        for dep in requires_dependencies.strip().split(","):
+            # check if dependency is a property or not
+            dep = dep.strip()
+            dep_is_property = dep in model.all_properties
+            dep_label = ""
+            # set dependency label based on kind of dependency: class or property
+            if dep_is_property:
+                dep_label = se.get_property_label_from_display_name(dep)
+            else:
+                dep_label = se.get_class_label_from_display_name(dep)
+
+            # check if dependency is in attributes column; add it to the list if not
+            if not dep.strip() in model.attribute_names:
+                # if dependency is a property create a new property; else create a new class
+                if not dep_is_property:
                     # if this attribute is not a property, set it as a parent class
-                    if not attribute["Attribute"] in all_properties:
+                    if not attribute["Attribute"] in model.all_properties:
                         parent = attribute["Attribute"]
                     else:
                         # this attribute is a property, set the parent to the domain class of this attribute
                         parent = se.get_class_by_property(attribute["Attribute"])
                         if not parent:
                             raise ValueError(
-                                f"Listed valid value: {val}, for attribute: {attribute['Attribute']} "
+                                f"Listed required dependency: {dep}, for attribute: {attribute['Attribute']} "
                                 "must have a class parent. The extension could not be added to the schema."
                             )
 
                     new_class = get_class(
-                        se, val, description=None, subclass_of=[parent]
+                        se, dep, description=None, subclass_of=[parent]
                     )
+                    # builder.add_schema_object(new_class, **rel_dict)
                     # check if attribute doesn't already exist and add it
-                    if not attribute_exists(se, new_class["rdfs:label"]):
-                        se.add_schema_object_nx(new_class, **rel_dict)
-
-                # update rangeIncludes of attribute
-                # if attribute is not a property, then assume it is a class
-                if not attribute["Attribute"] in all_properties:
-                    class_info = se.explore_class(
-                        se.get_class_label_from_display_name(attribute["Attribute"])
-                    )
-                    class_info["range"].append(
-                        se.get_class_label_from_display_name(val)
-                    )
-                    class_range_edit = get_class(
-                        se,
-                        attribute["Attribute"],
-                        description=attribute["Description"],
-                        subclass_of=[attribute["Parent"]],
-                        requires_dependencies=class_info["dependencies"],
-                        requires_range=class_info["range"],
-                        required=class_info["required"],
-                        validation_rules=class_info["validation_rules"],
-                    )
-                    se.edit_schema_object_nx(class_range_edit)
+                    if not builder.attribute_exists(new_class["rdfs:label"]):
+                        builder.add_schema_object(new_class, **rel_dict)
 
                 else:
-                    # the attribute is a property
-                    property_info = se.explore_property(
-                        se.get_property_label_from_display_name(attribute["Attribute"])
-                    )
-                    property_info["range"].append(
-                        se.get_class_label_from_display_name(val)
-                    )
-                    property_range_edit = get_property(
-                        se,
-                        attribute["Attribute"],
-                        property_info["domain"],
-                        description=property_info["description"],
-                        requires_dependencies=property_info["dependencies"],
-                        requires_range=property_info["range"],
-                        required=property_info["required"],
-                        validation_rules=property_info["validation_rules"],
-                    )
-                    se.edit_schema_object_nx(property_range_edit)
-
-                logger.debug(val + " added to value range")
-
-        # get validation rules for this attribute, if any are specified
-        validation_rules = attribute["Validation Rules"]
-
-        if not pd.isnull(validation_rules):
-            
-            # TODO: make validation rules delimiter configurable parameter
-           
-            validation_rules = [
-                val_rule.strip() for val_rule in validation_rules.strip().split("::")
-            ]
-
-            validate_vr = validate_schema_rules(
-                            validation_rules, 
-                            attribute["Attribute"],
-                            input_filetype = 'csv_schema')
+                    if not attribute["Attribute"] in model.all_properties:
+                        domain_attribute = attribute["Attribute"]
+                    else:
+                        # this attribute is a property, set the domain of this property to the domain class of the attribute
+                        domain_attribute = se.get_class_by_property(
+                            attribute["Attribute"]
+                        )
+                        if not domain_attribute:
+                            raise ValueError(
+                                f"Listed required dependency: {dep}, must have a class parent. "
+                                "The extension could not be added to the schema."
+                            )
 
+                    description = None
+                    new_property = get_property(
+                        se, dep, domain_attribute, description=description
+                    )
+                    # check if attribute doesn't already exist and add it
+                    if not builder.attribute_exists(new_property["rdfs:label"]):
+                        builder.add_schema_object(new_property, **rel_dict)
 
-            # update validation rules of attribute
-            # if attribute is not a property, then assume it is a class
-            if not attribute["Attribute"] in all_properties:
-                class_info = se.explore_class(
+            # update required dependencies of attribute
+            # if attribute is not a property then assume it is a class
+            if not attribute["Attribute"] in model.all_properties:
+                class_info = builder.explore_class(
                     se.get_class_label_from_display_name(attribute["Attribute"])
                 )
-                class_info["validation_rules"] = validation_rules
-                class_val_rule_edit = get_class(
+                class_info["dependencies"].append(dep_label)
+                class_dependencies_edit = get_class(
                     se,
                     attribute["Attribute"],
                     description=attribute["Description"],
@@ -545,14 +796,14 @@ def create_nx_schema_objects(
                     required=class_info["required"],
                     validation_rules=class_info["validation_rules"],
                 )
-                se.edit_schema_object_nx(class_val_rule_edit)
+                builder.edit_schema_object(class_dependencies_edit)
             else:
-                # the attribute is a property
+                # the attribute is a property then update as a property
                 property_info = se.explore_property(
                     se.get_property_label_from_display_name(attribute["Attribute"])
                 )
-                property_info["validation_rules"] = validation_rules
-                property_val_rule_edit = get_property(
+                property_info["dependencies"].append(dep_label)
+                property_dependencies_edit = get_property(
                     se,
                     attribute["Attribute"],
                     property_info["domain"],
@@ -562,157 +813,446 @@ def create_nx_schema_objects(
                     required=property_info["required"],
                     validation_rules=property_info["validation_rules"],
                 )
-                se.edit_schema_object_nx(property_val_rule_edit)
-            try:
-                logger.debug(val + "validation rules added")
-            except:
-                logger.debug("Validation rules added")
-
-        # get dependencies for this attribute, if any are specified
-        requires_dependencies = attribute["DependsOn"]
-        if not pd.isnull(requires_dependencies):
-
-            for dep in requires_dependencies.strip().split(","):
-                # check if dependency is a property or not
-                dep = dep.strip()
-                dep_is_property = dep in all_properties
-                dep_label = ""
-                # set dependency label based on kind of dependency: class or property
-                if dep_is_property:
-                    dep_label = se.get_property_label_from_display_name(dep)
-                else:
-                    dep_label = se.get_class_label_from_display_name(dep)
-
-                # check if dependency is in attributes column; add it to the list if not
-                if not dep.strip() in list(schema_extension["Attribute"]):
-                    # if dependency is a property create a new property; else create a new class
-                    if not dep_is_property:
-                        # if this attribute is not a property, set it as a parent class
-                        if not attribute["Attribute"] in all_properties:
-                            parent = attribute["Attribute"]
-                        else:
-                            # this attribute is a property, set the parent to the domain class of this attribute
-                            parent = se.get_class_by_property(attribute["Attribute"])
-                            if not parent:
-                                raise ValueError(
-                                    f"Listed required dependency: {dep}, for attribute: {attribute['Attribute']} "
-                                    "must have a class parent. The extension could not be added to the schema."
-                                )
-
-                        new_class = get_class(
-                            se, dep, description=None, subclass_of=[parent]
-                        )
-                        # se.add_schema_object_nx(new_class, **rel_dict)
-                        # check if attribute doesn't already exist and add it
-                        if not attribute_exists(se, new_class["rdfs:label"]):
-                            se.add_schema_object_nx(new_class, **rel_dict)
+                builder.edit_schema_object(property_dependencies_edit)
+
+            logger.debug(dep + " added to dependencies")
+
+        # TODO check for cycles in attribute dependencies schema subgraph
+
+    # check if the attribute requires any components
+    if not pd.isnull(attribute["DependsOn Component"]):
+        component_dependencies = attribute["DependsOn Component"]
+    else:
+        return
+
+    # iterate over potentially multiple dependency components
+    for comp_dep in component_dependencies.strip().split(","):
+
+        # check if a component is already defined as an attribute; if not define it in the schema
+        if not comp_dep.strip() in model.attribute_names:
+
+            # component is not in csv schema so try adding it as a class with a parent Thing
+            new_class = get_class(se, comp_dep, description=None)
+
+            # check if attribute doesn't already exist in schema.org schema and add it
+            # (component may not be in csv schema, but could be in the base schema we are extending)
+            if not builder.attribute_exists(new_class["rdfs:label"]):
+                builder.add_schema_object(new_class, **rel_dict)
+
+        # update this attribute requirements to include component
+        class_info = builder.explore_class(
+            se.get_class_label_from_display_name(attribute["Attribute"])
+        )
+        class_info["component_dependencies"].append(
+            se.get_class_label_from_display_name(comp_dep)
+        )
+        class_component_dependencies_edit = get_class(
+            se,
+            attribute["Attribute"],
+            description=class_info["description"],
+            subclass_of=class_info["subClassOf"],
+            requires_dependencies=class_info["dependencies"],
+            requires_range=class_info["range"],
+            validation_rules=class_info["validation_rules"],
+            requires_components=class_info["component_dependencies"],
+        )
+        builder.edit_schema_object(class_component_dependencies_edit)
+
+    logger.debug(comp_dep + " added to dependencies")
+
+    # TODO check for cycles in component dependencies schema subgraph
+
+
+def _add_schema_objects(
+    model: _CSVDataModel, builder: _SchemaBuilder
+) -> Tuple[int, List[int]]:
+    """Add the classes and properties of a data model to a schema.
+
+    Returns:
+        The number of schema records once the attributes and their properties are added, and the number of records
+        added while adding the requirements of each attribute. See _update_nx_schema_objects.
+    """
+    schema_records = builder.se.schema["@graph"]
+
+    logger.debug("Adding attributes")
+    for attribute in model.attributes:
+        _add_attribute(attribute, model, builder)
+    logger.debug("Done adding attributes")
+
+    # TODO check if schema already contains property - may require property context in csv schema definition
+
+    logger.debug("Adding and editing properties")
+    for prop in model.properties:
+        _add_properties(prop, model, builder)
+    logger.debug("Done adding properties")
+
+    # # set range values and dependency requirements for each attribute
+    # # if not already added, add each attribute in required values and dependencies to the schema extension
+    # print("Editing attributes and properties to add requirements and value ranges")
+    # print("====================================================================================")
+
+    requirements_start = len(schema_records)
+    requirements_counts = []
+    for attribute in model.attributes:
+        record_count = len(schema_records)
+        _add_attribute_requirements(attribute, model, builder)
+        requirements_counts.append(len(schema_records) - record_count)
+
+    logger.info("Done adding requirements and value ranges to attributes")
+
+    return requirements_start, requirements_counts
+
+
+def create_nx_schema_objects(
+    schema_extension: pd.DataFrame, se: SchemaExplorer
+) -> SchemaExplorer:
+    """Creates classes for all attributes and adds them to the schema.
+    Args:
+        schema_extension: a pandas dataframe containing schema definition; see example here: https://docs.google.com/spreadsheets/d/1J2brhqO4kpeHIkNytzlqrdIiRanXDr6KD2hqjOTC9hs/edit#gid=0
+        se: a schema explorer object allowing the traversal and modification of a schema graph
+        base_schema_path: a path to a json-ld file containing an existing schema
+    Returns:
+        An updated schema explorer object
+    """
+    model = _CSVDataModel(schema_extension)
+
+    # classes and properties are added to the schema in bulk; the schema graph is built once they are all added
+    builder = _SchemaBuilder(se)
+    _add_schema_objects(model, builder)
+
+    return builder.build()
+
+
+# columns of the data model CSV rows saved in the conversion cache
+_cached_row_headers = sorted(required_headers)
 
-                    else:
-                        if not attribute["Attribute"] in all_properties:
-                            domain_attribute = attribute["Attribute"]
-                        else:
-                            # this attribute is a property, set the domain of this property to the domain class of the attribute
-                            domain_attribute = se.get_class_by_property(
-                                attribute["Attribute"]
-                            )
-                            if not domain_attribute:
-                                raise ValueError(
-                                    f"Listed required dependency: {dep}, must have a class parent. "
-                                    "The extension could not be added to the schema."
-                                )
-
-                        description = None
-                        new_property = get_property(
-                            se, dep, domain_attribute, description=description
-                        )
-                        # check if attribute doesn't already exist and add it
-                        if not attribute_exists(se, new_property["rdfs:label"]):
-                            se.add_schema_object_nx(new_property, **rel_dict)
-
-                # update required dependencies of attribute
-                # if attribute is not a property then assume it is a class
-                if not attribute["Attribute"] in all_properties:
-                    class_info = se.explore_class(
-                        se.get_class_label_from_display_name(attribute["Attribute"])
-                    )
-                    class_info["dependencies"].append(dep_label)
-                    class_dependencies_edit = get_class(
-                        se,
-                        attribute["Attribute"],
-                        description=attribute["Description"],
-                        subclass_of=[attribute["Parent"]],
-                        requires_dependencies=class_info["dependencies"],
-                        requires_range=class_info["range"],
-                        required=class_info["required"],
-                        validation_rules=class_info["validation_rules"],
-                    )
-                    se.edit_schema_object_nx(class_dependencies_edit)
-                else:
-                    # the attribute is a property then update as a property
-                    property_info = se.explore_property(
-                        se.get_property_label_from_display_name(attribute["Attribute"])
-                    )
-                    property_info["dependencies"].append(dep_label)
-                    property_dependencies_edit = get_property(
-                        se,
-                        attribute["Attribute"],
-                        property_info["domain"],
-                        description=property_info["description"],
-                        requires_dependencies=property_info["dependencies"],
-                        requires_range=property_info["range"],
-                        required=property_info["required"],
-                        validation_rules=property_info["validation_rules"],
-                    )
-                    se.edit_schema_object_nx(property_dependencies_edit)
 
-                logger.debug(dep + " added to dependencies")
+def _get_cached_row(attribute: dict) -> tuple:
+    """Get the values of a row of the data model CSV, as saved in the conversion cache."""
+    # NaN is the only value that is not equal to itself
+    return tuple(
+        attribute[header] if attribute[header] == attribute[header] else None
+        for header in _cached_row_headers
+    )
 
-            # TODO check for cycles in attribute dependencies schema subgraph
 
-        # check if the attribute requires any components
-        if not pd.isnull(attribute["DependsOn Component"]):
-            component_dependencies = attribute["DependsOn Component"]
+def _get_attribute_label(
+    attribute_name: str, model: _CSVDataModel, se: SchemaExplorer
+) -> str:
+    """Get the schema label of an attribute of a data model."""
+    if attribute_name in model.all_properties:
+        return se.get_property_label_from_display_name(attribute_name)
+
+    return se.get_class_label_from_display_name(attribute_name)
+
+
+def _get_attribute_references(
+    attribute: dict, model: _CSVDataModel, se: SchemaExplorer
+) -> Tuple[Set[str], Set[str]]:
+    """Get the labels of the schema nodes a row of the data model CSV refers to.
+
+    Errs on the side of including labels: it includes all the labels the row might add to the schema, other than
+    the label of the attribute itself.
+
+    Returns:
+        The labels of the parents of the attribute, and the labels of its valid values, dependencies and component
+        dependencies (which are added to the schema as classes or properties if they do not exist yet).
+    """
+    parents = set()
+    if not pd.isnull(attribute["Parent"]):
+        parents.add(se.get_class_label_from_display_name(attribute["Parent"]))
+        for parent in attribute["Parent"].strip().split(","):
+            parents.add(se.get_class_label_from_display_name(parent))
+
+    names = []
+    range_values = attribute["Valid Values"]
+    if not pd.isnull(range_values):
+        if range_values[0] == '"':
+            names += re.findall(r'"([^"]*)"', range_values)
         else:
-            continue
+            names += range_values.strip().split(",")
 
-        # iterate over potentially multiple dependency components
-        for comp_dep in component_dependencies.strip().split(","):
+    for column in ["DependsOn", "DependsOn Component"]:
+        if not pd.isnull(attribute[column]):
+            names += attribute[column].strip().split(",")
 
-            # check if a component is already defined as an attribute; if not define it in the schema
-            if not comp_dep.strip() in list(schema_extension["Attribute"]):
+    values = set()
+    for name in names:
+        for display_name in [name, name.strip()]:
+            values.add(se.get_class_label_from_display_name(display_name))
+            values.add(se.get_property_label_from_display_name(display_name))
 
-                # component is not in csv schema so try adding it as a class with a parent Thing
-                new_class = get_class(se, comp_dep, description=None)
+    return parents, values
 
-                # check if attribute doesn't already exist in schema.org schema and add it
-                # (component may not be in csv schema, but could be in the base schema we are extending)
-                if not attribute_exists(se, new_class["rdfs:label"]):
-                    se.add_schema_object_nx(new_class, **rel_dict)
 
-            # update this attribute requirements to include component
-            class_info = se.explore_class(
-                se.get_class_label_from_display_name(attribute["Attribute"])
-            )
-            class_info["component_dependencies"].append(
-                se.get_class_label_from_display_name(comp_dep)
-            )
-            class_component_dependencies_edit = get_class(
-                se,
-                attribute["Attribute"],
-                description=class_info["description"],
-                subclass_of=class_info["subClassOf"],
-                requires_dependencies=class_info["dependencies"],
-                requires_range=class_info["range"],
-                validation_rules=class_info["validation_rules"],
-                requires_components=class_info["component_dependencies"],
+def _get_defined_labels(model: _CSVDataModel, se: SchemaExplorer) -> Counter:
+    """Count the attributes, and the properties in the Properties column, of a data model by schema label."""
+    labels = Counter(
+        _get_attribute_label(attribute["Attribute"], model, se)
+        for attribute in model.attributes
+    )
+    labels.update(
+        se.get_property_label_from_display_name(p)
+        for p in model.prop_2_class
+        if p not in model.attribute_names
+    )
+
+    return labels
+
+
+def _recompile_schema_records(
+    state: Dict[str, Any], model: _CSVDataModel, rows: List[tuple], se: SchemaExplorer
+) -> Optional[Tuple[List[dict], List[int], Counter, Counter]]:
+    """Update the schema records generated by a previous conversion of a data model, regenerating the records of
+    the rows that changed since.
+
+    This is only possible when the changes are local to the changed rows: the attributes and their properties did
+    not change, and the changed rows either refer to the same nodes as before, or the nodes they add to the schema
+    (their valid values, dependencies, etc.) are not referred to by any other row, since which row adds a node
+    first depends on the order of the rows. Only then do the records of a changed row not depend on the other rows:
+    its class / property record is regenerated by adding the row, and its properties, to an empty schema, which
+    also yields the records added with its requirements.
+
+    Args:
+        state: state saved by the previous conversion, with the same base schema; see _update_nx_schema_objects.
+        model: the data model to convert.
+        rows: the rows of the data model, see _get_cached_row.
+        se: the base schema.
+
+    Returns:
+        The schema records of the data model, the number of records added with the requirements of each row, and
+        the number of rows referring to each label as a parent / otherwise; None if the records cannot be updated
+        in place.
+    """
+    cached_rows = state["rows"]
+    if len(rows) != len(cached_rows):
+        return None
+
+    attribute_index = _cached_row_headers.index("Attribute")
+    properties_index = _cached_row_headers.index("Properties")
+
+    changed_rows = []
+    for i, (row, cached_row) in enumerate(zip(rows, cached_rows)):
+        if row == cached_row:
+            continue
+
+        if (
+            row[attribute_index] != cached_row[attribute_index]
+            or row[properties_index] != cached_row[properties_index]
+        ):
+            return None
+
+        changed_rows.append(i)
+
+    records = state["records"]
+    requirements_start = state["requirements_start"]
+    requirements_counts = state["requirements_counts"]
+    parent_counts = state["parent_counts"]
+    value_counts = state["value_counts"]
+
+    if not changed_rows:
+        return records, requirements_counts, parent_counts, value_counts
+
+    base_nodes = set(se.get_nx_schema().nodes)
+    defined_labels = state["defined_labels"]
+    # nodes that exist once the attributes and their properties are added, whatever the order of the rows
+    defined_nodes = base_nodes.union(defined_labels, state["domain_labels"])
+
+    # position of the records added with the requirements of each row
+    requirements_positions = [requirements_start]
+    for count in requirements_counts:
+        requirements_positions.append(requirements_positions[-1] + count)
+
+    parent_counts = Counter(parent_counts)
+    value_counts = Counter(value_counts)
+    # references of all rows, counting the references of the changed rows both before and after the change
+    all_parent_counts = Counter(parent_counts)
+    all_value_counts = Counter(value_counts)
+    changed_references = {}
+    for i in changed_rows:
+        attribute = model.attributes[i]
+        label = _get_attribute_label(attribute["Attribute"], model, se)
+        if defined_labels[label] != 1 or label in base_nodes:
+            return None
+
+        cached_attribute = dict(zip(_cached_row_headers, cached_rows[i]))
+        parents, values = _get_attribute_references(attribute, model, se)
+        cached_parents, cached_values = _get_attribute_references(
+            cached_attribute, model, se
+        )
+
+        # parents are added along with the attributes, and would keep a property attribute from being added
+        if (parents | cached_parents) & state["property_labels"]:
+            return None
+
+        parent_counts.subtract(cached_parents)
+        parent_counts.update(parents)
+        value_counts.subtract(cached_values)
+        value_counts.update(values)
+        all_parent_counts.update(parents - cached_parents)
+        all_value_counts.update(values - cached_values)
+
+        changed_references[i] = (
+            label,
+            (parents | cached_parents) - defined_nodes,
+            (values | cached_values) - defined_nodes,
+            parents != cached_parents or values != cached_values,
+        )
+
+    records = list(records)
+    requirements_records = {}
+    for i, (label, parents, values, references_changed) in changed_references.items():
+        cached_requirements_records = records[
+            requirements_positions[i] : requirements_positions[i + 1]
+        ]
+
+        if references_changed:
+            # whether the valid values, dependencies, etc. of the row are added to the schema must not depend on
+            # other rows; parents can be shared, since they are not added as classes
+            if any(
+                all_parent_counts[value] + all_value_counts[value]
+                > 1 + (value in parents)
+                for value in values
+            ) or any(
+                all_value_counts[parent] > (parent in values) for parent in parents
+            ):
+                return None
+
+            existing_values = set()
+        else:
+            # the same nodes are added as before: the ones among the records added with the requirements of the row
+            existing_values = values.difference(
+                record["rdfs:label"] for record in cached_requirements_records
             )
-            se.edit_schema_object_nx(class_component_dependencies_edit)
 
-        logger.debug(comp_dep + " added to dependencies")
+        positions = [
+            position
+            for position, record in enumerate(records)
+            if record["rdfs:label"] == label
+        ]
+        if len(positions) != 1 or not (
+            state["base_size"] <= positions[0] < requirements_start
+        ):
+            return None
+
+        # add the row to an empty schema, in which the nodes that exist when the row is added in a full conversion,
+        # other than its own, already exist
+        row_se = SchemaExplorer()
+        row_se.schema = {"@graph": []}
+        builder = _SchemaBuilder(
+            row_se,
+            nodes={
+                node: {}
+                for node in defined_nodes.union(existing_values)
+                if node != label
+            },
+        )
+
+        attribute = model.attributes[i]
+        _add_attribute(attribute, model, builder)
+        for prop in model.properties:
+            _add_properties(prop, model, builder, label=label)
+        _add_attribute_requirements(attribute, model, builder)
+
+        row_records = row_se.schema["@graph"]
+        records[positions[0]] = row_records[0]
+        requirements_records[i] = row_records[1:]
+
+    # splice the requirements of the changed rows into the records added with the requirements of all rows
+    requirements_counts = list(requirements_counts)
+    updated_records = records[:requirements_start]
+    position = requirements_start
+    for i, count in enumerate(requirements_counts):
+        if i in requirements_records:
+            updated_records += requirements_records[i]
+            requirements_counts[i] = len(requirements_records[i])
+        else:
+            updated_records += records[position : position + count]
+        position += count
 
-        # TODO check for cycles in component dependencies schema subgraph
+    # drop the labels that are not referred to anymore
+    return updated_records, requirements_counts, +parent_counts, +value_counts
 
-    logger.info("Done adding requirements and value ranges to attributes")
+
+def _update_nx_schema_objects(
+    schema_extension: pd.DataFrame, se: SchemaExplorer, cache_path: str
+) -> SchemaExplorer:
+    """Same as create_nx_schema_objects, but reuses the schema generated by the previous conversion of the data
+    model, saved in a conversion cache.
+
+    Only the records of the rows of the data model that changed since the previous conversion are regenerated,
+    when the changes allow it (see _recompile_schema_records); the data model is converted from scratch otherwise.
+    Either way, the state of the conversion is saved for the next one.
+
+    Args:
+        schema_extension: a pandas dataframe containing schema definition
+        se: a schema explorer object with the base schema loaded
+        cache_path: path of the conversion cache
+    Returns:
+        An updated schema explorer object
+    """
+    model = _CSVDataModel(schema_extension)
+    rows = [_get_cached_row(attribute) for attribute in model.attributes]
+
+    base_schema_hash = se.schema_hash
+    base_size = len(se.schema["@graph"])
+
+    state = load_conversion_cache(cache_path)
+    recompiled = None
+    if state is not None and state["base_schema_hash"] == base_schema_hash:
+        recompiled = _recompile_schema_records(state, model, rows, se)
+
+    if recompiled is not None:
+        logger.debug("Updated the data model records of the previous conversion.")
+        records, requirements_counts, parent_counts, value_counts = recompiled
+
+        # the graph of the updated schema is only built if it is used; exporting the schema does not need it
+        se.schema = dict(se.schema, **{"@graph": records})
+        se.schema_nx = None
+    else:
+        builder = _SchemaBuilder(se)
+        requirements_start, requirements_counts = _add_schema_objects(model, builder)
+        builder.build()
+
+        records = se.schema["@graph"]
+        parent_counts = Counter()
+        value_counts = Counter()
+        for attribute in model.attributes:
+            parents, values = _get_attribute_references(attribute, model, se)
+            parent_counts.update(parents)
+            value_counts.update(values)
+
+        state = {
+            "base_schema_hash": base_schema_hash,
+            "base_size": base_size,
+            "requirements_start": requirements_start,
+            "defined_labels": _get_defined_labels(model, se),
+            # classes in the domain of the properties
+            "domain_labels": {
+                se.get_class_label_from_display_name(attribute_name)
+                for attribute_name in model.prop_2_class.values()
+            },
+            "property_labels": {
+                se.get_property_label_from_display_name(p)
+                for p in model.attribute_names
+                if p in model.all_properties
+            },
+        }
+
+    state.update(
+        {
+            "rows": rows,
+            "records": records,
+            "requirements_counts": requirements_counts,
+            # number of rows referring to each label, see _get_attribute_references
+            "parent_counts": parent_counts,
+            "value_counts": value_counts,
+        }
+    )
+    try:
+        save_conversion_cache(cache_path, state)
+    except OSError as e:
+        logger.warning(f"Could not write the conversion cache {cache_path}: {e}")
 
     return se
 
@@ -733,13 +1273,16 @@ def _get_base_schema_path(base_schema: str = None) -> str:
 
 
 def _convert_csv_to_data_model(
-    schema_csv: str, base_schema: str = None
+    schema_csv: str, base_schema: str = None, cache_path: str = None
 ) -> SchemaExplorer:
     """Convert provided CSV spec. in CSV format to data model in JSON-LD format.
 
     Args:
         schema_csv: Path to CSV file containing data to be translated to
                     JSON-LD data model. Can be path to local CSV or URL.
+        cache_path: Path to the conversion cache of the data model. If provided,
+                    only the parts of the data model that changed since the
+                    previous conversion are regenerated, when possible.
 
     Returns:
         base_se: SchemaExplorer object which has updated properties
@@ -751,14 +1294,17 @@ def _convert_csv_to_data_model(
     # instantiate schema explorer
     base_se = SchemaExplorer()
 
-    # determine base schema path
-    base_schema_path = _get_base_schema_path(base_schema)
-
-    # load base schema (BioThings)
-    base_se.load_schema(base_schema_path)
+    if base_schema is None:
+        # load base schema (BioThings) from the copy shared by the process
+        base_se.load_default_schema()
+    else:
+        base_se.load_schema(base_schema)
 
     # call parser code that converts a dataframe of the RFC
     # specs. into a JSON-LD data model
-    base_se = create_nx_schema_objects(rfc_df, base_se)
+    if cache_path is None:
+        base_se = create_nx_schema_objects(rfc_df, base_se)
+    else:
+        base_se = _update_nx_schema_objects(rfc_df, base_se, cache_path)
 
     return base_se
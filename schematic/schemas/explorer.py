@@ -1,11 +1,14 @@
 import os
-import string
 import json
+import hashlib
 import logging
+import pickle
+import uuid
 
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any, Dict, Optional, Text, List
 
-import inflection
 import networkx as nx
 
 from rdflib import Graph, Namespace, plugin, query
@@ -13,13 +16,20 @@ from networkx.algorithms.cycles import find_cycle
 from networkx.readwrite import json_graph
 
 from schematic.utils.curie_utils import (
+    CurieResolver,
     expand_curies_in_schema,
     uri2label,
-    extract_name_from_uri_or_curie,
 )
 from schematic.utils.general import find_duplicates
-from schematic.utils.io_utils import load_default, load_json, load_schemaorg
+from schematic.utils.io_utils import (
+    load_bytes,
+    load_default,
+    load_json,
+    load_schemaorg,
+)
 from schematic.utils.schema_utils import (
+    get_class_label_from_display_name,
+    get_property_label_from_display_name,
     load_schema_into_networkx,
     node_attrs_cleanup,
     class_to_node,
@@ -32,7 +42,13 @@ from schematic.utils.validate_utils import (
     validate_property_schema,
     validate_schema,
 )
-from schematic.schemas.curie import uri2curie, curie2uri
+from schematic.schemas.class_hierarchy import ClassHierarchyIndex
+from schematic.schemas.compact_graph import CompactSchemaGraph, use_compact_graph
+from schematic.schemas.compiled_schema import CompiledSchema
+from schematic.schemas.curie import curie2uri
+from schematic.schemas.model_cache import ModelCache, get_model_cache
+from schematic.schemas.record_index import SchemaRecordIndex
+from schematic.schemas.relationship_closure import RelationshipClosure
 
 namespaces = dict(rdf=Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#"))
 
@@ -40,16 +56,182 @@ namespaces = dict(rdf=Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#"))
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_default_schema() -> bytes:
+    """Load the default (BioThings) schema and its graph once per process.
+
+    Returns:
+        Schema and graph, pickled together; this read-only snapshot is shared by the process and unpickled
+        into a private copy by every explorer that needs it.
+    """
+    schema = load_default()
+    schema_nx = load_schema_into_networkx(schema)
+
+    return pickle.dumps((schema, schema_nx), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@lru_cache(maxsize=None)
+def _get_default_schema_hash() -> str:
+    return hashlib.sha256(_get_default_schema()).hexdigest()
+
+
+def _as_configured_graph(graph):
+    """Get a data model graph in the form configured under (model > compact_graph), converting it if needed.
+
+    Args:
+        graph: networkx MultiDiGraph or CompactSchemaGraph of the data model.
+    """
+    if use_compact_graph():
+        if not isinstance(graph, CompactSchemaGraph):
+            graph = CompactSchemaGraph(graph)
+    elif isinstance(graph, CompactSchemaGraph):
+        graph = graph.to_networkx()
+
+    return graph
+
+
 class SchemaExplorer:
     """Class for exploring schema"""
 
     def __init__(self):
-        self.load_default_schema()
+        # the default schema is only loaded if the schema is accessed before another one is loaded
+        self._schema = None
+        self._schema_nx = None
+        self.compiled_schema = None
+
+        # identifies the contents of the current graph; see schema_hash
+        self._schema_hash = None
+
+        # per edge key (relationship) DiGraphs over the schema graph, built on first use
+        self._relationship_digraphs = None
+
+        # indexes over the records of the schema, built on first use
+        self._record_index = None
+
+        # ancestor index over the parentOf DiGraph, built on first use
+        self._class_hierarchy = None
+
+        # per edge key (relationship) transitive closures over the schema graph, built on first use
+        self._relationship_closures = {}
+
+        # resolution table between the @ids, names and labels of the schema, built on first use
+        self._curie_resolver = None
+
+    @property
+    def schema(self):
+        if self._schema is None and self._schema_nx is None:
+            self.load_default_schema()
+
+        return self._schema
+
+    @schema.setter
+    def schema(self, schema):
+        self._schema = schema
+        self._record_index = None
+        self._curie_resolver = None
+
+    @property
+    def schema_nx(self):
+        if self._schema is None and self._schema_nx is None:
+            self.load_default_schema()
+        elif self._schema_nx is None:
+            # the graph of a schema assigned without one is built on first use
+            self._schema_nx = load_schema_into_networkx(self._schema, self.get_curie_resolver())
+
+        return self._schema_nx
+
+    @schema_nx.setter
+    def schema_nx(self, schema_nx):
+        self._schema_nx = schema_nx
+
+        # indexes over the previous graph are stale
+        self.compiled_schema = None
+        self._relationship_digraphs = None
+        self._class_hierarchy = None
+        self._relationship_closures = {}
+        self._schema_hash = uuid.uuid4().hex
+
+    @property
+    def schema_hash(self) -> str:
+        """Identifier of the contents of the current data model graph.
+
+        The SHA-256 of the JSON-LD file the data model was loaded from; any other change to the graph (editing it,
+        or assigning a new one) sets a new random identifier. Results derived from the graph can be memoized by it.
+        """
+        if self._schema_hash is None:
+            # accessing the graph loads the default schema, and sets the hash
+            self.schema_nx
+
+        return self._schema_hash
 
     def load_schema(self, schema):
-        """Load schema and convert it to networkx graph"""
-        self.schema = load_json(schema)
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        """Load schema and convert it to networkx graph
+
+        If a data model cache is configured (model > cache), the parsed graph and its compiled index are
+        read from / written to the cache, keyed by the content of the JSON-LD file.
+        """
+        model_cache = get_model_cache()
+
+        jsonld_bytes = load_bytes(schema)
+        schema_hash = hashlib.sha256(jsonld_bytes).hexdigest()
+
+        if model_cache is None:
+            self.schema = json.loads(jsonld_bytes)
+            self._build_schema_graph()
+            self._schema_hash = schema_hash
+            return
+
+        cache_key = ModelCache.get_key(jsonld_bytes)
+
+        cached_model = model_cache.get(cache_key)
+        if cached_model is not None:
+            logger.debug(f"Loaded data model {schema} from cache.")
+            self.schema = cached_model["schema"]
+            self.schema_nx = _as_configured_graph(cached_model["schema_nx"])
+            self.compiled_schema = cached_model["compiled_schema"]
+            self._record_index = cached_model["record_index"]
+            self._relationship_digraphs = cached_model["relationship_digraphs"]
+            self._schema_hash = schema_hash
+            self._check_relationship_cycles()
+            return
+
+        self.schema = json.loads(jsonld_bytes)
+        self._build_schema_graph()
+        self._schema_hash = schema_hash
+
+        try:
+            model_cache.set(
+                cache_key,
+                {
+                    "schema": self.schema,
+                    "schema_nx": self.schema_nx,
+                    "compiled_schema": self.compiled_schema,
+                    "record_index": self._get_record_index(),
+                    "relationship_digraphs": self._get_relationship_digraphs(),
+                },
+            )
+        except OSError as e:
+            logger.warning(f"Could not write data model {schema} to cache: {e}")
+
+    def _build_schema_graph(self):
+        """Convert the loaded schema to networkx graph and compile its index"""
+        self.schema_nx = _as_configured_graph(
+            load_schema_into_networkx(self.schema, self.get_curie_resolver())
+        )
+        self.compiled_schema = CompiledSchema(self.schema_nx, self.get_curie_resolver())
+        self._check_relationship_cycles()
+
+    def _check_relationship_cycles(self):
+        """Report cycles in the component and dependency relationships of the loaded schema.
+
+        Nodes on such a cycle cannot be ordered, so components whose requirements include them cannot be used to
+        generate or validate manifests.
+        """
+        for relationship in ["requiresComponent", "requiresDependency"]:
+            for cycle in self._get_relationship_closure(relationship).cycles:
+                logger.warning(
+                    f"The data model has a cycle of {relationship} relationships between: {', '.join(cycle)}"
+                )
 
     def export_schema(self, file_path):
         with open(file_path, "w",encoding="utf8") as f:
@@ -57,12 +239,156 @@ class SchemaExplorer:
 
     def load_default_schema(self):
         """Load default schema, either schema.org or biothings"""
-        self.schema = load_default()
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.schema, self.schema_nx = pickle.loads(_get_default_schema())
+        self._schema_hash = _get_default_schema_hash()
 
     def get_nx_schema(self):
         return self.schema_nx
 
+    def _get_networkx_graph(self) -> nx.MultiDiGraph:
+        """Get the schema graph as a networkx graph, exported on demand if the graph is a CompactSchemaGraph."""
+        if isinstance(self.schema_nx, CompactSchemaGraph):
+            return self.schema_nx.to_networkx()
+
+        return self.schema_nx
+
+    def _get_editable_graph(self) -> nx.MultiDiGraph:
+        """Get the schema graph to edit it in place; a CompactSchemaGraph is read-only, so it is replaced by a networkx
+        graph with the same contents first.
+        """
+        if isinstance(self.schema_nx, CompactSchemaGraph):
+            # same contents, so the indexes over the graph are still valid
+            self._schema_nx = self._schema_nx.to_networkx()
+
+        return self._schema_nx
+
+    def get_compiled_schema(self) -> CompiledSchema:
+        """Get the compiled index of the current data model graph.
+
+        The index is built when a schema is loaded, and rebuilt on first use after the graph has been edited.
+        """
+        if self.compiled_schema is None:
+            self.compiled_schema = CompiledSchema(self.schema_nx, self.get_curie_resolver())
+
+        return self.compiled_schema
+
+    def _get_record_index(self) -> SchemaRecordIndex:
+        """Get the indexes over the records of the schema.
+
+        The indexes are built the first time they are needed, and kept in sync by the methods of this class that
+        add or replace records afterwards.
+        """
+        if self._record_index is None:
+            self._record_index = SchemaRecordIndex(self.schema["@graph"])
+
+        return self._record_index
+
+    def get_curie_resolver(self) -> CurieResolver:
+        """Get the resolution table between the @ids, names and labels of the schema, built the first time it is
+        needed.
+        """
+        if self._curie_resolver is None:
+            self._curie_resolver = CurieResolver(self.schema.get("@context"), self.schema["@graph"])
+
+        return self._curie_resolver
+
+    def _append_record(self, record: dict) -> None:
+        """Append a record to the schema."""
+        self._get_record_index().append(record)
+        if self._curie_resolver is not None:
+            self._curie_resolver.add_record(record)
+        self.schema["@graph"].append(record)
+
+    def _replace_record(self, position: int, record: dict) -> None:
+        """Replace the record at a given position of the schema."""
+        self._get_record_index().replace(position, self.schema["@graph"][position], record)
+        if self._curie_resolver is not None:
+            self._curie_resolver.remove_record(self.schema["@graph"][position])
+            self._curie_resolver.add_record(record)
+        self.schema["@graph"][position] = record
+
+    def _get_relationship_digraphs(self) -> Dict[str, nx.DiGraph]:
+        """Get the DiGraphs induced on the edges of each edge key (relationship) in the schema graph.
+
+        The DiGraphs are built in a single pass over the schema graph the first time they are needed, and are kept in
+        sync by add_schema_object_nx / edit_schema_object_nx afterwards.
+        """
+        if self._relationship_digraphs is None:
+            rel_edges = defaultdict(list)
+            for (u, v, key) in self.schema_nx.edges(keys=True):
+                rel_edges[key].append((u, v))
+
+            relationship_digraphs = {}
+            for key, edges in rel_edges.items():
+                digraph = nx.DiGraph()
+                digraph.add_edges_from(edges)
+                relationship_digraphs[key] = digraph
+
+            self._relationship_digraphs = relationship_digraphs
+
+        return self._relationship_digraphs
+
+    def _get_relationship_digraph(self, relationship: str) -> nx.DiGraph:
+        """Get the (shared, cached) DiGraph on edges of a given relationship; must not be modified by callers."""
+        relationship_digraphs = self._get_relationship_digraphs()
+
+        if relationship not in relationship_digraphs:
+            relationship_digraphs[relationship] = nx.DiGraph()
+
+        return relationship_digraphs[relationship]
+
+    def _update_relationship_digraphs(self, node: str) -> None:
+        """Update the relationship DiGraphs after the edges of a node have been modified in the schema graph.
+
+        Args:
+            node: the node whose in and out edges have changed.
+        """
+        if self._relationship_digraphs is None or node not in self.schema_nx:
+            # not built yet, or nothing to update
+            return
+
+        out_nodes = defaultdict(list)
+        for (_, v, key) in self.schema_nx.out_edges(node, keys=True):
+            out_nodes[key].append(v)
+
+        in_nodes = defaultdict(list)
+        for (u, _, key) in self.schema_nx.in_edges(node, keys=True):
+            in_nodes[key].append(u)
+
+        for relationship in set(self._relationship_digraphs) | set(out_nodes) | set(in_nodes):
+            digraph = self._get_relationship_digraph(relationship)
+
+            former_neighbors = []
+            if node in digraph:
+                former_neighbors = list(digraph.successors(node)) + list(digraph.predecessors(node))
+                digraph.remove_node(node)
+
+            digraph.add_edges_from((node, v) for v in out_nodes[relationship])
+            digraph.add_edges_from((u, node) for u in in_nodes[relationship])
+
+            # a DiGraph built from the schema graph only contains nodes that have edges of its relationship
+            for neighbor in former_neighbors:
+                if neighbor in digraph and digraph.degree(neighbor) == 0:
+                    digraph.remove_node(neighbor)
+
+    def _get_class_hierarchy(self) -> ClassHierarchyIndex:
+        """Get the ancestor index over the parentOf DiGraph; built on first use, and rebuilt after the graph is edited."""
+        if self._class_hierarchy is None:
+            self._class_hierarchy = ClassHierarchyIndex(self._get_relationship_digraph("parentOf"))
+
+        return self._class_hierarchy
+
+    def _get_relationship_closure(self, relationship: str) -> RelationshipClosure:
+        """Get the transitive closure of the edges of a given relationship; built on first use for each version of the
+        schema graph.
+        """
+        if relationship not in self._relationship_closures:
+            self._relationship_closures[relationship] = RelationshipClosure(
+                (u, v) for (u, v, key) in self.schema_nx.edges(keys=True) if key == relationship
+            )
+
+        return self._relationship_closures[relationship]
+
     def get_edges_by_relationship(
         self, class_label: str, relationship: str
     ) -> List[str]:
@@ -78,15 +404,15 @@ class SchemaExplorer:
         Returns:
             List of edges that are connected to the node.
         """
-        edges = []
+        if class_label not in self.schema_nx:
+            raise nx.NetworkXError(f"The node {class_label} is not in the graph.")
 
-        mm_graph = self.get_nx_schema()
+        digraph = self._get_relationship_digraph(relationship)
 
-        for (u, v, key, c) in mm_graph.out_edges(node, data=True, keys=True):
-            if key == relationship:
-                edges.append((u, v))
+        if class_label not in digraph:
+            return []
 
-        return edges
+        return [(class_label, v) for v in digraph.successors(class_label)]
 
     def get_descendants_by_edge_type(
         self,
@@ -111,22 +437,35 @@ class SchemaExplorer:
         """
         mm_graph = self.get_nx_schema()
 
-        # if mm_graph.has_node(source_node):
-        # get all nodes that are reachable from a specified root /source node in the data model
+        if source_node not in mm_graph:
+            raise nx.NetworkXError(f"The node {source_node} is not in the graph.")
+
+        if connected:
+            # nodes reachable from the source node through edges of the relationship are looked up in the closure of
+            # the relationship, computed once per version of the graph
+            closure = self._get_relationship_closure(relationship)
+
+            descendants = closure.get_descendants(source_node)
+            if not descendants:
+                # return empty list if there are no nodes that are reachable from the source node based on this relationship type
+                return []
+
+            if ordered:
+                # ordered the way nx.topological_sort orders them; raises if there is a cycle among them
+                return closure.get_ordered_descendants(source_node)
 
+            return [source_node] + descendants
+
+        # get all nodes that are reachable from a specified root /source node in the data model
         root_descendants = nx.descendants(mm_graph, source_node)
-        # else:
-        # print("The specified source node could not be found im the Networkx graph.")
-        # return []
 
-        subgraph_nodes = list(root_descendants)
-        subgraph_nodes.append(source_node)
-        descendants_subgraph = mm_graph.subgraph(subgraph_nodes)
+        subgraph_nodes = set(root_descendants)
+        subgraph_nodes.add(source_node)
 
-        # prune the descendants subgraph so as to include only those edges that match the relationship type
+        # prune the edges between these nodes so as to include only those edges that match the relationship type
         rel_edges = []
-        for (u, v, key, c) in descendants_subgraph.edges(data=True, keys=True):
-            if key == relationship:
+        for (u, v, key) in mm_graph.out_edges(subgraph_nodes, keys=True):
+            if key == relationship and v in subgraph_nodes:
                 rel_edges.append((u, v))
 
         relationship_subgraph = nx.DiGraph()
@@ -138,23 +477,7 @@ class SchemaExplorer:
             # return empty list if there are no nodes that are reachable from the source node based on this relationship type
             return []
 
-        if connected and ordered:
-            # get the set of reachable nodes from the source node
-            descendants = nx.descendants(relationship_subgraph, source_node)
-            descendants.add(source_node)
-
-            # normally, the descendants from a node are unordered (peculiarity of nx descendants call)
-            # form the subgraph on descendants and order it topologically
-            # this assumes an acyclic subgraph
-            descendants = nx.topological_sort(
-                relationship_subgraph.subgraph(descendants)
-            )
-        elif connected:
-            # get the nodes that are reachable from a given source node
-            # after the pruning process above some nodes in the root_descendants subgraph might have become disconnected and will be omitted
-            descendants = nx.descendants(relationship_subgraph, source_node)
-            descendants.add(source_node)
-        elif ordered:
+        if ordered:
             # sort the nodes topologically
             # this requires the graph to be an acyclic graph
             descendants = nx.topological_sort(relationship_subgraph)
@@ -173,15 +496,15 @@ class SchemaExplorer:
         Returns:
             List of nodes that are adjacent to the given node.
         """
-        nodes = set()
+        if node not in self.schema_nx:
+            raise nx.NetworkXError(f"The node {node} is not in the graph.")
 
-        mm_graph = self.get_nx_schema()
+        digraph = self._get_relationship_digraph(relationship)
 
-        for (u, v, key, c) in mm_graph.out_edges(node, data=True, keys=True):
-            if key == relationship:
-                nodes.add(v)
+        if node not in digraph:
+            return []
 
-        return list(nodes)
+        return list(digraph.successors(node))
 
     def is_class_in_schema(self, class_label):
         if self.schema_nx.nodes[class_label]:
@@ -195,7 +518,7 @@ class SchemaExplorer:
 
     def sub_schema_graph(self, source, direction, size=None):
         if direction == "down":
-            edges = list(nx.edge_bfs(self.schema_nx, [source]))
+            edges = list(nx.edge_bfs(self._get_networkx_graph(), [source]))
             return visualize(edges, size=size)
         elif direction == "up":
             paths = self.find_parent_classes(source)
@@ -207,49 +530,34 @@ class SchemaExplorer:
             return visualize(edges, size=size)
         elif direction == "both":
             paths = self.find_parent_classes(source)
-            edges = list(nx.edge_bfs(self.schema_nx, [source]))
+            edges = list(nx.edge_bfs(self._get_networkx_graph(), [source]))
             for _path in paths:
                 _path.append(source)
                 for i in range(0, len(_path) - 1):
                     edges.append((_path[i], _path[i + 1]))
             return visualize(edges, size=size)
 
-    def find_parent_classes(self, schema_class):
-        """Find all parents of the class"""
+    def find_parent_classes(self, schema_class, max_paths=None):
+        """Find all parents of the class
 
-        digraph = self.get_digraph_by_edge_type("parentOf")
+        Args:
+            schema_class: label of the class.
+            max_paths: if set, at most this many paths are returned.
 
-        root_node = list(nx.topological_sort(digraph))[0]
-        # root_node = list(nx.topological_sort(self.schema_nx))[0]
+        Returns:
+            Paths of parent classes (parentOf edges) from the roots of the class hierarchy down to the class, the class
+            excluded.
+        """
+        if schema_class not in self.schema_nx:
+            raise nx.NodeNotFound(f"target node {schema_class} not in graph")
 
-        paths = nx.all_simple_paths(
-            self.schema_nx, source=root_node, target=schema_class
-        )
-        # print(root_node)
-        return [_path[:-1] for _path in paths]
+        return self._get_class_hierarchy().get_paths(schema_class, max_paths=max_paths)
 
     def find_class_specific_properties(self, schema_class):
         """Find properties specifically associated with a given class"""
         schema_uri = self.schema_nx.nodes[schema_class]["uri"]
-        properties = []
-        for record in self.schema["@graph"]:
-            if record["@type"] == "rdf:Property":
-                if (
-                    type(record["schema:domainIncludes"]) == dict
-                    and record["schema:domainIncludes"]["@id"] == schema_uri
-                ):
-                    properties.append(record["rdfs:label"])
-                elif (
-                    type(record["schema:domainIncludes"]) == list
-                    and [
-                        item
-                        for item in record["schema:domainIncludes"]
-                        if item["@id"] == schema_uri
-                    ]
-                    != []
-                ):
-                    properties.append(record["rdfs:label"])
-        return properties
+
+        return self._get_record_index().get_domain_properties(schema_uri)
 
     def find_all_class_properties(self, schema_class, display_as_table=False):
         """Find all properties associated with a given class
@@ -301,21 +609,16 @@ class SchemaExplorer:
         """Find where a given class is used as a value of a property"""
         usages = []
         schema_uri = self.schema_nx.nodes[schema_class]["uri"]
-        for record in self.schema["@graph"]:
+        for position in self._get_record_index().get_range_property_positions(schema_uri):
+            record = self.schema["@graph"][position]
             usage = {}
-            if record["@type"] == "rdf:Property":
-                if "schema:rangeIncludes" in record:
-                    p_range = dict2list(record["schema:rangeIncludes"])
-                    for _doc in p_range:
-                        if _doc["@id"] == schema_uri:
-                            usage["property"] = record["rdfs:label"]
-                            p_domain = dict2list(record["schema:domainIncludes"])
-                            usage["property_used_on_class"] = unlist(
-                                [self.uri2label(record["@id"]) for record in p_domain]
-                            )
-                            usage["description"] = record["rdfs:comment"]
-            if usage:
-                usages.append(usage)
+            usage["property"] = record["rdfs:label"]
+            p_domain = dict2list(record["schema:domainIncludes"])
+            usage["property_used_on_class"] = unlist(
+                [self.uri2label(record["@id"]) for record in p_domain]
+            )
+            usage["description"] = record["rdfs:comment"]
+            usages.append(usage)
         return usages
 
     def find_child_classes(self, schema_class):
@@ -328,6 +631,8 @@ class SchemaExplorer:
 
     def explore_class(self, schema_class):
         """Find details about a specific schema class"""
+        get_name = self.get_curie_resolver().get_name
+
         parents = []
         if "subClassOf" in self.schema_nx.nodes[schema_class]:
             schema_node_val = self.schema_nx.nodes[schema_class]["subClassOf"]
@@ -339,7 +644,7 @@ class SchemaExplorer:
                 parents_list = schema_node_val
 
             for parent in parents_list:
-                parents.append(extract_name_from_uri_or_curie(parent["@id"]))
+                parents.append(get_name(parent["@id"]))
 
         requires_range = []
         if "rangeIncludes" in self.schema_nx.nodes[schema_class]:
@@ -355,7 +660,7 @@ class SchemaExplorer:
 
             for range_class in subclass_list:
                 requires_range.append(
-                    extract_name_from_uri_or_curie(range_class["@id"])
+                    get_name(range_class["@id"])
                 )
 
         requires_dependencies = []
@@ -372,7 +677,7 @@ class SchemaExplorer:
 
             for dep_class in subclass_list:
                 requires_dependencies.append(
-                    extract_name_from_uri_or_curie(dep_class["@id"])
+                    get_name(dep_class["@id"])
                 )
 
         requires_components = []
@@ -389,7 +694,7 @@ class SchemaExplorer:
 
             for comp_dep_class in subclass_list:
                 requires_components.append(
-                    extract_name_from_uri_or_curie(comp_dep_class["@id"])
+                    get_name(comp_dep_class["@id"])
                 )
 
         required = False
@@ -437,107 +742,80 @@ class SchemaExplorer:
 
     def get_property_label_from_display_name(self, display_name, strict_camel_case = False):
         """Convert a given display name string into a proper property label string"""
-        """
-        label = ''.join(x.capitalize() or ' ' for x in display_name.split(' '))
-        label = label[:1].lower() + label[1:] if label else ''
-        """
-        # This is the newer more strict method
-        if strict_camel_case:
-            display_name = display_name.strip().translate({ord(c): "_" for c in string.whitespace})
-            label = inflection.camelize(display_name, uppercase_first_letter=False)
-
-        # This method remains for backwards compatibility
-        else:
-            display_name = display_name.translate({ord(c): None for c in string.whitespace})
-            label = inflection.camelize(display_name.strip(), uppercase_first_letter=False)
-
-        return label
+        return get_property_label_from_display_name(display_name, strict_camel_case)
 
     def get_class_label_from_display_name(self, display_name, strict_camel_case = False):
         """Convert a given display name string into a proper class label string"""
-        """
-        label = ''.join(x.capitalize() or ' ' for x in display_name.split(' '))"""
-        # This is the newer more strict method
-        if strict_camel_case:
-            display_name = display_name.strip().translate({ord(c): "_" for c in string.whitespace})
-            label = inflection.camelize(display_name, uppercase_first_letter=True)
-
-        # This method remains for backwards compatibility
-        else:
-            display_name = display_name.translate({ord(c): None for c in string.whitespace})
-            label = inflection.camelize(display_name.strip(), uppercase_first_letter=True)
-
-        return label
+        return get_class_label_from_display_name(display_name, strict_camel_case)
 
     def get_class_by_property(self, property_display_name):
         schema_property = self.get_property_label_from_display_name(
             property_display_name
         )
 
-        for record in self.schema["@graph"]:
-            if record["@type"] == "rdf:Property":
-                if record["rdfs:label"] == schema_property:
-                    p_domain = dict2list(record["schema:domainIncludes"])
-                    return unlist(
-                        [
-                            self.uri2label(schema_class["@id"])
-                            for schema_class in p_domain
-                        ]
-                    )
+        position = self._get_record_index().get_property_position(schema_property)
+        if position is None:
+            return None
 
-        return None
+        record = self.schema["@graph"][position]
+        p_domain = dict2list(record["schema:domainIncludes"])
+        return unlist(
+            [self.uri2label(schema_class["@id"]) for schema_class in p_domain]
+        )
 
     def uri2label(self, uri):
-        return uri.split(":")[1]
+        """Get the label of the record with a given @id; the name in the @id if the schema has no such record."""
+        curie_resolver = self.get_curie_resolver()
+        label = curie_resolver.get_label(uri)
+
+        return label if label is not None else curie_resolver.get_name(uri)
 
     def explore_property(self, schema_property):
         """Find details about a specific property
         TODO: refactor so that explore class and explore property reuse logic - they are *very* similar
         """
         property_info = {}
-        for record in self.schema["@graph"]:
-            if record["@type"] == "rdf:Property":
-                if record["rdfs:label"] == schema_property:
-                    property_info["id"] = record["rdfs:label"]
-                    property_info["description"] = record["rdfs:comment"]
-                    property_info["uri"] = curie2uri(record["@id"], namespaces)
-
-                    p_domain = dict2list(record["schema:domainIncludes"])
-                    property_info["domain"] = unlist(
-                        [self.uri2label(record["@id"]) for record in p_domain]
-                    )
-                    if "schema:rangeIncludes" in record:
-                        p_range = dict2list(record["schema:rangeIncludes"])
-                        property_info["range"] = [
-                            self.uri2label(record["@id"]) for record in p_range
-                        ]
-                    else:
-                        property_info["range"] = []
-
-                    if "sms:required" in record:
-                        if "sms:true" == record["sms:required"]:
-                            property_info["required"] = True
-                        else:
-                            property_info["required"] = False
-
-                    validation_rules = []
-                    if "sms:validationRules" in record:
-                        property_info["validation_rules"] = record[
-                            "sms:validationRules"
-                        ]
-
-                    if "sms:requiresDependency" in record:
-                        p_dependencies = dict2list(record["sms:requiresDependency"])
-                        property_info["dependencies"] = [
-                            self.uri2label(record["@id"]) for record in p_dependencies
-                        ]
-                    else:
-                        property_info["dependencies"] = []
+        position = self._get_record_index().get_property_position(schema_property)
+        if position is not None:
+            record = self.schema["@graph"][position]
 
-                    if "sms:displayName" in record:
-                        property_info["displayName"] = record["sms:displayName"]
+            property_info["id"] = record["rdfs:label"]
+            property_info["description"] = record["rdfs:comment"]
+            property_info["uri"] = curie2uri(record["@id"], namespaces)
 
-                    break
+            p_domain = dict2list(record["schema:domainIncludes"])
+            property_info["domain"] = unlist(
+                [self.uri2label(record["@id"]) for record in p_domain]
+            )
+            if "schema:rangeIncludes" in record:
+                p_range = dict2list(record["schema:rangeIncludes"])
+                property_info["range"] = [
+                    self.uri2label(record["@id"]) for record in p_range
+                ]
+            else:
+                property_info["range"] = []
+
+            if "sms:required" in record:
+                if "sms:true" == record["sms:required"]:
+                    property_info["required"] = True
+                else:
+                    property_info["required"] = False
+
+            if "sms:validationRules" in record:
+                property_info["validation_rules"] = record[
+                    "sms:validationRules"
+                ]
+
+            if "sms:requiresDependency" in record:
+                p_dependencies = dict2list(record["sms:requiresDependency"])
+                property_info["dependencies"] = [
+                    self.uri2label(record["@id"]) for record in p_dependencies
+                ]
+            else:
+                property_info["dependencies"] = []
+
+            if "sms:displayName" in record:
+                property_info["displayName"] = record["sms:displayName"]
 
         # check if properties are added multiple times
 
@@ -574,46 +852,44 @@ class SchemaExplorer:
 
     def edit_class(self, class_info):
         """Edit an existing class into schema"""
-        for i, schema_class in enumerate(self.schema["@graph"]):
-            if schema_class["rdfs:label"] == class_info["rdfs:label"]:
-                validate_class_schema(class_info)  # why are we doing this in a loop?
+        position = self._get_record_index().get_position(class_info["rdfs:label"])
+        if position is not None:
+            validate_class_schema(class_info)
 
-                self.schema["@graph"][i] = class_info
-                break
+            self._replace_record(position, class_info)
 
         # TODO: do we actually need to validate the entire schema if a class is just edited and the class passes validation?
         # validate_schema(self.schema)
 
         logger.info(f"Edited the class {class_info['rdfs:label']} successfully.")
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.schema_nx = load_schema_into_networkx(self.schema, self.get_curie_resolver())
 
     def update_class(self, class_info):
         """Add a new class into schema"""
         # print(class_info)
         validate_class_schema(class_info)
-        self.schema["@graph"].append(class_info)
+        self._append_record(class_info)
         validate_schema(self.schema)
         logger.info(f"Updated the class {class_info['rdfs:label']} successfully.")
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.schema_nx = load_schema_into_networkx(self.schema, self.get_curie_resolver())
 
     def edit_property(self, property_info):
         """Edit an existing property into schema"""
-        for i, schema_property in enumerate(self.schema["@graph"]):
-            if schema_property["rdfs:label"] == property_info["rdfs:label"]:
-                validate_property_schema(property_info)
-                self.schema["@graph"][i] = property_info
+        position = self._get_record_index().get_position(property_info["rdfs:label"])
+        if position is not None:
+            validate_property_schema(property_info)
+            self._replace_record(position, property_info)
 
-                # TODO: check if properties are added/edited multiple times (e.g. look at explore_property)
-                break
+            # TODO: check if properties are added/edited multiple times (e.g. look at explore_property)
 
         validate_schema(self.schema)
         logger.info(f"Edited the property {property_info['rdfs:label']} successfully.")
-        self.schema_nx = load_schema_into_networkx(self.schema)
+        self.schema_nx = load_schema_into_networkx(self.schema, self.get_curie_resolver())
 
     def update_property(self, property_info):
         """Add a new property into schema"""
         validate_property_schema(property_info)
-        self.schema["@graph"].append(property_info)
+        self._append_record(property_info)
         validate_schema(self.schema)
         logger.info(f"Updated the property {property_info['rdfs:label']} successfully.")
 
@@ -638,24 +914,19 @@ class SchemaExplorer:
         return all_ancestors
 
     def get_digraph_by_edge_type(self, edge_type):
+        """Get a read-only view of the directed graph on edges of a given type (relationship).
 
-        multi_digraph = self.schema_nx
-
-        digraph = nx.DiGraph()
-        for (u, v, key, c) in multi_digraph.edges(data=True, keys=True):
-            if key == edge_type:
-                digraph.add_edge(u, v)
-
-        # print(nx.find_cycle(digraph, orientation = "ignore"))
-
-        return digraph
+        Use `.copy()` on the result to get a graph that can be modified.
+        """
+        return self._get_relationship_digraph(edge_type).copy(as_view=True)
 
     # version of edit_class() method that directly acts on the networkx graph
     def edit_schema_object_nx(self, schema_object: dict) -> None:
         node_to_replace = class_to_node(class_to_convert=schema_object)
 
         # get the networkx graph associated with the SchemaExplorer object in its current state
-        schema_graph_nx = self.get_nx_schema()
+        schema_graph_nx = self._get_editable_graph()
+        get_name = self.get_curie_resolver().get_name
 
         # outer loop to loop over all the nodes in the graph constructed from master schema
         for node, data in schema_graph_nx.nodes(data=True):
@@ -719,7 +990,7 @@ class SchemaExplorer:
                                 # there are certain nodes which have "subClassOf" data in list format
                                 if type(data["subClassOf"]) == list:
                                     for _edges_to_replace in data["subClassOf"]:
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             _edges_to_replace["@id"]
                                         )
 
@@ -736,7 +1007,7 @@ class SchemaExplorer:
                                 # there are certain nodes which have "subClassOf" data in dict format
                                 elif type(data["subClassOf"]) == dict:
                                     for k_id, v_curie in data["subClassOf"].items():
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             v_curie
                                         )
 
@@ -753,7 +1024,7 @@ class SchemaExplorer:
                         parents = replace_data["subClassOf"]
                         if type(parents) == list:
                             for _parent in parents:
-                                target_node = extract_name_from_uri_or_curie(
+                                target_node = get_name(
                                     _parent["@id"]
                                 )
 
@@ -766,7 +1037,7 @@ class SchemaExplorer:
                                     )
                         elif type(parents) == dict:
                             for _k_parent, _v_parent in parents.items():
-                                target_node = extract_name_from_uri_or_curie(_v_parent)
+                                target_node = get_name(_v_parent)
 
                                 # label to be associated with "subClassOf" keys is "parentOf"
                                 if target_node != replace_node:
@@ -792,7 +1063,7 @@ class SchemaExplorer:
                                 # there are certain nodes which have "requiresDependency" data in list format
                                 if type(data["requiresDependency"]) == list:
                                     for _edges_to_replace in data["requiresDependency"]:
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             _edges_to_replace["@id"]
                                         )
 
@@ -810,7 +1081,7 @@ class SchemaExplorer:
                                     for k_id, v_curie in data[
                                         "requiresDependency"
                                     ].items():
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             v_curie
                                         )
 
@@ -826,7 +1097,7 @@ class SchemaExplorer:
                             deps = replace_data["requiresDependency"]
                             if type(deps) == list:
                                 for _dep in deps:
-                                    target_node = extract_name_from_uri_or_curie(
+                                    target_node = get_name(
                                         _dep["@id"]
                                     )
 
@@ -840,7 +1111,7 @@ class SchemaExplorer:
                                         )
                             elif type(deps) == dict:
                                 for _k_dep, _v_dep in deps.items():
-                                    target_node = extract_name_from_uri_or_curie(_v_dep)
+                                    target_node = get_name(_v_dep)
 
                                     if target_node != replace_node:
 
@@ -863,7 +1134,7 @@ class SchemaExplorer:
                                 # there are certain nodes which have "requiresComponent" data in list format
                                 if type(data["requiresComponent"]) == list:
                                     for _edges_to_replace in data["requiresComponent"]:
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             _edges_to_replace["@id"]
                                         )
 
@@ -880,7 +1151,7 @@ class SchemaExplorer:
                                     for k_id, v_curie in data[
                                         "requiresComponent"
                                     ].items():
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             v_curie
                                         )
 
@@ -896,7 +1167,7 @@ class SchemaExplorer:
                         comps = replace_data["requiresComponent"]
                         if type(comps) == list:
                             for _comp in comps:
-                                target_node = extract_name_from_uri_or_curie(
+                                target_node = get_name(
                                     _comp["@id"]
                                 )
 
@@ -908,7 +1179,7 @@ class SchemaExplorer:
                                     )
                         elif type(comps) == dict:
                             for _k_comp, _v_comp in deps.items():
-                                target_node = extract_name_from_uri_or_curie(_v_comp)
+                                target_node = get_name(_v_comp)
 
                                 if target_node != replace_node:
 
@@ -931,7 +1202,7 @@ class SchemaExplorer:
                                 # there are certain nodes which have "rangeIncludes" data in list format
                                 if type(data["rangeIncludes"]) == list:
                                     for _edges_to_replace in data["rangeIncludes"]:
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             _edges_to_replace["@id"]
                                         )
 
@@ -945,7 +1216,7 @@ class SchemaExplorer:
 
                                 elif type(data["rangeIncludes"]) == dict:
                                     for k_id, v_curie in data["rangeIncludes"].items():
-                                        edge_repl = extract_name_from_uri_or_curie(
+                                        edge_repl = get_name(
                                             v_curie
                                         )
 
@@ -960,7 +1231,7 @@ class SchemaExplorer:
                         range_inc = replace_data["rangeIncludes"]
                         if type(range_inc) == list:
                             for _rinc in range_inc:
-                                target_node = extract_name_from_uri_or_curie(
+                                target_node = get_name(
                                     _rinc["@id"]
                                 )
 
@@ -970,7 +1241,7 @@ class SchemaExplorer:
                                     )
                         elif type(range_inc) == dict:
                             for _k_rinc, _v_rinc in deps.items():
-                                target_node = extract_name_from_uri_or_curie(_v_rinc)
+                                target_node = get_name(_v_rinc)
 
                                 if target_node != replace_node:
 
@@ -983,18 +1254,35 @@ class SchemaExplorer:
                             "rangeIncludes"
                         ] = node_to_replace.nodes[replace_node]["rangeIncludes"]
 
-        # set the networkx schema graph to the the modified networkx schema
-        self.schema_nx = schema_graph_nx
+        # the graph was modified in place: update the indexes over it
+        self.compiled_schema = None
+        self._class_hierarchy = None
+        self._relationship_closures = {}
+        self._schema_hash = uuid.uuid4().hex
+        self._update_relationship_digraphs(schema_object["rdfs:label"])
 
         # print("Added node {} to the graph successfully.".format(schema_object["rdfs:label"]))
 
         # part of the code that replaces the modified class in the original JSON-LD schema (not in the data/ folder though)
-        for i, schema_class in enumerate(self.schema["@graph"]):
-            if schema_class["rdfs:label"] == schema_object["rdfs:label"]:
-                # validate_class_schema(schema_object)    # validate that the class to be modified follows the structure for any generic class (node)
+        self.edit_schema_record(schema_object)
 
-                self.schema["@graph"][i] = schema_object
-                break
+    def edit_schema_record(self, schema_object: dict) -> None:
+        """Replace the class or property with the same label in the JSON-LD schema, without updating the networkx graph.
+
+        Callers are responsible for updating (or rebuilding) the graph, see edit_schema_object_nx.
+        """
+        position = self._get_record_index().get_position(schema_object["rdfs:label"])
+        if position is not None:
+            # validate_class_schema(schema_object)    # validate that the class to be modified follows the structure for any generic class (node)
+
+            self._replace_record(position, schema_object)
+
+    def add_schema_record(self, schema_object: dict) -> None:
+        """Add a class or property to the JSON-LD schema, without updating the networkx graph.
+
+        Callers are responsible for updating (or rebuilding) the graph, see add_schema_object_nx.
+        """
+        self._append_record(schema_object)
 
     # version of update_class() method that directly acts on the networkx graph
     def add_schema_object_nx(self, schema_object: dict, **kwargs: dict) -> None:
@@ -1015,19 +1303,25 @@ class SchemaExplorer:
         node["description"] = schema_object["rdfs:comment"]
 
         # get the networkx graph associated with the SchemaExplorer object in its current state
-        schema_graph_nx = self.get_nx_schema()
+        schema_graph_nx = self._get_editable_graph()
 
         # add node to graph
         schema_graph_nx.add_node(schema_object["rdfs:label"], **node)
 
-        schema_graph_nx = relationship_edges(schema_graph_nx, schema_object, **kwargs)
+        schema_graph_nx = relationship_edges(
+            schema_graph_nx, schema_object, curie_resolver=self.get_curie_resolver(), **kwargs
+        )
 
-        # set the networkx schema graph to the the modified networkx schema
-        self.schema_nx = schema_graph_nx
+        # the graph was modified in place: update the indexes over it
+        self.compiled_schema = None
+        self._class_hierarchy = None
+        self._relationship_closures = {}
+        self._schema_hash = uuid.uuid4().hex
+        self._update_relationship_digraphs(schema_object["rdfs:label"])
 
         # print("Edited node {} successfully.".format(schema_object["rdfs:label"]))
 
         # update the JSON-LD schema after modifying the networkx graph
         # validate_class_schema(schema_object)
-        self.schema["@graph"].append(schema_object)
+        self.add_schema_record(schema_object)
         # validate_schema(self.schema)
@@ -2,11 +2,13 @@ import gc
 import os
 import json
 import logging
+from collections import deque
 from typing import Any, Dict, Optional, Text, List
 
 import networkx as nx
 
 from schematic.schemas.explorer import SchemaExplorer
+from schematic.utils.cache_utils import LRUCache
 from schematic.utils.io_utils import load_json
 from schematic.utils.cli_utils import query_dict
 from schematic.utils.schema_utils import load_schema_into_networkx
@@ -17,6 +19,20 @@ from schematic import CONFIG
 logger = logging.getLogger(__name__)
 
 
+# generated JSON schemas; keys include the hash of the data model the JSON schema was generated from, so entries of a
+# data model that was edited or reloaded with different contents are never served again, and eventually evicted
+_json_schema_cache = LRUCache(max_size=128)
+
+
+def _copy_json_schema(value: Any) -> Any:
+    """Copy a JSON schema; faster than copy.deepcopy as JSON schemas only contain dicts, lists and scalars."""
+    if isinstance(value, dict):
+        return {k: _copy_json_schema(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json_schema(v) for v in value]
+    return value
+
+
 class SchemaGenerator(object):
     def __init__(
         self,
@@ -115,8 +131,10 @@ class SchemaGenerator(object):
             relationship: edge / link relationship type with possible values same as in above docs.
 
         Returns:
-            Directed graph on edges of a particular type (aka relationship)
+            Directed graph on edges of a particular type (aka relationship); read-only if `graph` is the schema graph.
         """
+        if graph is self.se.get_nx_schema():
+            return self.se.get_digraph_by_edge_type(relationship)
 
         # prune the metadata model graph so as to include only those edges that match the relationship type
         rel_edges = []
@@ -204,11 +222,13 @@ class SchemaGenerator(object):
         Returns:
             List of nodes that are dependent on the source node.
         """
-        mm_graph = self.se.get_nx_schema()
+        compiled_schema = self.se.get_compiled_schema()
 
         if schema_ordered:
             # get dependencies in the same order in which they are defined in the schema
-            required_dependencies = self.se.explore_class(source_node)["dependencies"]
+            required_dependencies = list(
+                compiled_schema.get_node(source_node).dependencies
+            )
         else:
             required_dependencies = self.get_adjacent_nodes_by_relationship(
                 source_node, self.requires_dependency_relationship
@@ -216,12 +236,7 @@ class SchemaGenerator(object):
 
         if display_names:
             # get display names of dependencies
-            dependencies_display_names = []
-
-            for req in required_dependencies:
-                dependencies_display_names.append(mm_graph.nodes[req]["displayName"])
-
-            return dependencies_display_names
+            return compiled_schema.get_display_names(required_dependencies)
 
         return required_dependencies
 
@@ -234,11 +249,11 @@ class SchemaGenerator(object):
         Returns:
             List of display names of nodes associateed with the given node.
         """
-        mm_graph = self.se.get_nx_schema()
+        compiled_schema = self.se.get_compiled_schema()
 
         try:
             # get node range in the order defined in schema for given node
-            required_range = self.se.explore_class(node_label)["range"]
+            required_range = list(compiled_schema.get_node(node_label).range_values)
         except KeyError:
             raise ValueError(
                 f"The source node {node_label} does not exist in the graph. "
@@ -247,12 +262,7 @@ class SchemaGenerator(object):
 
         if display_names:
             # get the display name(s) of all dependencies
-            dependencies_display_names = []
-
-            for req in required_range:
-                dependencies_display_names.append(mm_graph.nodes[req]["displayName"])
-
-            return dependencies_display_names
+            return compiled_schema.get_display_names(required_range)
 
         return required_range
 
@@ -268,21 +278,7 @@ class SchemaGenerator(object):
         Raises:
             KeyError: If the node cannot be found in the graph.
         """
-        mm_graph = self.se.get_nx_schema()
-
-        node_class_label = self.se.get_class_label_from_display_name(node_display_name)
-        node_property_label = self.se.get_property_label_from_display_name(
-            node_display_name
-        )
-
-        if node_class_label in mm_graph.nodes:
-            node_label = node_class_label
-        elif node_property_label in mm_graph.nodes:
-            node_label = node_property_label
-        else:
-            node_label = ""
-
-        return node_label
+        return self.se.get_compiled_schema().get_node_label(node_display_name)
 
     def get_node_definition(self, node_display_name: str) -> str:
         """Get the node definition, i.e., the "comment" associated with a given node display name.
@@ -293,13 +289,16 @@ class SchemaGenerator(object):
         Returns:
             Comment associated with node, as a string.
         """
-        node_label = self.get_node_label(node_display_name)
+        compiled_schema = self.se.get_compiled_schema()
+        node_label = compiled_schema.get_node_label(node_display_name)
 
         if not node_label:
             return ""
 
-        mm_graph = self.se.get_nx_schema()
-        node_definition = mm_graph.nodes[node_label]["comment"]
+        node_definition = compiled_schema.get_node(node_label).comment
+
+        if node_definition is None:
+            raise KeyError(node_label)
 
         return node_definition
 
@@ -312,15 +311,13 @@ class SchemaGenerator(object):
         Returns:
             A set of validation rules associated with node, as a list.
         """
-        node_label = self.get_node_label(node_display_name)
+        compiled_schema = self.se.get_compiled_schema()
+        node_label = compiled_schema.get_node_label(node_display_name)
 
         if not node_label:
             return []
 
-        mm_graph = self.se.get_nx_schema()
-        node_validation_rules = mm_graph.nodes[node_label]["validationRules"]
-
-        return node_validation_rules
+        return list(compiled_schema.get_node(node_label).validation_rules)
 
     def is_node_required(self, node_display_name: str) -> bool:
         """Check if a given node is required or not.
@@ -334,12 +331,10 @@ class SchemaGenerator(object):
             True: If the given node is a "required" node.
             False: If the given node is not a "required" (i.e., an "optional") node.
         """
-        node_label = self.get_node_label(node_display_name)
-
-        mm_graph = self.se.get_nx_schema()
-        node_required = mm_graph.nodes[node_label]["required"]
+        compiled_schema = self.se.get_compiled_schema()
+        node_label = compiled_schema.get_node_label(node_display_name)
 
-        return node_required
+        return compiled_schema.is_required(node_label)
 
     def get_nodes_display_names(
         self, node_list: List[str], mm_graph: nx.MultiDiGraph
@@ -448,247 +443,86 @@ class SchemaGenerator(object):
         Returns:
             JSON Schema as a dictionary.
         """
-        json_schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "$id": "http://example.com/" + schema_name,
-            "title": schema_name,
-            "type": "object",
-            "properties": {},
-            "required": [],
-            "allOf": [],
-        }
-
-        # get graph corresponding to data model schema
-        mm_graph = self.se.get_nx_schema()
-
-        nodes_to_process = (
-            []
-        )  # list of nodes to be checked for dependencies, starting with the source node
-        processed_nodes = (
-            []
-        )  # keep of track of nodes whose dependencies have been processed
-        reverse_dependencies = (
-            {}
-        )  # maintain a map between conditional nodes and their dependencies (reversed) -- {dependency : conditional_node}
-        range_domain_map = (
-            {}
-        )  # maintain a map between range nodes and their domain nodes {range_value : domain_value}
-        # the domain node is very likely the parentof ("parentOf" relationship) of the range node
-
-        root_dependencies = self.get_adjacent_nodes_by_relationship(
-            source_node, self.requires_dependency_relationship
-        )
+        cache_key = self._get_json_schema_cache_key(source_node, schema_name)
 
-        # if root_dependencies is empty it means that a class with name 'source_node' exists
-        # in the schema, but it is not a valid component
-        if not root_dependencies:
-            raise ValueError(f"'{source_node}' is not a valid component in the schema.")
-
-        nodes_to_process += root_dependencies
-
-        process_node = nodes_to_process.pop(0)
-
-        while process_node:
-
-            if not process_node in processed_nodes:
-                # node is being processed
-                node_is_processed = True
-
-                node_range = self.get_adjacent_nodes_by_relationship(
-                    process_node, self.range_value_relationship
-                )
-
-                # get node range display name
-                node_range_d = self.get_nodes_display_names(node_range, mm_graph)
-
-                node_dependencies = self.get_adjacent_nodes_by_relationship(
-                    process_node, self.requires_dependency_relationship
-                )
-
-                # get process node display name
-                node_display_name = mm_graph.nodes[process_node]["displayName"]
-
-                # updating map between node and node's valid values
-                for n in node_range_d:
-                    if not n in range_domain_map:
-                        range_domain_map[n] = []
-                    range_domain_map[n].append(node_display_name)
-
-                # can this node be map to the empty set (if required no; if not required yes)
-                # TODO: change "required" to different term, required may be a bit misleading (i.e. is the node required in the schema)
-                node_required = self.is_required(process_node, mm_graph)
-
-                # get any additional validation rules associated with this node (e.g. can this node be mapped to a list of other nodes)
-                node_validation_rules = self.get_node_validation_rules(
-                    node_display_name
-                )
-
-                if node_display_name in reverse_dependencies:
-                    # if node has conditionals set schema properties and conditional dependencies
-                    # set schema properties
-                    if node_range:
-                        # if process node has valid value range set it in schema properties
-                        schema_valid_vals = self.get_range_schema(
-                            node_range_d, node_display_name, blank=True
-                        )
-
-                        if node_validation_rules:
-                            # if this node has extra validation rules process them
-                            # TODO: abstract this into its own validation rule constructor/generator module/class
-                            if rule_in_rule_list("list", node_validation_rules):
-                                # if this node can be mapped to a list of nodes
-                                # set its schema accordingly
-                                schema_valid_vals = self.get_array_schema(
-                                    node_range_d, node_display_name, blank=True
-                                )
+        json_schema = _json_schema_cache.get(cache_key)
 
-                    else:
-                        # otherwise, by default allow any values
-                        schema_valid_vals = {node_display_name: {}}
+        if json_schema is None:
+            json_schema = self._build_json_schema(source_node, schema_name)
+            _json_schema_cache.set(cache_key, json_schema)
 
-                    json_schema["properties"].update(schema_valid_vals)
+            logger.info("JSON schema successfully generated from schema.org schema!")
 
-                    # set schema conditional dependencies
-                    for node in reverse_dependencies[node_display_name]:
-                        # set all of the conditional nodes that require this process node
+        # callers are free to modify the JSON schema they get
+        json_schema = _copy_json_schema(json_schema)
 
-                        # get node domain if any
-                        # ow this node is a conditional requirement
-                        if node in range_domain_map:
-                            domain_nodes = range_domain_map[node]
-                            conditional_properties = {}
+        self._write_json_schema_log(json_schema, source_node)
 
-                            for domain_node in domain_nodes:
-
-                                # set range of conditional node schema
-                                conditional_properties.update(
-                                    {
-                                        "properties": {domain_node: {"enum": [node]}},
-                                        "required": [domain_node],
-                                    }
-                                )
-
-                                # given node conditional are satisfied, this process node (which is dependent on these conditionals) has to be set or not depending on whether it is required
-                                if node_range:
-                                    dependency_properties = self.get_range_schema(
-                                        node_range_d,
-                                        node_display_name,
-                                        blank=not node_required,
-                                    )
-
-                                    if node_validation_rules:
-                                        if rule_in_rule_list("list", node_validation_rules):
-                                            # TODO: get_range_schema and get_range_schema have similar behavior - combine in one module
-                                            dependency_properties = self.get_array_schema(
-                                                node_range_d,
-                                                node_display_name,
-                                                blank=not node_required,
-                                            )
-
-                                else:
-                                    if node_required:
-                                        dependency_properties = self.get_non_blank_schema(
-                                            node_display_name
-                                        )
-                                    else:
-                                        dependency_properties = {node_display_name: {}}
-                                schema_conditional_dependencies = {
-                                    "if": conditional_properties,
-                                    "then": {
-                                        "properties": dependency_properties,
-                                        "required": [node_display_name],
-                                    },
-                                }
-
-                                # update conditional-dependency rules in json schema
-                                json_schema["allOf"].append(
-                                    schema_conditional_dependencies
-                                )
+        return json_schema
 
-                else:
-                    # node doesn't have conditionals
-                    if node_required:
-                        if node_range:
-                            schema_valid_vals = self.get_range_schema(
-                                node_range_d, node_display_name, blank=False
-                            )
+    def compile_all_component_schemas(
+        self, schema_names: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Dict]:
+        """Generate the JSON schemas of all components in the data model at once.
 
-                            if node_validation_rules:
-                                # If there are valid values AND they are expected to be a list,
-                                # reformat the Valid Values.
-                                if rule_in_rule_list("list", node_validation_rules):
-                                    schema_valid_vals = self.get_array_schema(
-                                        node_range_d, node_display_name, blank=False
-                                    )
-                        else:
-                            schema_valid_vals = self.get_non_blank_schema(
-                                node_display_name
-                            )
+        Equivalent to calling get_json_schema_requirements for every component (node in the "requiresComponent"
+        graph), but the attributes that components have in common are only looked up once. The JSON schemas are also
+        memoized, so later get_json_schema_requirements calls for these components do not traverse the model again.
 
-                        json_schema["properties"].update(schema_valid_vals)
-                        # add node to required fields
-                        json_schema["required"] += [node_display_name]
+        Args:
+            schema_names: Map between components and the names assigned to their JSON schemas. Components that are
+                not in the map are named "<component>_validation".
 
-                    elif process_node in root_dependencies:
-                        # node doesn't have conditionals and is not required; it belongs in the schema only if it is in root's dependencies
+        Returns:
+            Dictionary with the JSON schema of each component, in the order of the "requiresComponent" graph.
 
-                        if node_range:
-                            schema_valid_vals = self.get_range_schema(
-                                node_range_d, node_display_name, blank=True
-                            )
+        Raises:
+            ValueError: If one of the components has no dependencies, i.e. it is not a valid component.
+        """
+        if schema_names is None:
+            schema_names = {}
 
-                            if node_validation_rules:
-                                if rule_in_rule_list("list", node_validation_rules):
-                                    schema_valid_vals = self.get_array_schema(
-                                        node_range_d, node_display_name, blank=True
-                                    )
+        component_digraph = self.se.get_digraph_by_edge_type(
+            self.requires_component_relationship
+        )
 
-                        else:
-                            schema_valid_vals = {node_display_name: {}}
+        # per-attribute info shared by the traversals of all components
+        nodes_info = {}
 
-                        json_schema["properties"].update(schema_valid_vals)
+        json_schemas = {}
+        for component in component_digraph.nodes():
+            schema_name = schema_names.get(component, f"{component}_validation")
+            cache_key = self._get_json_schema_cache_key(component, schema_name)
 
-                    else:
-                        # node doesn't have conditionals and it is not required and it is not a root dependency
-                        # the node doesn't belong in the schema
-                        # do not add to processed nodes since its conditional may be traversed at a later iteration (though unlikely for most schemas we consider)
-                        node_is_processed = False
+            json_schema = _json_schema_cache.get(cache_key)
 
-                # add process node as a conditional to its dependencies
-                node_dependencies_d = self.get_nodes_display_names(
-                    node_dependencies, mm_graph
+            if json_schema is None:
+                json_schema = self._build_json_schema(
+                    component, schema_name, nodes_info=nodes_info
                 )
+                _json_schema_cache.set(cache_key, json_schema)
 
-                for dep in node_dependencies_d:
-                    if not dep in reverse_dependencies:
-                        reverse_dependencies[dep] = []
-
-                    reverse_dependencies[dep].append(node_display_name)
-
-                # add nodes found as dependencies and range of this processed node
-                # to the list of nodes to be processed
-                nodes_to_process += node_range
-                nodes_to_process += node_dependencies
+            json_schemas[component] = _copy_json_schema(json_schema)
 
-                # if the node is processed add it to the processed nodes set
-                if node_is_processed:
-                    processed_nodes.append(process_node)
+            self._write_json_schema_log(json_schemas[component], component)
 
-            # if the list of nodes to process is not empty
-            # set the process node the next remaining node to process
-            if nodes_to_process:
-                process_node = nodes_to_process.pop(0)
-            else:
-                # no more nodes to process
-                # exit the loop
-                break
+        logger.info(
+            f"JSON schemas of {len(json_schemas)} components successfully generated from schema.org schema!"
+        )
 
-        logger.info("JSON schema successfully generated from schema.org schema!")
+        return json_schemas
 
-        # if no conditional dependencies were added we can't have an empty 'AllOf' block in the schema, so remove it
-        if not json_schema["allOf"]:
-            del json_schema["allOf"]
+    def _get_json_schema_cache_key(self, source_node: str, schema_name: str) -> tuple:
+        return (
+            self.se.schema_hash,
+            source_node,
+            schema_name,
+            self.requires_dependency_relationship,
+            self.range_value_relationship,
+        )
 
+    def _write_json_schema_log(self, json_schema: Dict, source_node: str) -> None:
+        """Store a JSON schema at (model > input > log_location), or next to the JSON-LD file of the data model."""
         # Check if config value is provided; otherwise, set to None
         json_schema_log_file = query_dict(
             CONFIG.DATA, ("model", "input", "log_location")
@@ -717,4 +551,223 @@ class SchemaGenerator(object):
 
         logger.info(f"JSON schema file log stored as {json_schema_log_file}")
 
+    def _get_json_schema_node_info(self, node: str) -> Dict:
+        """Gather the attributes of a node that are needed to add it to a JSON schema.
+
+        Args:
+            node: Node (label) in the data model graph.
+
+        Returns:
+            Dictionary with the display name of the node, its range and dependencies (as labels and display names),
+            whether it is required and whether it can be mapped to a list of values.
+        """
+        compiled_schema = self.se.get_compiled_schema()
+
+        node_range = self.get_adjacent_nodes_by_relationship(
+            node, self.range_value_relationship
+        )
+        node_dependencies = self.get_adjacent_nodes_by_relationship(
+            node, self.requires_dependency_relationship
+        )
+        node_display_name = compiled_schema.get_display_name(node)
+
+        # validation rules are looked up by display name, as they are for manifest columns
+        node_validation_rules = self.get_node_validation_rules(node_display_name)
+
+        return {
+            "display_name": node_display_name,
+            "range": node_range,
+            "range_display_names": compiled_schema.get_display_names(node_range),
+            "dependencies": node_dependencies,
+            "dependencies_display_names": compiled_schema.get_display_names(
+                node_dependencies
+            ),
+            "required": compiled_schema.is_required(node),
+            "is_list": bool(node_validation_rules)
+            and bool(rule_in_rule_list("list", node_validation_rules)),
+        }
+
+    def _get_valid_values_schema(
+        self, node_info: Dict, blank: bool
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """Get the schema of the valid values of a node that has a range, as an enum or array of enums."""
+        if node_info["is_list"]:
+            # this node can be mapped to a list of nodes
+            return self.get_array_schema(
+                node_info["range_display_names"], node_info["display_name"], blank=blank
+            )
+
+        return self.get_range_schema(
+            node_info["range_display_names"], node_info["display_name"], blank=blank
+        )
+
+    def _build_json_schema(
+        self, source_node: str, schema_name: str, nodes_info: Optional[Dict] = None
+    ) -> Dict:
+        """Build the JSON schema of a source node; see get_json_schema_requirements.
+
+        Args:
+            nodes_info: Attributes of the nodes visited so far (see _get_json_schema_node_info); can be shared
+                between the JSON schemas of a data model, and is updated with the nodes visited by this traversal.
+        """
+        json_schema = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "http://example.com/" + schema_name,
+            "title": schema_name,
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "allOf": [],
+        }
+
+        # queue of nodes to be checked for dependencies, starting with the source node's dependencies
+        nodes_to_process = deque()
+        # keep of track of nodes whose dependencies have been processed
+        processed_nodes = set()
+        # maintain a map between conditional nodes and their dependencies (reversed) -- {dependency : conditional_node}
+        reverse_dependencies = {}
+        # maintain a map between range nodes and their domain nodes {range_value : domain_value}
+        # the domain node is very likely the parentof ("parentOf" relationship) of the range node
+        range_domain_map = {}
+        if nodes_info is None:
+            nodes_info = {}
+
+        root_dependencies = self.get_adjacent_nodes_by_relationship(
+            source_node, self.requires_dependency_relationship
+        )
+
+        # if root_dependencies is empty it means that a class with name 'source_node' exists
+        # in the schema, but it is not a valid component
+        if not root_dependencies:
+            raise ValueError(f"'{source_node}' is not a valid component in the schema.")
+
+        root_dependencies_set = set(root_dependencies)
+        nodes_to_process.extend(root_dependencies)
+
+        while nodes_to_process:
+            process_node = nodes_to_process.popleft()
+
+            if process_node in processed_nodes:
+                continue
+
+            if process_node not in nodes_info:
+                nodes_info[process_node] = self._get_json_schema_node_info(process_node)
+            node_info = nodes_info[process_node]
+
+            # node is being processed
+            node_is_processed = True
+
+            node_display_name = node_info["display_name"]
+            node_range = node_info["range"]
+            node_required = node_info["required"]
+
+            # updating map between node and node's valid values
+            for n in node_info["range_display_names"]:
+                if not n in range_domain_map:
+                    range_domain_map[n] = []
+                range_domain_map[n].append(node_display_name)
+
+            if node_display_name in reverse_dependencies:
+                # if node has conditionals set schema properties and conditional dependencies
+                # set schema properties
+                if node_range:
+                    # if process node has valid value range set it in schema properties
+                    schema_valid_vals = self._get_valid_values_schema(node_info, blank=True)
+                else:
+                    # otherwise, by default allow any values
+                    schema_valid_vals = {node_display_name: {}}
+
+                json_schema["properties"].update(schema_valid_vals)
+
+                # set schema conditional dependencies
+                for node in reverse_dependencies[node_display_name]:
+                    # set all of the conditional nodes that require this process node
+
+                    # get node domain if any
+                    # ow this node is a conditional requirement
+                    if node in range_domain_map:
+                        domain_nodes = range_domain_map[node]
+                        conditional_properties = {}
+
+                        for domain_node in domain_nodes:
+
+                            # set range of conditional node schema
+                            conditional_properties.update(
+                                {
+                                    "properties": {domain_node: {"enum": [node]}},
+                                    "required": [domain_node],
+                                }
+                            )
+
+                            # given node conditional are satisfied, this process node (which is dependent on these conditionals) has to be set or not depending on whether it is required
+                            if node_range:
+                                dependency_properties = self._get_valid_values_schema(
+                                    node_info, blank=not node_required
+                                )
+                            elif node_required:
+                                dependency_properties = self.get_non_blank_schema(
+                                    node_display_name
+                                )
+                            else:
+                                dependency_properties = {node_display_name: {}}
+
+                            schema_conditional_dependencies = {
+                                "if": conditional_properties,
+                                "then": {
+                                    "properties": dependency_properties,
+                                    "required": [node_display_name],
+                                },
+                            }
+
+                            # update conditional-dependency rules in json schema
+                            json_schema["allOf"].append(
+                                schema_conditional_dependencies
+                            )
+
+            elif node_required:
+                # node doesn't have conditionals
+                if node_range:
+                    schema_valid_vals = self._get_valid_values_schema(node_info, blank=False)
+                else:
+                    schema_valid_vals = self.get_non_blank_schema(node_display_name)
+
+                json_schema["properties"].update(schema_valid_vals)
+                # add node to required fields
+                json_schema["required"] += [node_display_name]
+
+            elif process_node in root_dependencies_set:
+                # node doesn't have conditionals and is not required; it belongs in the schema only if it is in root's dependencies
+                if node_range:
+                    schema_valid_vals = self._get_valid_values_schema(node_info, blank=True)
+                else:
+                    schema_valid_vals = {node_display_name: {}}
+
+                json_schema["properties"].update(schema_valid_vals)
+
+            else:
+                # node doesn't have conditionals and it is not required and it is not a root dependency
+                # the node doesn't belong in the schema
+                # do not add to processed nodes since its conditional may be traversed at a later iteration (though unlikely for most schemas we consider)
+                node_is_processed = False
+
+            # add process node as a conditional to its dependencies
+            for dep in node_info["dependencies_display_names"]:
+                if not dep in reverse_dependencies:
+                    reverse_dependencies[dep] = []
+
+                reverse_dependencies[dep].append(node_display_name)
+
+            # add nodes found as dependencies and range of this processed node
+            # to the list of nodes to be processed
+            nodes_to_process.extend(node_range)
+            nodes_to_process.extend(node_info["dependencies"])
+
+            # if the node is processed add it to the processed nodes set
+            if node_is_processed:
+                processed_nodes.add(process_node)
+
+        # if no conditional dependencies were added we can't have an empty 'AllOf' block in the schema, so remove it
+        if not json_schema["allOf"]:
+            del json_schema["allOf"]
+
         return json_schema
@@ -0,0 +1,193 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+import networkx as nx
+
+from schematic import CONFIG
+from schematic.utils.cli_utils import query_dict
+from schematic.utils.io_utils import get_user_cache_dir, make_private_dir
+from schematic.version import __version__
+
+logger = logging.getLogger(__name__)
+
+# bump whenever the layout of cached models changes (e.g. new precomputed indexes)
+CACHE_FORMAT_VERSION = "2"
+
+# packages whose code builds and defines the cached models
+_SCHEMATIC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FINGERPRINTED_PACKAGES = ("schemas", "utils")
+
+
+@lru_cache(maxsize=None)
+def get_code_fingerprint() -> str:
+    """Get the SHA-256 of the code building and defining the cached models, and of the networkx version.
+
+    __version__ is "unknown" in source checkouts, so cached models are also keyed by the code they were pickled
+    with: any change to it invalidates them, whether or not CACHE_FORMAT_VERSION was bumped.
+    """
+    fingerprint = hashlib.sha256(nx.__version__.encode())
+    for package in FINGERPRINTED_PACKAGES:
+        package_dir = os.path.join(_SCHEMATIC_DIR, package)
+        for name in sorted(os.listdir(package_dir)):
+            if name.endswith(".py"):
+                fingerprint.update(f"{package}/{name}".encode())
+                with open(os.path.join(package_dir, name), "rb") as f:
+                    fingerprint.update(f.read())
+
+    return fingerprint.hexdigest()
+
+
+class ModelCache(object):
+    """On-disk cache of parsed data models.
+
+    Entries are pickled objects stored in a single directory private to the current user, keyed by the SHA-256 of the
+    JSON-LD bytes of the data model together with the schematic version and the fingerprint of its code. Entries older than `max_age` are discarded, and once the cache grows
+    beyond `max_size` the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self, location: str, max_size: float = None, max_age: float = None
+    ) -> None:
+        """
+        Args:
+            location: Directory the cached models are stored in; created private to the current user if it does not
+                exist.
+            max_size: Maximum total size of the cache, in megabytes. Unbounded if None.
+            max_age: Maximum age of a cached model, in days. Unbounded if None.
+        """
+        self.location = os.path.expanduser(location)
+        self.max_size = None if max_size is None else int(max_size * 1024 ** 2)
+        self.max_age = None if max_age is None else max_age * 24 * 60 * 60
+
+        # entries are unpickled: never from a directory others can write to
+        make_private_dir(self.location)
+
+    @staticmethod
+    def get_key(jsonld_bytes: bytes) -> str:
+        """Get the cache key of a data model from the raw bytes of its JSON-LD file."""
+        content_hash = hashlib.sha256(jsonld_bytes).hexdigest()
+
+        return hashlib.sha256(
+            f"{content_hash}:{__version__}:{CACHE_FORMAT_VERSION}:{get_code_fingerprint()}".encode()
+        ).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.location, f"{key}.pickle")
+
+    def _is_expired(self, path: str) -> bool:
+        return (
+            self.max_age is not None
+            and time.time() - os.path.getmtime(path) > self.max_age
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached model; returns None on a cache miss."""
+        path = self._get_path(key)
+
+        try:
+            if self._is_expired(path):
+                os.remove(path)
+                return None
+
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # a truncated or incompatible entry is treated as a miss and replaced on the next `set`
+            logger.warning(f"Ignoring unreadable data model cache entry {path}: {e}")
+            return None
+
+        # mark entry as recently used
+        os.utime(path)
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a model in the cache, then evict entries beyond the configured size and age."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.location, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            # atomic, so concurrent readers never see a partially written entry
+            os.replace(tmp_path, self._get_path(key))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove expired entries, then least recently used entries until the cache fits in `max_size`."""
+        entries = []
+        for entry in os.scandir(self.location):
+            if not entry.name.endswith(".pickle"):
+                continue
+
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        now = time.time()
+        total_size = 0
+        for mtime, size, path in sorted(entries, reverse=True):
+            if self.max_age is not None and now - mtime > self.max_age:
+                self._remove(path)
+            elif self.max_size is not None and total_size + size > self.max_size:
+                self._remove(path)
+            else:
+                total_size += size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def get_model_cache() -> Optional[ModelCache]:
+    """Get the data model cache configured under (model > cache) in the configuration file.
+
+    Cached models are stored in the configured location, by default in the cache directory of the user (see
+    get_user_cache_dir).
+
+    Returns:
+        ModelCache instance, or None if caching is not configured.
+    """
+    try:
+        cache_config = query_dict(CONFIG.DATA, ("model", "cache"))
+    except AttributeError:
+        # no configuration file has been loaded
+        return None
+
+    if not cache_config:
+        return None
+
+    location = cache_config.get("location")
+    try:
+        if location:
+            location = os.path.expanduser(location)
+            if not os.path.isabs(location):
+                location = CONFIG.normalize_path(location)
+        else:
+            location = get_user_cache_dir("models")
+
+        return ModelCache(
+            location,
+            max_size=cache_config.get("max_size"),
+            max_age=cache_config.get("max_age"),
+        )
+    except OSError as e:
+        logger.warning(f"Data model cache disabled, cannot use {location}: {e}")
+        return None
@@ -0,0 +1,95 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from schematic.utils.general import dict2list
+
+
+def _referenced_ids(record: Dict, key: str) -> List[str]:
+    """Get the "@id"s referenced by a key (e.g. "schema:domainIncludes") of a schema record."""
+    if key not in record or not isinstance(record[key], (dict, list)):
+        return []
+
+    return [item["@id"] for item in dict2list(record[key])]
+
+
+class SchemaRecordIndex(object):
+    """Indexes over the records in the "@graph" of a JSON-LD schema.
+
+    Records are referred to by their position in "@graph", so the index stays valid as long as records are only
+    appended or replaced through `append` / `replace`.
+    """
+
+    def __init__(self, records: List[Dict]) -> None:
+        """
+        Args:
+            records: the "@graph" records of the schema.
+        """
+        # label -> positions of the records with that label
+        self._positions = defaultdict(list)
+        # label -> positions of the property (rdf:Property) records with that label
+        self._property_positions = defaultdict(list)
+        # class uri -> {position: label} of the properties that have the class in their domain / range
+        self._domain_properties = defaultdict(dict)
+        self._range_properties = defaultdict(dict)
+
+        self._size = 0
+        for record in records:
+            self.append(record)
+
+    def _add(self, position: int, record: Dict) -> None:
+        label = record["rdfs:label"]
+        self._positions[label].append(position)
+
+        if record["@type"] == "rdf:Property":
+            self._property_positions[label].append(position)
+
+            for class_uri in _referenced_ids(record, "schema:domainIncludes"):
+                self._domain_properties[class_uri][position] = label
+
+            for class_uri in _referenced_ids(record, "schema:rangeIncludes"):
+                self._range_properties[class_uri][position] = label
+
+    def _remove(self, position: int, record: Dict) -> None:
+        label = record["rdfs:label"]
+        self._positions[label].remove(position)
+
+        if record["@type"] == "rdf:Property":
+            self._property_positions[label].remove(position)
+
+            for class_uri in _referenced_ids(record, "schema:domainIncludes"):
+                self._domain_properties[class_uri].pop(position, None)
+
+            for class_uri in _referenced_ids(record, "schema:rangeIncludes"):
+                self._range_properties[class_uri].pop(position, None)
+
+    def append(self, record: Dict) -> None:
+        """Index a record appended to the end of "@graph"."""
+        self._add(self._size, record)
+        self._size += 1
+
+    def replace(self, position: int, former_record: Dict, record: Dict) -> None:
+        """Index a record that replaced `former_record` at a given position of "@graph"."""
+        self._remove(position, former_record)
+        self._add(position, record)
+
+    def get_position(self, label: str) -> Optional[int]:
+        """Get the position of the first record with a given label; None if there is no such record."""
+        positions = self._positions.get(label)
+
+        return min(positions) if positions else None
+
+    def get_property_position(self, label: str) -> Optional[int]:
+        """Get the position of the first property record with a given label; None if there is no such record."""
+        positions = self._property_positions.get(label)
+
+        return min(positions) if positions else None
+
+    def get_domain_properties(self, class_uri: str) -> List[str]:
+        """Get labels of the properties whose domain includes a given class, in schema order."""
+        properties = self._domain_properties.get(class_uri, {})
+
+        return [properties[position] for position in sorted(properties)]
+
+    def get_range_property_positions(self, class_uri: str) -> List[int]:
+        """Get positions of the property records whose range includes a given class, in schema order."""
+        return sorted(self._range_properties.get(class_uri, {}))
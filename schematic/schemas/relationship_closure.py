@@ -0,0 +1,158 @@
+from typing import Dict, Iterable, List, Tuple
+
+import networkx as nx
+
+
+class RelationshipClosure(object):
+    """Transitive closure of the DiGraph on the edges of one relationship (edge key) of a data model graph.
+
+    Nodes are numbered in graph order, and the descendants of every node are stored as a bitset (an int with one bit per
+    descendant), computed in a single pass over the nodes in topological order (or over the strongly connected
+    components, if there are cycles). Descendant queries are then bit operations, and the topological order of the
+    descendants of a node is computed once and memoized. Cycles are found while the closure is computed, see `cycles`.
+    """
+
+    def __init__(self, edges: Iterable[Tuple[str, str]]) -> None:
+        """
+        Args:
+            edges: (u, v) edges of the relationship, in the order of the data model graph.
+        """
+        # nodes and successors in the order a DiGraph built from the edges has them
+        successors = {}
+        for (u, v) in edges:
+            successors.setdefault(u, {})[v] = None
+            successors.setdefault(v, {})
+
+        self._nodes = list(successors)
+        self._index = {node: i for i, node in enumerate(self._nodes)}
+        self._successors = [
+            tuple(self._index[v] for v in successors[node]) for node in self._nodes
+        ]
+
+        # nodes sorted so that successors come first; all of them unless there are cycles
+        order = self._get_topological_order()
+
+        self.cycles = []
+        self._cyclic_bits = 0
+        self._descendants = [0] * len(self._nodes)
+        if len(order) == len(self._nodes):
+            for i in reversed(order):
+                bits = 0
+                for j in self._successors[i]:
+                    bits |= (1 << j) | self._descendants[j]
+                self._descendants[i] = bits
+        else:
+            self._set_cyclic_descendants(successors)
+
+        self._orders = {}
+
+    def _get_topological_order(self) -> List[int]:
+        """Get the node numbers in topological order, leaving out the nodes on or after a cycle."""
+        in_degrees = [0] * len(self._nodes)
+        for successors in self._successors:
+            for j in successors:
+                in_degrees[j] += 1
+
+        order = [i for i, in_degree in enumerate(in_degrees) if in_degree == 0]
+        for i in order:
+            for j in self._successors[i]:
+                in_degrees[j] -= 1
+                if in_degrees[j] == 0:
+                    order.append(j)
+
+        return order
+
+    def _set_cyclic_descendants(self, successors: Dict[str, Dict[str, None]]) -> None:
+        """Compute the descendants of the nodes of a DiGraph with cycles, over its strongly connected components."""
+        digraph = nx.DiGraph()
+        digraph.add_nodes_from(self._nodes)
+        digraph.add_edges_from((u, v) for u in successors for v in successors[u])
+
+        condensed = nx.condensation(digraph)
+        components = condensed.graph["mapping"]
+
+        component_bits = {}
+        cyclic_components = set()
+        for component, members in condensed.nodes(data="members"):
+            component_bits[component] = 0
+            for node in members:
+                component_bits[component] |= 1 << self._index[node]
+
+            if len(members) > 1 or any(digraph.has_edge(node, node) for node in members):
+                cyclic_components.add(component)
+                self.cycles.append(sorted(members, key=self._index.get))
+                self._cyclic_bits |= component_bits[component]
+
+        # nodes reachable from each component, components sorted so that successors come first
+        reachable = {}
+        for component in reversed(list(nx.topological_sort(condensed))):
+            bits = component_bits[component] if component in cyclic_components else 0
+            for successor in condensed.successors(component):
+                bits |= component_bits[successor] | reachable[successor]
+            reachable[component] = bits
+
+        self._descendants = [
+            reachable[components[node]] & ~(1 << i) for i, node in enumerate(self._nodes)
+        ]
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._index
+
+    def _decode(self, bits: int) -> List[int]:
+        """Get the node numbers of the bits set in a bitset, in increasing order."""
+        numbers = []
+        while bits:
+            lowest = bits & -bits
+            numbers.append(lowest.bit_length() - 1)
+            bits ^= lowest
+
+        return numbers
+
+    def get_descendants(self, node: str) -> List[str]:
+        """Get the nodes reachable from a node, the node excluded, in graph order; empty if the node has no edges."""
+        if node not in self._index:
+            return []
+
+        return [self._nodes[i] for i in self._decode(self._descendants[self._index[node]])]
+
+    def get_ordered_descendants(self, node: str) -> List[str]:
+        """Get a node and the nodes reachable from it, topologically ordered.
+
+        The order is the one networkx.topological_sort gives on the subgraph induced on these nodes.
+
+        Raises:
+            nx.NetworkXUnfeasible: some of the nodes are on a cycle.
+        """
+        if node not in self._orders:
+            source = self._index[node]
+            bits = self._descendants[source] | (1 << source)
+
+            if bits & self._cyclic_bits:
+                cycles = [
+                    cycle for cycle in self.cycles if bits >> self._index[cycle[0]] & 1
+                ]
+                raise nx.NetworkXUnfeasible(
+                    f"The descendants of {node} cannot be ordered, they contain cycles: {cycles}"
+                )
+
+            # generations of nodes whose predecessors all are in earlier generations, as in nx.topological_generations
+            in_degrees = dict.fromkeys(self._decode(bits), 0)
+            for i in in_degrees:
+                for j in self._successors[i]:
+                    in_degrees[j] += 1
+
+            order = []
+            generation = [i for i, in_degree in in_degrees.items() if in_degree == 0]
+            while generation:
+                order.extend(generation)
+                next_generation = []
+                for i in generation:
+                    for j in self._successors[i]:
+                        in_degrees[j] -= 1
+                        if in_degrees[j] == 0:
+                            next_generation.append(j)
+                generation = next_generation
+
+            self._orders[node] = tuple(self._nodes[i] for i in order)
+
+        return list(self._orders[node])
@@ -0,0 +1,202 @@
+from collections import deque
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from schematic.schemas.explorer import SchemaExplorer
+
+# relationships whose targets are part of the manifest / JSON schema of the node they start from
+COMPONENT_CONTENT_RELATIONSHIPS = ["requiresDependency", "rangeValue"]
+
+
+class SchemaDiff(object):
+    """Structural changes between two versions of a data model.
+
+    The graphs of both versions are compared node by node and, for each relationship (edge key), edge by edge:
+
+    - added_nodes / removed_nodes: labels of the nodes only in the new / old graph.
+    - modified_nodes: map between the labels of the nodes in both graphs whose attributes differ, and the names of
+      these attributes.
+    - added_edges / removed_edges: map between relationships and the (u, v) edges of that relationship only in the new
+      / old graph.
+    - reordered_edges: map between relationships and the nodes in both graphs whose edges of that relationship are
+      the same, but in a different order (e.g. the order of the columns of a manifest).
+    - affected_components: components of either version whose manifest or JSON schema may differ between the
+      versions, i.e. whose attributes and valid values ("requiresDependency" and "rangeValue" descendants), or the
+      component itself, include a changed node. Artifacts derived from the other components can be kept.
+
+    Components are the nodes of the "requiresComponent" graph, and the nodes that depend on the "Component"
+    attribute. All lists are sorted.
+    """
+
+    def __init__(self, old_se: SchemaExplorer, new_se: SchemaExplorer) -> None:
+        """
+        Args:
+            old_se: SchemaExplorer with the previous version of the data model loaded.
+            new_se: SchemaExplorer with the new version of the data model loaded.
+        """
+        old_graph = old_se.get_nx_schema()
+        new_graph = new_se.get_nx_schema()
+
+        self.added_nodes = sorted(node for node in new_graph if node not in old_graph)
+        self.removed_nodes = sorted(node for node in old_graph if node not in new_graph)
+
+        self.modified_nodes = {}
+        for node, old_attrs in old_graph.nodes(data=True):
+            if node not in new_graph:
+                continue
+
+            new_attrs = new_graph.nodes[node]
+            changed_attrs = sorted(
+                attr
+                for attr in set(old_attrs) | set(new_attrs)
+                if old_attrs.get(attr) != new_attrs.get(attr)
+            )
+            if changed_attrs:
+                self.modified_nodes[node] = changed_attrs
+        self.modified_nodes = dict(sorted(self.modified_nodes.items()))
+
+        old_out_edges = _get_out_edges(old_graph.edges(keys=True))
+        new_out_edges = _get_out_edges(new_graph.edges(keys=True))
+
+        self.added_edges = {}
+        self.removed_edges = {}
+        self.reordered_edges = {}
+        for relationship in sorted(set(old_out_edges) | set(new_out_edges)):
+            old_targets = old_out_edges.get(relationship, {})
+            new_targets = new_out_edges.get(relationship, {})
+
+            added = []
+            removed = []
+            reordered = []
+            for u in set(old_targets) | set(new_targets):
+                old_vs = old_targets.get(u, [])
+                new_vs = new_targets.get(u, [])
+                if old_vs == new_vs:
+                    continue
+
+                added.extend((u, v) for v in new_vs if v not in old_vs)
+                removed.extend((u, v) for v in old_vs if v not in new_vs)
+                if set(old_vs) == set(new_vs):
+                    reordered.append(u)
+
+            if added:
+                self.added_edges[relationship] = sorted(added)
+            if removed:
+                self.removed_edges[relationship] = sorted(removed)
+            if reordered:
+                self.reordered_edges[relationship] = sorted(reordered)
+
+        changed_nodes = self.get_changed_nodes()
+        self.affected_components = sorted(
+            _get_affected_components(old_se, changed_nodes)
+            | _get_affected_components(new_se, changed_nodes)
+        )
+
+    def is_empty(self) -> bool:
+        """Check if both versions of the data model have the same graph."""
+        return not (
+            self.added_nodes
+            or self.removed_nodes
+            or self.modified_nodes
+            or self.added_edges
+            or self.removed_edges
+            or self.reordered_edges
+        )
+
+    def get_changed_nodes(self) -> Set[str]:
+        """Get the nodes that were added, removed or modified, or whose out-edges changed."""
+        changed_nodes = set(self.added_nodes) | set(self.removed_nodes) | set(self.modified_nodes)
+
+        for edges in list(self.added_edges.values()) + list(self.removed_edges.values()):
+            changed_nodes.update(u for (u, _) in edges)
+
+        for nodes in self.reordered_edges.values():
+            changed_nodes.update(nodes)
+
+        return changed_nodes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the changes as a JSON-serializable dictionary."""
+        return {
+            "nodes": {
+                "added": self.added_nodes,
+                "removed": self.removed_nodes,
+                "modified": self.modified_nodes,
+            },
+            "edges": {
+                relationship: {
+                    "added": [list(edge) for edge in self.added_edges.get(relationship, [])],
+                    "removed": [list(edge) for edge in self.removed_edges.get(relationship, [])],
+                    "reordered": self.reordered_edges.get(relationship, []),
+                }
+                for relationship in sorted(
+                    set(self.added_edges) | set(self.removed_edges) | set(self.reordered_edges)
+                )
+            },
+            "affected_components": self.affected_components,
+        }
+
+
+def _get_out_edges(edges: Iterable[Tuple[str, str, str]]) -> Dict[str, Dict[str, List[str]]]:
+    """Group (u, v, key) edges by key, then by source node, keeping the order of the targets."""
+    out_edges = {}
+    for (u, v, key) in edges:
+        out_edges.setdefault(key, {}).setdefault(u, []).append(v)
+
+    return out_edges
+
+
+def get_components(se: SchemaExplorer) -> Set[str]:
+    """Get the components of a data model: the nodes of its "requiresComponent" graph, and the nodes that depend on
+    the "Component" attribute.
+    """
+    components = set(se.get_digraph_by_edge_type("requiresComponent").nodes)
+
+    dependency_digraph = se.get_digraph_by_edge_type("requiresDependency")
+    if "Component" in dependency_digraph:
+        components.update(dependency_digraph.predecessors("Component"))
+
+    return components
+
+
+def _get_affected_components(se: SchemaExplorer, changed_nodes: Set[str]) -> Set[str]:
+    """Get the components of a data model that are changed nodes, or reach one over the relationships that make up
+    their content; a single breadth-first search back from the changed nodes.
+    """
+    digraphs = [
+        se.get_digraph_by_edge_type(relationship)
+        for relationship in COMPONENT_CONTENT_RELATIONSHIPS
+    ]
+
+    reached = set(changed_nodes)
+    queue = deque(reached)
+    while queue:
+        node = queue.popleft()
+        for digraph in digraphs:
+            if node not in digraph:
+                continue
+
+            for predecessor in digraph.predecessors(node):
+                if predecessor not in reached:
+                    reached.add(predecessor)
+                    queue.append(predecessor)
+
+    return get_components(se) & reached
+
+
+def diff_data_models(old_schema: str, new_schema: str) -> SchemaDiff:
+    """Compare two versions of a JSON-LD data model.
+
+    Args:
+        old_schema: Path or URL of the previous version of the data model.
+        new_schema: Path or URL of the new version of the data model.
+
+    Returns:
+        The changes between the versions.
+    """
+    old_se = SchemaExplorer()
+    old_se.load_schema(old_schema)
+
+    new_se = SchemaExplorer()
+    new_se.load_schema(new_schema)
+
+    return SchemaDiff(old_se, new_se)
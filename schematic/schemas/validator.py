@@ -1,12 +1,10 @@
-import os
-from jsonschema import validate
+import logging
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 
-from schematic.utils.io_utils import load_schemaorg, load_json, load_default
+from schematic.utils.io_utils import iter_schemaorg_records
 from schematic.utils.general import str2list, dict2list, find_duplicates
-from schematic.utils.curie_utils import (
-    expand_curies_in_schema,
-    extract_name_from_uri_or_curie,
-)
+from schematic.utils.curie_utils import CurieResolver
 from schematic.utils.validate_utils import (
     validate_class_schema,
     validate_property_schema,
@@ -16,6 +14,37 @@ from schematic.utils.validate_utils import (
 from schematic import CONFIG
 
 
+logger = logging.getLogger(__name__)
+
+# the schema.org vocabulary types its properties as "rdf:Property"
+CLASS_TYPES = frozenset(["rdfs:Class"])
+PROPERTY_TYPES = frozenset(["rdf:Property", "rdfs:Property"])
+
+
+@lru_cache(maxsize=None)
+def _get_schemaorg_curies() -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Collect the CURIEs of the classes and properties of the schema.org vocabulary once per process.
+
+    Returns:
+        CURIEs of the classes and CURIEs of the properties of the vocabulary.
+    """
+    classes = set()
+    properties = set()
+
+    # the vocabulary is only read for the CURIEs of its classes and properties, so it is not kept in memory
+    for _schema in iter_schemaorg_records():
+        # records of the vocabulary may be grouped in named graphs
+        for _record in _schema.get("@graph", [_schema]):
+            if "@type" in _record:
+                _type = str2list(_record["@type"])
+                if PROPERTY_TYPES.intersection(_type):
+                    properties.add(_record["@id"])
+                elif CLASS_TYPES.intersection(_type):
+                    classes.add(_record["@id"])
+
+    return frozenset(classes), frozenset(properties)
+
+
 class SchemaValidator:
     """Validate Schema against SchemaOrg standard
 
@@ -49,36 +78,41 @@ class SchemaValidator:
     """
 
     def __init__(self, schema):
-        self.schemaorg = {"schema": load_schemaorg(), "classes": [], "properties": []}
-        for _schema in self.schemaorg["schema"]["@graph"]:
-            for _record in _schema["@graph"]:
-                if "@type" in _record:
-                    _type = str2list(_record["@type"])
-                    if "rdfs:Property" in _type:
-                        self.schemaorg["properties"].append(_record["@id"])
-                    elif "rdfs:Class" in _type:
-                        self.schemaorg["classes"].append(_record["@id"])
+        # CURIEs of the schema are expanded, and the names of its @ids extracted, once
+        self.curie_resolver = CurieResolver(schema["@context"])
+        self.schema = schema
         self.extension_schema = {
-            "schema": expand_curies_in_schema(schema),
-            "classes": [],
-            "properties": [],
+            "schema": self.curie_resolver.expand_schema(schema),
+            "classes": set(),
+            "properties": set(),
         }
         for _record in self.extension_schema["schema"]["@graph"]:
             _type = str2list(_record["@type"])
-            if "rdfs:Property" in _type:
-                self.extension_schema["properties"].append(_record["@id"])
-            elif "rdfs:Class" in _type:
-                self.extension_schema["classes"].append(_record["@id"])
-        self.all_classes = self.schemaorg["classes"] + self.extension_schema["classes"]
+            if PROPERTY_TYPES.intersection(_type):
+                self.extension_schema["properties"].add(_record["@id"])
+            elif CLASS_TYPES.intersection(_type):
+                self.extension_schema["classes"].add(_record["@id"])
+
+        # expanded like the records of the schema, so both can be looked up in the same sets
+        schemaorg_classes, schemaorg_properties = _get_schemaorg_curies()
+        self.schemaorg = {
+            "classes": frozenset(
+                self.curie_resolver.expand_curie(_curie) for _curie in schemaorg_classes
+            ),
+            "properties": frozenset(
+                self.curie_resolver.expand_curie(_curie) for _curie in schemaorg_properties
+            ),
+        }
+        self.all_classes = self.schemaorg["classes"] | self.extension_schema["classes"]
 
     def validate_class_label(self, label_uri):
         """Check if the first character of class label is capitalized"""
-        label = extract_name_from_uri_or_curie(label_uri)
+        label = self.curie_resolver.get_name(label_uri)
         assert label[0].isupper()
 
     def validate_property_label(self, label_uri):
         """Check if the first character of property label is lower case"""
-        label = extract_name_from_uri_or_curie(label_uri)
+        label = self.curie_resolver.get_name(label_uri)
         assert label[0].islower()
 
     def validate_subclassof_field(self, subclassof_value):
@@ -108,7 +142,7 @@ class SchemaValidator:
 
     def check_whether_atid_and_label_match(self, record):
         """Check if @id field matches with the "rdfs:label" field"""
-        _id = extract_name_from_uri_or_curie(record["@id"])
+        _id = self.curie_resolver.get_name(record["@id"])
         assert _id == record["rdfs:label"], "id and label not match: %r" % record
 
     def check_duplicate_labels(self):
@@ -125,38 +159,53 @@ class SchemaValidator:
 
     def validate_schema(self, schema):
         """Validate schema against SchemaORG standard"""
-        json_schema_path = os.path.join("validation_schemas", "schema.json")
-        json_schema = load_json(json_schema_path)
-        return validate(schema, json_schema)
+        return validate_schema(schema)
 
     def validate_property_schema(self, schema):
         """Validate schema against SchemaORG property definition standard"""
-        json_schema_path = os.path.join(
-            "validation_schemas", "property_json_schema.json"
-        )
-        json_schema = load_json(json_schema_path)
-        return validate(schema, json_schema)
+        return validate_property_schema(schema)
 
     def validate_class_schema(self, schema):
         """Validate schema against SchemaORG class definition standard"""
-        json_schema_path = os.path.join("validation_schemas", "class_json_schema.json")
-        json_schema = load_json(json_schema_path)
-        return validate(schema, json_schema)
+        return validate_class_schema(schema)
 
     def validate_full_schema(self):
-        self.check_duplicate_labels()
-        for record in self.extension_schema["schema"]["@graph"]:
+        """Validate every record of the schema in a single pass over its graph
+
+        Records are validated as written in the schema, with their CURIEs compact (names extracted from expanded
+        URIs would lose the path of e.g. bts:CSV/TSV), and the classes they refer to are looked up expanded. Records
+        of the schema.org vocabulary copied into the schema (e.g. schema:Thing) are not held to the standard of its
+        own records.
+        """
+        schemaorg_classes, schemaorg_properties = _get_schemaorg_curies()
+
+        labels = set()
+        duplicates = set()
+        for record, expanded_record in zip(
+            self.schema["@graph"], self.extension_schema["schema"]["@graph"]
+        ):
+            if record["rdfs:label"] in labels:
+                duplicates.add(record["rdfs:label"])
+            labels.add(record["rdfs:label"])
+
             self.check_whether_atid_and_label_match(record)
-            if record["@type"] == "rdf:Class":
+            if record["@id"] in schemaorg_classes or record["@id"] in schemaorg_properties:
+                continue
+
+            _type = str2list(record["@type"])
+            if CLASS_TYPES.intersection(_type):
                 self.validate_class_schema(record)
                 self.validate_class_label(record["@id"])
-            elif record["@type"] == "rdf:Property":
+            elif PROPERTY_TYPES.intersection(_type):
                 self.validate_property_schema(record)
                 self.validate_property_label(record["@id"])
                 self.validate_domainIncludes_field(
-                    record["http://schema.org/domainIncludes"]
+                    expanded_record["http://schema.org/domainIncludes"]
                 )
-                if "http://schema.org/rangeIncludes" in record:
+                if "http://schema.org/rangeIncludes" in expanded_record:
                     self.validate_rangeIncludes_field(
-                        record["http://schema.org/rangeIncludes"]
+                        expanded_record["http://schema.org/rangeIncludes"]
                     )
+
+        if duplicates:
+            raise Exception("Duplicates detected in graph: ", duplicates)
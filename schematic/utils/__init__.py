@@ -1,4 +1,5 @@
 from schematic.utils.curie_utils import (
+    CurieResolver,
     expand_curie_to_uri,
     expand_curies_in_schema,
     extract_name_from_uri_or_curie,
@@ -14,9 +15,13 @@ from schematic.utils.google_api_utils import (
 )
 from schematic.utils.io_utils import (
     export_json,
+    get_user_cache_dir,
+    iter_jsonld_records,
+    iter_schemaorg_records,
     load_default,
     load_json,
     load_schemaorg,
+    make_private_dir,
 )
 from schematic.utils.schema_utils import load_schema_into_networkx
 from schematic.utils.validate_utils import (
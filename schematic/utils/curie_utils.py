@@ -1,4 +1,6 @@
 import logging
+import sys
+from typing import Dict, Iterable, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -6,10 +8,14 @@ logger = logging.getLogger(__name__)
 
 def extract_name_from_uri_or_curie(item):
     """Extract name from uri or curie"""
-    if "http" not in item and len(item.split(":")) == 2:
-        return item.split(":")[-1]
-    elif len(item.split("//")[-1].split("/")) > 1:
-        return item.split("//")[-1].split("/")[-1]
+    if "http" not in item:
+        parts = item.split(":")
+        if len(parts) == 2:
+            return parts[-1]
+
+    path = item.split("//")[-1].split("/")
+    if len(path) > 1:
+        return path[-1]
     else:
         raise ValueError("Error extracting name from URI or Curie.")
 
@@ -39,6 +45,16 @@ def expand_curie_to_uri(curie, context_info):
 
 def expand_curies_in_schema(schema):
     """Expand all curies in a SchemaOrg JSON-LD file into URI"""
+    return CurieResolver(schema["@context"]).expand_schema(schema)
+
+
+def _expand_curies_in_schema(schema, expand):
+    """Expand all curies in a SchemaOrg JSON-LD file into URI, with a given curie expansion function.
+
+    Args:
+        schema: the JSON-LD schema.
+        expand: function expanding a curie into a URI.
+    """
     context = schema["@context"]
     graph = schema["@graph"]
     new_schema = {"@context": context, "@graph": [], "@id": schema["@id"]}
@@ -46,32 +62,102 @@ def expand_curies_in_schema(schema):
         new_record = {}
         for k, v in record.items():
             if type(v) == str:
-                new_record[expand_curie_to_uri(k, context)] = expand_curie_to_uri(
-                    v, context
-                )
+                new_record[expand(k)] = expand(v)
             elif type(v) == list:
-                if type(v[0]) == dict:
-                    new_record[expand_curie_to_uri(k, context)] = []
+                if v and type(v[0]) == dict:
+                    new_record[expand(k)] = []
                     for _item in v:
-                        new_record[expand_curie_to_uri(k, context)].append(
-                            {"@id": expand_curie_to_uri(_item["@id"], context)}
-                        )
+                        new_record[expand(k)].append({"@id": expand(_item["@id"])})
                 else:
-                    new_record[expand_curie_to_uri(k, context)] = [
-                        expand_curie_to_uri(_item, context) for _item in v
-                    ]
+                    new_record[expand(k)] = [expand(_item) for _item in v]
             elif type(v) == dict and "@id" in v:
-                new_record[expand_curie_to_uri(k, context)] = {
-                    "@id": expand_curie_to_uri(v["@id"], context)
-                }
+                new_record[expand(k)] = {"@id": expand(v["@id"])}
             elif v == None:
-                new_record[expand_curie_to_uri(k, context)] = None
+                new_record[expand(k)] = None
         new_schema["@graph"].append(new_record)
     return new_schema
 
 
 def uri2label(uri, schema):
-    """Given a URI, return the label"""
-    return [
-        record["rdfs:label"] for record in schema["@graph"] if record["@id"] == uri
-    ][0]
+    """Given a URI, return the label
+
+    The label table is built for the call; to look up more labels of a schema, keep a CurieResolver of it.
+    """
+    label = CurieResolver(schema.get("@context"), schema["@graph"]).get_label(uri)
+    if label is None:
+        raise IndexError(f"No record with @id {uri} in the schema.")
+
+    return label
+
+
+class CurieResolver(object):
+    """Resolution table between the @ids (CURIEs or URIs), URIs, names and labels of the terms of a schema.
+
+    Built once per schema, it interns and memoizes every name and expansion it computes, so that each distinct @id is
+    split or expanded once however many records and edges refer to it. Labels are those of the records it is given;
+    records added to or replaced in the schema afterwards have to be given with add_record and remove_record.
+    """
+
+    def __init__(self, context: Optional[Dict[str, str]] = None, records: Iterable[dict] = ()) -> None:
+        """
+        Args:
+            context: JSON-LD context of the schema (prefix to namespace URI), used to expand CURIEs.
+            records: records of the schema, whose labels are looked up by @id.
+        """
+        self.context = context or {}
+
+        # item -> name, as extracted by extract_name_from_uri_or_curie
+        self._names = {}
+
+        # CURIE -> URI
+        self._uris = {}
+
+        # @id -> labels of the records with that @id, in schema order
+        self._labels = {}
+        for record in records:
+            self.add_record(record)
+
+    def add_record(self, record: dict) -> None:
+        """Add the label of a record appended to the schema."""
+        self._labels.setdefault(record["@id"], []).append(record["rdfs:label"])
+
+    def remove_record(self, record: dict) -> None:
+        """Remove the label of a record removed from (or replaced in) the schema."""
+        labels = self._labels.get(record["@id"], [])
+        if record["rdfs:label"] in labels:
+            labels.remove(record["rdfs:label"])
+            if not labels:
+                del self._labels[record["@id"]]
+
+    def get_label(self, item: str) -> Optional[str]:
+        """Get the label of the (first) record with a given @id; None if the schema has no such record."""
+        labels = self._labels.get(item)
+        return labels[0] if labels else None
+
+    def get_name(self, item: str) -> str:
+        """Get the name of a URI or CURIE, as extract_name_from_uri_or_curie.
+
+        Raises:
+            ValueError: no name can be extracted from the item.
+        """
+        try:
+            return self._names[item]
+        except KeyError:
+            name = self._names[item] = sys.intern(extract_name_from_uri_or_curie(item))
+            return name
+
+    def expand_curie(self, curie: str) -> str:
+        """Expand a CURIE to a URI based on the context, as expand_curie_to_uri."""
+        uri = self._uris.get(curie)
+        if uri is None:
+            if ":" not in curie:
+                # not a CURIE (e.g. a label or a comment), not worth keeping
+                return curie
+
+            uri = self._uris[curie] = expand_curie_to_uri(curie, self.context)
+
+        return uri
+
+    def expand_schema(self, schema: dict) -> dict:
+        """Expand all CURIEs in a SchemaOrg JSON-LD schema into URIs, as expand_curies_in_schema."""
+        return _expand_curies_in_schema(schema, self.expand_curie)
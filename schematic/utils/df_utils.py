@@ -21,7 +21,31 @@ def load_df(file_path, preserve_raw_input=True, data_model=False, **load_args):
     """
     #Read CSV to df as type specified in kwargs
     org_df = pd.read_csv(file_path, keep_default_na = True, encoding='utf8', **load_args)
-    
+
+    return _process_df(org_df, preserve_raw_input, data_model)
+
+
+def load_df_chunks(file_path, chunksize, preserve_raw_input=True, data_model=False, **load_args):
+    """
+    Load a CSV in chunks of rows, each processed as load_df processes a whole CSV, so that the CSV does not have to fit in memory
+    Args:
+        file_path: path of csv to open
+        chunksize: maximum number of rows of a chunk
+        preserve_raw_input: Bool. If false, convert cell datatypes to an inferred type
+        data_model: bool, indicates if importing a data model
+        **load_args: keyword arguments for pd.read_csv()
+
+    Returns: an iterator over the processed dataframes of the chunks; empty rows are dropped, and the index of the rows
+        continues from one chunk to the next, as in the dataframe load_df returns
+    """
+    with pd.read_csv(file_path, keep_default_na = True, encoding='utf8', chunksize=chunksize, **load_args) as reader:
+        for org_df in reader:
+            processed_df = _process_df(org_df, preserve_raw_input, data_model)
+            if not processed_df.empty:
+                yield processed_df
+
+
+def _process_df(org_df, preserve_raw_input, data_model):
     if preserve_raw_input:
         #only trim if not data model csv
         if not data_model:
@@ -1,6 +1,9 @@
 import os
+import io
 import json
+import re
 import urllib.request
+from typing import Dict, Iterable, Iterator, TextIO
 
 from schematic import CONFIG, LOADER
 
@@ -21,6 +24,142 @@ def load_json(file_path):
             return data
 
 
+def load_bytes(file_path):
+    """Load raw document bytes from file path or url
+
+    :arg str file_path: The path of the url doc, could be url or file path
+    """
+    if file_path.startswith("http"):
+        with urllib.request.urlopen(file_path) as url:
+            return url.read()
+    # handle file path
+    else:
+        with open(file_path, "rb") as f:
+            return f.read()
+
+
+# whitespace allowed between JSON tokens
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamReader(object):
+    """Decodes the JSON values of a text stream one at a time, reading the stream as needed."""
+
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _read(self) -> None:
+        """Read the next chunk of the stream, dropping the part of the buffer that was already decoded."""
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+
+    def peek(self) -> str:
+        """Get the next character that is not whitespace; an empty string at the end of the stream."""
+        while True:
+            self.position = _JSON_WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position : self.position + 1]
+
+            self._read()
+
+    def expect(self, characters: str) -> str:
+        """Consume the next character that is not whitespace, which must be one of `characters`."""
+        character = self.peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of {characters!r}", self.buffer, self.position
+            )
+
+        self.position += 1
+        return character
+
+    def decode(self):
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+
+                # a number may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+
+            self._read()
+
+
+def iter_jsonld_records(
+    file_path: str, namespaces: Iterable[str] = None, chunk_size: int = 2 ** 16
+) -> Iterator[Dict]:
+    """Iterate over the records in the "@graph" of a JSON-LD document, decoding them as the document is read.
+
+    Unlike load_json, the whole document is never held in memory: only the record being decoded, and the records
+    the caller keeps.
+
+    Args:
+        file_path: The path of the JSON-LD document; could be url or file path.
+        namespaces: If provided, the records whose "@id" is not a CURIE in one of these namespaces (e.g. "bts",
+            "schema") are skipped.
+        chunk_size: Number of characters read from the document at a time.
+
+    Yields:
+        The records in the "@graph" of the document, in order.
+    """
+    if namespaces is not None:
+        namespaces = set(namespaces)
+
+    if file_path.startswith("http"):
+        stream = io.TextIOWrapper(urllib.request.urlopen(file_path), encoding="utf8")
+    else:
+        stream = open(file_path, encoding="utf8")
+
+    with stream:
+        reader = _JSONStreamReader(stream, chunk_size)
+
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+
+        while True:
+            key = reader.decode()
+            reader.expect(":")
+
+            if key != "@graph":
+                # e.g. the "@context" of the document
+                reader.decode()
+            else:
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        record = reader.decode()
+                        if namespaces is None or (
+                            isinstance(record.get("@id"), str)
+                            and record["@id"].split(":", 1)[0] in namespaces
+                        ):
+                            yield record
+
+                        if reader.expect(",]") == "]":
+                            break
+
+            if reader.expect(",}") == "}":
+                return
+
+
 def export_json(json_doc, file_path):
     """Export JSON doc to file"""
     with open(file_path, "w", encoding="utf8") as f:
@@ -41,3 +180,46 @@ def load_schemaorg():
     schemaorg_path = LOADER.filename(data_path)
 
     return load_json(schemaorg_path)
+
+
+def iter_schemaorg_records(namespaces=None):
+    """Iterate over the records of the SchemaOrg vocabulary, without loading the whole vocabulary
+
+    :arg namespaces: If provided, only the records in these namespaces are read; see iter_jsonld_records
+    """
+    data_path = "data_models/schema_org.model.jsonld"
+    schemaorg_path = LOADER.filename(data_path)
+
+    return iter_jsonld_records(schemaorg_path, namespaces=namespaces)
+
+
+def make_private_dir(path):
+    """Create a directory private to the current user if it does not exist, and check that it is private to them
+
+    :arg str path: Path to the directory
+    :raises PermissionError: The directory is not owned by the current user, or can be read or written by others, so
+        the files in it cannot be trusted.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+    # POSIX only: there is no ownership to check on e.g. Windows
+    if hasattr(os, "getuid"):
+        stat = os.stat(path)
+        if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+            raise PermissionError(
+                f"Cache directory {path} must be owned by the current user and private to them (mode 0700)."
+            )
+
+
+def get_user_cache_dir(name):
+    """Get a directory of the cache of schematic of the current user, created private to the user if it does not exist
+
+    :arg str name: Name of the directory, under $XDG_CACHE_HOME/schematic (~/.cache/schematic by default)
+    :raises PermissionError: The directory is not private to the current user; see make_private_dir.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    path = os.path.join(os.path.expanduser(cache_home), "schematic", name)
+
+    make_private_dir(path)
+
+    return path
@@ -1,14 +1,61 @@
 import networkx as nx
 import json
+import string
 
-from schematic.utils.curie_utils import extract_name_from_uri_or_curie
+import inflection
+
+from schematic.utils.curie_utils import CurieResolver
 from schematic.utils.validate_utils import validate_class_schema
 from schematic.utils.validate_rules_utils import validate_schema_rules
 
 
-def load_schema_into_networkx(schema):
+def get_property_label_from_display_name(display_name, strict_camel_case=False):
+    """Convert a given display name string into a proper property label string"""
+    # This is the newer more strict method
+    if strict_camel_case:
+        display_name = display_name.strip().translate({ord(c): "_" for c in string.whitespace})
+        label = inflection.camelize(display_name, uppercase_first_letter=False)
+
+    # This method remains for backwards compatibility
+    else:
+        display_name = display_name.translate({ord(c): None for c in string.whitespace})
+        label = inflection.camelize(display_name.strip(), uppercase_first_letter=False)
+
+    return label
+
+
+def get_class_label_from_display_name(display_name, strict_camel_case=False):
+    """Convert a given display name string into a proper class label string"""
+    # This is the newer more strict method
+    if strict_camel_case:
+        display_name = display_name.strip().translate({ord(c): "_" for c in string.whitespace})
+        label = inflection.camelize(display_name, uppercase_first_letter=True)
+
+    # This method remains for backwards compatibility
+    else:
+        display_name = display_name.translate({ord(c): None for c in string.whitespace})
+        label = inflection.camelize(display_name.strip(), uppercase_first_letter=True)
+
+    return label
+
+
+def load_schema_into_networkx(schema, curie_resolver=None):
+    """Build the graph of a JSON-LD schema.
+
+    Args:
+        schema: the JSON-LD schema, or an iterable over the records in its "@graph"
+            (e.g. io_utils.iter_jsonld_records, to build the graph while the schema is read).
+        curie_resolver: CurieResolver of the schema, whose names are reused and extended; by default a new one, so
+            that each @id the records refer to is resolved to a node name once.
+    """
+    records = schema["@graph"] if isinstance(schema, dict) else schema
+
+    if curie_resolver is None:
+        curie_resolver = CurieResolver()
+    get_name = curie_resolver.get_name
+
     G = nx.MultiDiGraph()
-    for record in schema["@graph"]:
+    for record in records:
 
         # TODO: clean up obsolete code
         # if record["@type"] == "rdfs:Class":
@@ -36,14 +83,14 @@ def load_schema_into_networkx(schema):
             parents = record["rdfs:subClassOf"]
             if type(parents) == list:
                 for _parent in parents:
-                    n1 = extract_name_from_uri_or_curie(_parent["@id"])
+                    n1 = get_name(_parent["@id"])
                     n2 = record["rdfs:label"]
 
                     # do not allow self-loops
                     if n1 != n2:
                         G.add_edge(n1, n2, key="parentOf")
             elif type(parents) == dict:
-                n1 = extract_name_from_uri_or_curie(parents["@id"])
+                n1 = get_name(parents["@id"])
                 n2 = record["rdfs:label"]
 
                 # do not allow self-loops
@@ -56,7 +103,7 @@ def load_schema_into_networkx(schema):
             if type(dependencies) == list:
                 for _dep in dependencies:
                     n1 = record["rdfs:label"]
-                    n2 = extract_name_from_uri_or_curie(_dep["@id"])
+                    n2 = get_name(_dep["@id"])
                     # do not allow self-loops
                     if n1 != n2:
                         G.add_edge(n1, n2, key="requiresDependency")
@@ -66,7 +113,7 @@ def load_schema_into_networkx(schema):
             if type(components) == list:
                 for _comp in components:
                     n1 = record["rdfs:label"]
-                    n2 = extract_name_from_uri_or_curie(_comp["@id"])
+                    n2 = get_name(_comp["@id"])
                     # do not allow self-loops
                     if n1 != n2:
                         G.add_edge(n1, n2, key="requiresComponent")
@@ -76,13 +123,13 @@ def load_schema_into_networkx(schema):
             if type(range_nodes) == list:
                 for _range_node in range_nodes:
                     n1 = record["rdfs:label"]
-                    n2 = extract_name_from_uri_or_curie(_range_node["@id"])
+                    n2 = get_name(_range_node["@id"])
                     # do not allow self-loops
                     if n1 != n2:
                         G.add_edge(n1, n2, key="rangeValue")
             elif type(range_nodes) == dict:
                 n1 = record["rdfs:label"]
-                n2 = extract_name_from_uri_or_curie(range_nodes["@id"])
+                n2 = get_name(range_nodes["@id"])
                 # do not allow self-loops
                 if n1 != n2:
                     G.add_edge(n1, n2, key="rangeValue")
@@ -91,13 +138,13 @@ def load_schema_into_networkx(schema):
             domain_nodes = record["schema:domainIncludes"]
             if type(domain_nodes) == list:
                 for _domain_node in domain_nodes:
-                    n1 = extract_name_from_uri_or_curie(_domain_node["@id"])
+                    n1 = get_name(_domain_node["@id"])
                     n2 = record["rdfs:label"]
                     # do not allow self-loops
                     if n1 != n2:
                         G.add_edge(n1, n2, key="domainValue")
             elif type(domain_nodes) == dict:
-                n1 = extract_name_from_uri_or_curie(domain_nodes["@id"])
+                n1 = get_name(domain_nodes["@id"])
                 n2 = record["rdfs:label"]
                 # do not allow self-loops
                 if n1 != n2:
@@ -153,12 +200,12 @@ def node_attrs_cleanup(class_add_mod: dict) -> dict:
 
 
 def relationship_edges(
-    schema_graph_nx: nx.MultiDiGraph, class_add_mod: dict, **kwargs
+    schema_graph_nx: nx.MultiDiGraph, class_add_mod: dict, curie_resolver: CurieResolver = None, **kwargs
 ) -> nx.MultiDiGraph:
     """
     Notes:
     =====
-    # pass the below dictionary as the third argument (kwargs) to relationship_edges().
+    # pass the below dictionary as the keyword arguments (kwargs) of relationship_edges().
     # "in" indicates that the relationship has an in-edges behaviour.
     # "out" indicates that the relationship has an out-edges behaviour.
 
@@ -179,7 +226,13 @@ def relationship_edges(
             "rangeValue": "out"
         }
     }
+
+    curie_resolver: CurieResolver of the schema, whose names are reused; by default a new one.
     """
+    if curie_resolver is None:
+        curie_resolver = CurieResolver()
+    get_name = curie_resolver.get_name
+
     for rel, rel_lab_node_type in kwargs.items():
         for rel_label, node_type in rel_lab_node_type.items():
             if rel in class_add_mod:
@@ -188,24 +241,24 @@ def relationship_edges(
                     for _parent in parents:
 
                         if node_type == "in":
-                            n1 = extract_name_from_uri_or_curie(_parent["@id"])
+                            n1 = get_name(_parent["@id"])
                             n2 = class_add_mod["rdfs:label"]
 
                         if node_type == "out":
                             n1 = class_add_mod["rdfs:label"]
-                            n2 = extract_name_from_uri_or_curie(_parent["@id"])
+                            n2 = get_name(_parent["@id"])
 
                         # do not allow self-loops
                         if n1 != n2:
                             schema_graph_nx.add_edge(n1, n2, key=rel_label)
                 elif type(parents) == dict:
                     if node_type == "in":
-                        n1 = extract_name_from_uri_or_curie(parents["@id"])
+                        n1 = get_name(parents["@id"])
                         n2 = class_add_mod["rdfs:label"]
 
                     if node_type == "out":
                         n1 = class_add_mod["rdfs:label"]
-                        n2 = extract_name_from_uri_or_curie(parents["@id"])
+                        n2 = get_name(parents["@id"])
 
                     # do not allow self-loops
                     if n1 != n2:
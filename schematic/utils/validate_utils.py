@@ -1,33 +1,44 @@
 import os
 import pandas as pd
-from jsonschema import validate
+from functools import lru_cache
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from re import compile, search, IGNORECASE
 from schematic.utils.io_utils import load_json
 from schematic import CONFIG, LOADER
 from typing import List
 
-def validate_schema(schema):
-    """Validate schema against schema.org standard"""
-    data_path = "validation_schemas/model.schema.json"
+@lru_cache(maxsize=None)
+def _get_json_schema_validator(data_path: str):
+    """Load a JSON schema shipped with schematic and compile its validator once per process."""
     json_schema_path = LOADER.filename(data_path)
     json_schema = load_json(json_schema_path)
-    return validate(schema, json_schema)
+
+    cls = validator_for(json_schema)
+    cls.check_schema(json_schema)
+    return cls(json_schema)
+
+
+def _validate_against(schema, data_path: str):
+    # same as jsonschema.validate, without checking and compiling the JSON schema on every call
+    error = best_match(_get_json_schema_validator(data_path).iter_errors(schema))
+    if error is not None:
+        raise error
+
+
+def validate_schema(schema):
+    """Validate schema against schema.org standard"""
+    return _validate_against(schema, "validation_schemas/model.schema.json")
 
 
 def validate_property_schema(schema):
     """Validate schema against SchemaORG property definition standard"""
-    data_path = "validation_schemas/property.schema.json"
-    json_schema_path = LOADER.filename(data_path)
-    json_schema = load_json(json_schema_path)
-    return validate(schema, json_schema)
+    return _validate_against(schema, "validation_schemas/property.schema.json")
 
 
 def validate_class_schema(schema):
     """Validate schema against SchemaORG class definition standard"""
-    data_path = "validation_schemas/class.schema.json"
-    json_schema_path = LOADER.filename(data_path)
-    json_schema = load_json(json_schema_path)
-    return validate(schema, json_schema)
+    return _validate_against(schema, "validation_schemas/class.schema.json")
 
 def comma_separated_list_regex():
     # Regex to match with comma separated list 
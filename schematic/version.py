@@ -1,3 +1,7 @@
 import importlib.metadata
 
-__version__ = importlib.metadata.version("schematic")
+try:
+    __version__ = importlib.metadata.version("schematicpy")
+except importlib.metadata.PackageNotFoundError:
+    # running from a source checkout that hasn't been installed
+    __version__ = "unknown"
@@ -67,6 +67,9 @@ class AttributesExplorer():
         # get all components
         component_dg = self.sg.se.get_digraph_by_edge_type('requiresComponent')
         components = component_dg.nodes()
+        # get the json schemas of all components in one pass over the data model
+        json_schemas = self.sg.compile_all_component_schemas(
+            schema_names={component: self.path_to_jsonld for component in components})
         # For each data type to be loaded gather all attribtes the user would
         # have to provide.
 
@@ -74,8 +77,7 @@ class AttributesExplorer():
         for component in components:
             data_dict = {}
             # get the json schema
-            json_schema = self.sg.get_json_schema_requirements(
-                source_node=component, schema_name=self.path_to_jsonld)
+            json_schema = json_schemas[component]
 
             # Gather all attribues, their valid values and requirements
             for key, value in json_schema['properties'].items():
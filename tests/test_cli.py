@@ -1,4 +1,5 @@
 import os
+import json
 
 import pytest
 
@@ -24,7 +25,7 @@ class TestSchemaCli:
         output_path = helpers.get_data_path("example.model.jsonld")
 
         result = runner.invoke(
-            schema, ["convert", data_model_csv_path, "--output_jsonld", output_path]
+            schema, ["convert", data_model_csv_path, "--output_jsonld", output_path, "--no_cache"]
         )
 
         assert result.exit_code == 0
@@ -34,3 +35,22 @@ class TestSchemaCli:
         )
 
         assert expected_substr in result.output
+
+    def test_schema_diff_cli(self, runner, helpers, tmp_path):
+
+        data_model_path = helpers.get_data_path("example.model.jsonld")
+
+        output_path = tmp_path / "changes.json"
+
+        result = runner.invoke(
+            schema, ["diff", data_model_path, data_model_path, "--output_json", str(output_path)]
+        )
+
+        assert result.exit_code == 0
+        assert f"saved to '{output_path}' location." in result.output
+
+        with open(output_path) as f:
+            changes = json.load(f)
+
+        assert changes["nodes"] == {"added": [], "removed": [], "modified": {}}
+        assert changes["affected_components"] == []
@@ -1,10 +1,21 @@
 import os
+import json
 import logging
 
+import networkx as nx
 import pandas as pd
 import pytest
+from jsonschema import ValidationError
 
 from schematic.schemas import df_parser
+from schematic.schemas.compact_graph import CompactSchemaGraph
+from schematic.schemas.convert_cache import get_conversion_cache_path
+from schematic.schemas.explorer import SchemaExplorer
+from schematic.schemas.generator import SchemaGenerator, _json_schema_cache
+from schematic.schemas.model_cache import ModelCache, get_model_cache
+from schematic.schemas.relationship_closure import RelationshipClosure
+from schematic.schemas.schema_diff import diff_data_models
+from schematic.schemas.validator import SchemaValidator
 from schematic.utils.df_utils import load_df
 
 logging.basicConfig(level=logging.DEBUG)
@@ -175,6 +186,25 @@ class TestDfParser:
 
         assert result
 
+    def test_create_nx_schema_objects_graph(self, helpers, tmp_path):
+
+        se_obj = SchemaExplorer()
+        se_obj.load_default_schema()
+
+        model_df = load_df(helpers.get_data_path("example.model.csv"), data_model=True)
+        se_obj = df_parser.create_nx_schema_objects(model_df, se_obj)
+
+        # the schema graph is built from the JSON-LD schema once all attributes are added
+        jsonld_path = str(tmp_path / "example.model.jsonld")
+        se_obj.export_schema(jsonld_path)
+        loaded_se_obj = SchemaExplorer()
+        loaded_se_obj.load_schema(jsonld_path)
+        assert set(se_obj.schema_nx.nodes) == set(loaded_se_obj.schema_nx.nodes)
+        assert set(se_obj.schema_nx.edges) == set(loaded_se_obj.schema_nx.edges)
+
+        assert se_obj.explore_class("Sex")["range"] == ["Female", "Male", "Other"]
+        assert "PatientID" in se_obj.get_adjacent_nodes_by_relationship("Patient", "requiresDependency")
+
     def test_get_base_schema_path(self):
 
         base_schema_path = "/path/to/base_schema.jsonld"
@@ -208,6 +238,72 @@ class TestDfParser:
 
         assert attribute_present
 
+    def test_convert_csv_to_data_model_incremental(self, helpers, tmp_path, monkeypatch):
+
+        csv_path = str(tmp_path / "example.model.csv")
+        cache_path = str(tmp_path / "example.model.jsonld.cache")
+
+        model_df = load_df(helpers.get_data_path("example.model.csv"), data_model=True)
+        model_df.to_csv(csv_path, index=False)
+
+        se_obj = df_parser._convert_csv_to_data_model(csv_path, cache_path=cache_path)
+        assert se_obj.schema == df_parser._convert_csv_to_data_model(csv_path).schema
+        assert os.path.exists(cache_path)
+
+        # one-line edits only regenerate the records of the edited rows
+        patient_row = model_df.index[model_df["Attribute"] == "Patient"][0]
+        sex_row = model_df.index[model_df["Attribute"] == "Sex"][0]
+        model_df.loc[patient_row, "Description"] = "A person"
+        model_df.loc[sex_row, "Valid Values"] = "Female, Male, Other, Unknown"
+        model_df.to_csv(csv_path, index=False)
+
+        with monkeypatch.context() as m:
+            m.setattr(df_parser, "_add_schema_objects", None)
+            se_obj = df_parser._convert_csv_to_data_model(csv_path, cache_path=cache_path)
+
+        assert se_obj.schema == df_parser._convert_csv_to_data_model(csv_path).schema
+        assert se_obj.explore_class("Patient")["description"] == "A person"
+        assert se_obj.explore_class("Sex")["range"] == ["Female", "Male", "Other", "Unknown"]
+
+        # adding an attribute converts the whole data model again
+        model_df.loc[len(model_df)] = {"Attribute": "Age", "Required": False, "Parent": "DataProperty"}
+        model_df.to_csv(csv_path, index=False)
+
+        se_obj = df_parser._convert_csv_to_data_model(csv_path, cache_path=cache_path)
+        assert se_obj.schema == df_parser._convert_csv_to_data_model(csv_path).schema
+        assert df_parser.attribute_exists(se_obj, "Age")
+
+    def test_convert_csv_to_data_model_code_change(self, helpers, tmp_path, mocker):
+
+        csv_path = helpers.get_data_path("example.model.csv")
+        cache_path = str(tmp_path / "example.model.jsonld.cache")
+        df_parser._convert_csv_to_data_model(csv_path, cache_path=cache_path)
+
+        # the conversion cache of other code is not reused, even when the data model did not change
+        mocker.patch(
+            "schematic.schemas.convert_cache.get_code_fingerprint", return_value="changed code"
+        )
+        add_schema_objects = mocker.spy(df_parser, "_add_schema_objects")
+        se_obj = df_parser._convert_csv_to_data_model(csv_path, cache_path=cache_path)
+
+        add_schema_objects.assert_called_once()
+        assert se_obj.schema == df_parser._convert_csv_to_data_model(csv_path).schema
+
+    def test_get_conversion_cache_path(self, tmp_path, monkeypatch):
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        # conversion caches are kept in the private cache directory of the user, never alongside the output
+        cache_path = get_conversion_cache_path("example.model.jsonld")
+        assert os.path.dirname(cache_path) == str(tmp_path / "schematic" / "conversions")
+        assert os.stat(os.path.dirname(cache_path)).st_mode & 0o777 == 0o700
+        assert cache_path == get_conversion_cache_path(os.path.abspath("example.model.jsonld"))
+        assert cache_path != get_conversion_cache_path("other.model.jsonld")
+
+        # a cache directory others can write to is not used
+        os.chmod(tmp_path / "schematic" / "conversions", 0o777)
+        assert get_conversion_cache_path("example.model.jsonld") is None
+
     def test_get_property_label_from_display_name(self, helpers):
         se_obj = helpers.get_schema_explorer("example.model.jsonld")
 
@@ -268,4 +364,506 @@ class TestDfParser:
         assert(se_obj.get_class_label_from_display_name("model of manifestation") == "Modelofmanifestation")
         assert(se_obj.get_class_label_from_display_name("model of manifestation", strict_camel_case = True) == "ModelOfManifestation")
         assert(se_obj.get_class_label_from_display_name("model of manifestation") == "Modelofmanifestation")
-        assert(se_obj.get_class_label_from_display_name("model of manifestation", strict_camel_case = True) == "ModelOfManifestation")
\ No newline at end of file
+        assert(se_obj.get_class_label_from_display_name("model of manifestation", strict_camel_case = True) == "ModelOfManifestation")
+
+class TestSchemaExplorer:
+    def test_default_schema_is_lazy(self):
+
+        se_obj = SchemaExplorer()
+        assert se_obj._schema is None and se_obj._schema_nx is None
+
+        # the default schema is loaded on first access, as a private copy
+        assert "Thing" in se_obj.schema_nx
+        other_se_obj = SchemaExplorer()
+        assert other_se_obj.schema_nx is not se_obj.schema_nx
+        assert other_se_obj.schema["@graph"] is not se_obj.schema["@graph"]
+
+    def test_default_schema_not_loaded_with_schema(self, helpers, monkeypatch):
+
+        monkeypatch.setattr(
+            SchemaExplorer,
+            "load_default_schema",
+            lambda self: pytest.fail("default schema was loaded"),
+        )
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        assert "Patient" in se_obj.schema_nx
+
+    def test_relationship_digraphs_updated_on_edit(self, helpers):
+
+        se_obj = SchemaExplorer()
+        se_obj.load_default_schema()
+
+        # build the relationship indexes before the graph is edited
+        se_obj.get_digraph_by_edge_type("parentOf")
+
+        model_df = load_df(helpers.get_data_path("example.model.csv"), data_model=True)
+        se_obj = df_parser.create_nx_schema_objects(model_df, se_obj)
+
+        rebuilt_se_obj = SchemaExplorer()
+        rebuilt_se_obj.schema_nx = se_obj.schema_nx
+
+        for relationship in ["parentOf", "requiresDependency", "requiresComponent", "rangeValue", "domainValue"]:
+            digraph = se_obj.get_digraph_by_edge_type(relationship)
+            rebuilt_digraph = rebuilt_se_obj.get_digraph_by_edge_type(relationship)
+
+            assert set(digraph.nodes) == set(rebuilt_digraph.nodes)
+            assert set(digraph.edges) == set(rebuilt_digraph.edges)
+
+        assert set(se_obj.get_adjacent_nodes_by_relationship("Patient", "requiresDependency")) == {
+            v for (_, v, key) in se_obj.schema_nx.out_edges("Patient", keys=True) if key == "requiresDependency"
+        }
+        assert ("Patient", "Sex") in se_obj.get_edges_by_relationship("Patient", "requiresDependency")
+
+    def test_property_indexes(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        assert se_obj.find_class_specific_properties("Patient") == []
+
+        rel_dict = {
+            "schema:domainIncludes": {"domainValue": "in"},
+            "schema:rangeIncludes": {"rangeValue": "out"},
+        }
+        for property_display_name, property_range in [("Treated With", "Sex"), ("Resident Of", "Diagnosis")]:
+            new_property = df_parser.get_property(
+                se=se_obj,
+                property_display_name=property_display_name,
+                property_class_name="Patient",
+                description="A test property",
+                requires_range=[property_range],
+            )
+            se_obj.add_schema_object_nx(new_property, **rel_dict)
+
+        assert se_obj.find_class_specific_properties("Patient") == ["treatedWith", "residentOf"]
+        assert se_obj.explore_class("Patient")["properties"] == ["treatedWith", "residentOf"]
+        assert se_obj.explore_property("residentOf")["range"] == ["Diagnosis"]
+        assert se_obj.get_class_by_property("Treated With") == "Patient"
+        assert se_obj.find_class_usages("Sex") == [
+            {
+                "property": "treatedWith",
+                "property_used_on_class": "Patient",
+                "description": "A test property",
+            }
+        ]
+
+        # replacing a property record moves it out of its former domain
+        edited_property = df_parser.get_property(
+            se=se_obj,
+            property_display_name="Treated With",
+            property_class_name="Biospecimen",
+            description="A test property",
+        )
+        se_obj.edit_schema_object_nx(edited_property)
+
+        assert se_obj.find_class_specific_properties("Patient") == ["residentOf"]
+        assert se_obj.find_class_specific_properties("Biospecimen") == ["treatedWith"]
+        assert se_obj.find_class_usages("Sex") == []
+
+    def test_find_parent_classes(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        assert se_obj.find_parent_classes("Female") == [["DataProperty", "Sex"]]
+        assert se_obj.find_parent_classes("Thing") == []
+
+        # a class with two parents is reached by one path through each of them
+        new_class = df_parser.get_class(
+            se=se_obj,
+            class_display_name="Patient Biospecimen",
+            description="A test class",
+            subclass_of=["Patient", "Biospecimen"],
+        )
+        se_obj.add_schema_object_nx(new_class, **df_parser.rel_dict)
+
+        assert se_obj.find_parent_classes("PatientBiospecimen") == [
+            ["DataType", "Patient"],
+            ["DataType", "Biospecimen"],
+        ]
+        assert se_obj.find_parent_classes("PatientBiospecimen", max_paths=1) == [
+            ["DataType", "Patient"]
+        ]
+
+    def test_descendants_by_edge_type(self, helpers, tmp_path, caplog):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        assert se_obj.get_descendants_by_edge_type(
+            "Patient", "requiresDependency", ordered=True
+        ) == ["Patient", "PatientID", "Sex", "YearofBirth", "Diagnosis", "Component"]
+        assert se_obj.get_descendants_by_edge_type("Sex", "requiresDependency") == []
+
+        # adding to the graph updates the descendants
+        new_class = df_parser.get_class(
+            se=se_obj,
+            class_display_name="CancerStage",
+            description="A test attribute",
+            requires_dependencies=["Patient"],
+        )
+        se_obj.add_schema_object_nx(new_class, **df_parser.rel_dict)
+
+        assert se_obj.get_descendants_by_edge_type(
+            "CancerStage", "requiresDependency", ordered=True
+        ) == ["CancerStage", "Patient", "PatientID", "Sex", "YearofBirth", "Diagnosis", "Component"]
+
+        # cycles are reported when the schema is loaded, and raised when the nodes on them are ordered
+        for class_display_name, requires_dependencies in [
+            ("CancerGrade", ["TumorGrade"]),
+            ("TumorGrade", ["CancerGrade"]),
+        ]:
+            new_class = df_parser.get_class(
+                se=se_obj,
+                class_display_name=class_display_name,
+                description="A test attribute",
+                requires_dependencies=requires_dependencies,
+            )
+            se_obj.add_schema_object_nx(new_class, **df_parser.rel_dict)
+        se_obj.export_schema(tmp_path / "cyclic.model.jsonld")
+
+        cyclic_se_obj = SchemaExplorer()
+        cyclic_se_obj.load_schema(str(tmp_path / "cyclic.model.jsonld"))
+
+        assert "cycle of requiresDependency relationships between: CancerGrade, TumorGrade" in caplog.text
+        with pytest.raises(nx.NetworkXUnfeasible):
+            cyclic_se_obj.get_descendants_by_edge_type("CancerGrade", "requiresDependency", ordered=True)
+        assert cyclic_se_obj.get_descendants_by_edge_type(
+            "Patient", "requiresDependency", ordered=True
+        ) == ["Patient", "PatientID", "Sex", "YearofBirth", "Diagnosis", "Component"]
+
+
+    def test_compact_graph(self, helpers, mocker):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+        graph = se_obj.schema_nx
+
+        compact_graph = CompactSchemaGraph(graph)
+
+        assert list(compact_graph.nodes(data=True)) == list(graph.nodes(data=True))
+        assert list(compact_graph.edges) == list(graph.edges)
+        assert list(compact_graph.in_edges("Patient", keys=True)) == list(graph.in_edges("Patient", keys=True))
+        assert list(compact_graph.successors("Patient")) == list(graph.successors("Patient"))
+        assert list(compact_graph.predecessors("Sex")) == list(graph.predecessors("Sex"))
+        descendants = nx.descendants(graph, "Patient")
+        assert compact_graph.get_descendants("Patient") == [node for node in graph if node in descendants]
+
+        exported_graph = compact_graph.to_networkx()
+        assert list(exported_graph.nodes(data=True)) == list(graph.nodes(data=True))
+        assert list(exported_graph.edges(keys=True)) == list(graph.edges(keys=True))
+        assert list(exported_graph.in_edges(keys=True)) == list(graph.in_edges(keys=True))
+
+        # schemas are loaded into a compact graph when configured so, and edits turn it back into a networkx graph
+        mocker.patch("schematic.CONFIG.DATA", {"model": {"compact_graph": True}})
+        compact_se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        assert isinstance(compact_se_obj.schema_nx, CompactSchemaGraph)
+        assert compact_se_obj.explore_class("Patient") == se_obj.explore_class("Patient")
+        assert compact_se_obj.get_descendants_by_edge_type(
+            "Patient", "requiresDependency", ordered=True
+        ) == se_obj.get_descendants_by_edge_type("Patient", "requiresDependency", ordered=True)
+
+        new_class = df_parser.get_class(
+            se=compact_se_obj,
+            class_display_name="CancerStage",
+            description="A test attribute",
+            requires_dependencies=["Patient"],
+        )
+        compact_se_obj.add_schema_object_nx(new_class, **df_parser.rel_dict)
+
+        assert isinstance(compact_se_obj.schema_nx, nx.MultiDiGraph)
+        assert "Patient" in compact_se_obj.get_descendants_by_edge_type("CancerStage", "requiresDependency")
+
+
+class TestCompiledSchema:
+    def test_node_lookups(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+        compiled_schema = se_obj.get_compiled_schema()
+
+        assert compiled_schema.get_node_label("Family History") == "FamilyHistory"
+        assert compiled_schema.get_node_label("Not A Node") == ""
+        # display names that are not those of a node are resolved, not memoized
+        assert "Not A Node" not in compiled_schema._display_name_labels
+
+        family_history = compiled_schema.get_node("FamilyHistory")
+        assert family_history.display_name == "Family History"
+        assert family_history.required
+        assert family_history.validation_rules == ("list strict",)
+        assert "Colorectal" in family_history.range_values
+
+        patient = compiled_schema.get_node("Patient")
+        assert "PatientID" in patient.dependencies
+
+    def test_rebuilt_after_edit(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+        compiled_schema = se_obj.get_compiled_schema()
+
+        patient_id = se_obj.schema["@graph"][
+            [record["rdfs:label"] for record in se_obj.schema["@graph"]].index("PatientID")
+        ]
+        patient_id["sms:validationRules"] = ["unique"]
+        se_obj.edit_class(patient_id)
+
+        assert se_obj.get_compiled_schema() is not compiled_schema
+        assert se_obj.get_compiled_schema().get_node("PatientID").validation_rules == ("unique",)
+
+
+class TestRelationshipClosure:
+    def test_ordered_descendants(self):
+
+        closure = RelationshipClosure(
+            [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "e"), ("a", "f")]
+        )
+
+        assert closure.get_descendants("a") == ["b", "c", "d", "e", "f"]
+        assert closure.get_descendants("e") == []
+        # by generation, the nodes of each one in the order their last predecessor was reached (a depth-first order,
+        # e.g. that of networkx < 2.6, would put d and e before f)
+        assert closure.get_ordered_descendants("a") == ["a", "b", "c", "f", "d", "e"]
+        assert closure.get_ordered_descendants("c") == ["c", "d", "e"]
+
+        closure = RelationshipClosure([("a", "b"), ("b", "a"), ("c", "a")])
+
+        assert closure.cycles == [["a", "b"]]
+        assert closure.get_descendants("c") == ["a", "b"]
+        with pytest.raises(nx.NetworkXUnfeasible):
+            closure.get_ordered_descendants("c")
+
+
+class TestModelCache:
+    def test_get_set(self, tmp_path):
+
+        model_cache = ModelCache(str(tmp_path))
+        key = ModelCache.get_key(b'{"@graph": []}')
+
+        assert key != ModelCache.get_key(b'{"@graph": [] }')
+        assert model_cache.get(key) is None
+
+        model_cache.set(key, {"schema": {"@graph": []}})
+
+        assert model_cache.get(key) == {"schema": {"@graph": []}}
+
+    def test_key_and_location(self, config, tmp_path, monkeypatch):
+
+        # the code the models are pickled with is part of the key, as the version is "unknown" in source checkouts
+        key = ModelCache.get_key(b'{"@graph": []}')
+        monkeypatch.setattr(
+            "schematic.schemas.model_cache.get_code_fingerprint", lambda: "changed code"
+        )
+        assert key != ModelCache.get_key(b'{"@graph": []}')
+
+        # models are cached in the private cache directory of the user by default
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setitem(config.DATA["model"], "cache", {"max_size": 1})
+        assert get_model_cache().location == str(tmp_path / "schematic" / "models")
+        assert os.stat(tmp_path / "schematic" / "models").st_mode & 0o777 == 0o700
+
+        # and never unpickled from a directory others can write to
+        os.chmod(tmp_path / "schematic" / "models", 0o777)
+        assert get_model_cache() is None
+        with pytest.raises(PermissionError):
+            ModelCache(str(tmp_path / "schematic" / "models"))
+
+    def test_eviction(self, tmp_path):
+
+        # room for a single entry
+        model_cache = ModelCache(str(tmp_path), max_size=0.001)
+
+        model_cache.set("old", "x" * 600)
+        os.utime(tmp_path / "old.pickle", (0, 0))
+        model_cache.set("new", "y" * 600)
+
+        assert model_cache.get("old") is None
+        assert model_cache.get("new") == "y" * 600
+
+        # expired entries are discarded on read
+        model_cache = ModelCache(str(tmp_path), max_age=1)
+        os.utime(tmp_path / "new.pickle", (0, 0))
+
+        assert model_cache.get("new") is None
+
+    def test_load_schema_from_cache(self, helpers, config, tmp_path, monkeypatch):
+
+        monkeypatch.setitem(
+            config.DATA["model"], "cache", {"location": str(tmp_path)}
+        )
+        jsonld_path = helpers.get_data_path("example.model.jsonld")
+
+        se_obj = SchemaExplorer()
+        se_obj.load_schema(jsonld_path)
+
+        assert len(os.listdir(tmp_path)) == 1
+
+        # second load must not rebuild the graph
+        cached_se_obj = SchemaExplorer()
+        monkeypatch.setattr(
+            "schematic.schemas.explorer.load_schema_into_networkx",
+            lambda schema: pytest.fail("data model was not read from cache"),
+        )
+        cached_se_obj.load_schema(jsonld_path)
+
+        assert cached_se_obj.schema == se_obj.schema
+        assert set(cached_se_obj.schema_nx.edges) == set(se_obj.schema_nx.edges)
+        assert cached_se_obj.get_compiled_schema().get_node_label("Patient ID") == "PatientID"
+
+
+class TestSchemaGenerator:
+    def test_json_schema_memoized(self, helpers, monkeypatch):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+        sg = SchemaGenerator(schema_explorer=se_obj)
+
+        json_schema = sg.get_json_schema_requirements("Patient", "Patient_validation")
+        assert "Patient ID" in json_schema["required"]
+
+        # returned JSON schemas are copies of the memoized one
+        json_schema["required"].clear()
+
+        build_json_schema = SchemaGenerator._build_json_schema
+        monkeypatch.setattr(
+            SchemaGenerator,
+            "_build_json_schema",
+            lambda self, *args: pytest.fail("JSON schema was not memoized"),
+        )
+        memoized_json_schema = sg.get_json_schema_requirements("Patient", "Patient_validation")
+        assert "Patient ID" in memoized_json_schema["required"]
+
+        # editing the data model invalidates the memoized JSON schema
+        monkeypatch.setattr(SchemaGenerator, "_build_json_schema", build_json_schema)
+        patient_id = se_obj.schema["@graph"][
+            [record["rdfs:label"] for record in se_obj.schema["@graph"]].index("PatientID")
+        ]
+        patient_id["sms:required"] = "sms:false"
+        se_obj.edit_class(patient_id)
+
+        edited_json_schema = sg.get_json_schema_requirements("Patient", "Patient_validation")
+        assert "Patient ID" not in edited_json_schema["required"]
+        assert "Patient ID" in edited_json_schema["properties"]
+
+    def test_compile_all_component_schemas(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+        sg = SchemaGenerator(schema_explorer=se_obj)
+
+        json_schemas = sg.compile_all_component_schemas(schema_names={"Patient": "Patient_manifest"})
+
+        assert list(json_schemas) == list(se_obj.get_digraph_by_edge_type("requiresComponent").nodes())
+        assert json_schemas["Patient"]["title"] == "Patient_manifest"
+
+        # same JSON schemas as generated one component at a time
+        _json_schema_cache.clear()
+        for component, json_schema in json_schemas.items():
+            schema_name = json_schema["title"]
+            assert json_schema == sg.get_json_schema_requirements(component, schema_name)
+
+
+class TestSchemaValidator:
+    def test_class_lookups(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+        sv = SchemaValidator(se_obj.schema)
+
+        # schema.org terms are expanded like the terms of the schema
+        assert "http://schema.org/Thing" in sv.schemaorg["classes"]
+        assert "http://schema.org/name" in sv.schemaorg["properties"]
+        assert "http://schema.biothings.io/Patient" in sv.extension_schema["classes"]
+        assert "http://schema.biothings.io/ensembl" in sv.extension_schema["properties"]
+
+        sv.validate_subclassof_field({"@id": "http://schema.org/Thing"})
+        sv.validate_subclassof_field([{"@id": "http://schema.biothings.io/Patient"}])
+        with pytest.raises(AssertionError):
+            sv.validate_domainIncludes_field({"@id": "http://schema.biothings.io/NotAClass"})
+
+    def test_validate_full_schema(self):
+
+        record = {
+            "@id": "bts:Patient",
+            "@type": "rdfs:Class",
+            "rdfs:comment": None,
+            "rdfs:label": "Patient",
+            "rdfs:subClassOf": [{"@id": "schema:Thing"}],
+        }
+        schema = {
+            "@context": {"bts": "http://schema.biothings.io/", "schema": "http://schema.org/"},
+            "@graph": [record],
+            "@id": "http://schema.biothings.io/#0.1",
+        }
+        SchemaValidator(schema).validate_full_schema()
+
+        schema["@graph"] = [record, dict(record)]
+        with pytest.raises(Exception, match="Duplicates detected"):
+            SchemaValidator(schema).validate_full_schema()
+
+        schema["@graph"] = [dict(record, **{"rdfs:label": "Patients"})]
+        with pytest.raises(AssertionError):
+            SchemaValidator(schema).validate_full_schema()
+
+        # class records are validated
+        schema["@graph"] = [dict(record, **{"@id": "bts:patient", "rdfs:label": "patient"})]
+        with pytest.raises(AssertionError):
+            SchemaValidator(schema).validate_full_schema()
+
+        schema["@graph"] = [{key: value for key, value in record.items() if key != "rdfs:subClassOf"}]
+        with pytest.raises(ValidationError):
+            SchemaValidator(schema).validate_full_schema()
+
+        # and so are property records, written with compact CURIEs
+        property_record = {
+            "@id": "bts:patientId",
+            "@type": "rdf:Property",
+            "rdfs:comment": None,
+            "rdfs:label": "patientId",
+            "schema:domainIncludes": {"@id": "bts:Patient"},
+            "schema:rangeIncludes": {"@id": "schema:Text"},
+        }
+        schema["@graph"] = [record, property_record]
+        SchemaValidator(schema).validate_full_schema()
+
+        schema["@graph"] = [record, dict(property_record, **{"schema:domainIncludes": {"@id": "bts:Sample"}})]
+        with pytest.raises(AssertionError, match="value of domainincludes not recorded in schema"):
+            SchemaValidator(schema).validate_full_schema()
+
+    def test_validate_full_schema_of_model(self, helpers):
+
+        se_obj = helpers.get_schema_explorer("example.model.jsonld")
+
+        SchemaValidator(se_obj.schema).validate_full_schema()
+
+
+class TestSchemaDiff:
+    def test_diff_data_models(self, helpers, tmp_path):
+
+        schema_path = helpers.get_data_path("example.model.jsonld")
+        with open(schema_path) as f:
+            schema = json.load(f)
+
+        records = {record["rdfs:label"]: record for record in schema["@graph"]}
+        records["Sex"]["schema:rangeIncludes"] = [{"@id": "bts:Female"}, {"@id": "bts:Male"}]
+        records["Biospecimen"]["sms:requiresDependency"].reverse()
+        records["Other"]["rdfs:comment"] = "Any other sex"
+
+        new_schema_path = tmp_path / "example.model.jsonld"
+        with open(new_schema_path, "w") as f:
+            json.dump(schema, f)
+
+        schema_diff = diff_data_models(schema_path, str(new_schema_path))
+
+        assert not schema_diff.is_empty()
+        assert schema_diff.added_nodes == []
+        assert schema_diff.removed_nodes == []
+        assert schema_diff.modified_nodes == {
+            "Biospecimen": ["requiresDependency"],
+            "Other": ["comment", "description"],
+            "Sex": ["rangeIncludes"],
+        }
+        assert schema_diff.added_edges == {}
+        assert schema_diff.removed_edges == {"rangeValue": [("Sex", "Other")]}
+        assert schema_diff.reordered_edges == {"requiresDependency": ["Biospecimen"]}
+        assert schema_diff.affected_components == ["Biospecimen", "Patient"]
+
+        assert json.loads(json.dumps(schema_diff.to_dict()))["edges"] == {
+            "rangeValue": {"added": [], "removed": [["Sex", "Other"]], "reordered": []},
+            "requiresDependency": {"added": [], "removed": [], "reordered": ["Biospecimen"]},
+        }
+
+        assert diff_data_models(schema_path, schema_path).is_empty()
@@ -11,9 +11,12 @@ from pandas.testing import assert_frame_equal
 from schematic.schemas.explorer import SchemaExplorer
 from schematic.schemas import df_parser
 from schematic.utils import general
+from schematic.utils import cache_utils
+from schematic.utils import curie_utils
 from schematic.utils import cli_utils
 from schematic.utils import io_utils
 from schematic.utils import df_utils
+from schematic.utils import schema_utils
 from schematic.utils import validate_utils
 from schematic.exceptions import (
     MissingConfigValueError,
@@ -184,6 +187,89 @@ class TestIOUtils:
         actual_graph_keys = len(schema_org_schema["@graph"])
         assert expected_graph_keys == actual_graph_keys
 
+    def test_iter_jsonld_records(self, helpers):
+
+        jsonld_path = helpers.get_data_path("example.model.jsonld")
+        schema = io_utils.load_json(jsonld_path)
+
+        # records are the same whichever way the document is split into chunks
+        for chunk_size in [1, 100, 2 ** 16]:
+            records = list(io_utils.iter_jsonld_records(jsonld_path, chunk_size=chunk_size))
+            assert records == schema["@graph"]
+
+        bts_records = list(io_utils.iter_jsonld_records(jsonld_path, namespaces=["bts"]))
+        assert bts_records == [
+            record for record in schema["@graph"] if record["@id"].startswith("bts:")
+        ]
+
+        # the schema graph can be built while the document is read
+        schema_graph = schema_utils.load_schema_into_networkx(schema)
+        streamed_graph = schema_utils.load_schema_into_networkx(
+            io_utils.iter_jsonld_records(jsonld_path)
+        )
+        assert list(schema_graph.nodes(data=True)) == list(streamed_graph.nodes(data=True))
+        assert list(schema_graph.edges(keys=True)) == list(streamed_graph.edges(keys=True))
+
+    def test_iter_jsonld_records_invalid(self, tmpdir):
+
+        jsonld_file = tmpdir.join("invalid.jsonld")
+        jsonld_file.write_text('{"@graph": [{"@id": "bts:A"}', encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            list(io_utils.iter_jsonld_records(str(jsonld_file)))
+
+
+class TestCacheUtils:
+    def test_lru_cache(self):
+
+        cache = cache_utils.LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # getting "a" makes "b" the least recently used
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+        cache.clear()
+        assert cache.get("a") is None
+
+
+class TestCurieUtils:
+    def test_extract_name_from_uri_or_curie(self):
+
+        assert curie_utils.extract_name_from_uri_or_curie("bts:Patient") == "Patient"
+        assert curie_utils.extract_name_from_uri_or_curie("http://schema.org/Thing") == "Thing"
+        assert curie_utils.extract_name_from_uri_or_curie("https://w3id.org/a:b/Sex") == "Sex"
+
+        with pytest.raises(ValueError):
+            curie_utils.extract_name_from_uri_or_curie("Patient")
+
+    def test_curie_resolver(self, helpers):
+
+        schema = io_utils.load_json(helpers.get_data_path("example.model.jsonld"))
+        resolver = curie_utils.CurieResolver(schema["@context"], schema["@graph"])
+
+        assert resolver.get_name("bts:Patient") == "Patient"
+        assert resolver.get_name("bts:Patient") is resolver.get_name("bts:Patient")
+
+        patient = next(record for record in schema["@graph"] if record["@id"] == "bts:Patient")
+        assert resolver.get_label("bts:Patient") == curie_utils.uri2label("bts:Patient", schema) == "Patient"
+        assert resolver.get_label("bts:Unknown") is None
+
+        # replacing a record updates its label
+        resolver.remove_record(patient)
+        resolver.add_record({**patient, "rdfs:label": "Person"})
+        assert resolver.get_label("bts:Patient") == "Person"
+
+        assert resolver.expand_curie("bts:Patient") == "http://schema.biothings.io/Patient"
+        assert resolver.expand_curie("rdfs:Class") == "rdfs:Class"
+
+        assert resolver.expand_schema(schema) == curie_utils.expand_curies_in_schema(schema)
+
 
 class TestDfUtils:
     def test_update_df_col_present(self, helpers):
@@ -224,6 +310,16 @@ class TestDfUtils:
 
         assert_frame_equal(trimmed_df, local_manifest)
 
+    def test_load_df_chunks(self, helpers):
+        manifest_path = helpers.get_data_path("mock_manifests/Invalid_Test_Manifest.csv")
+
+        df = df_utils.load_df(manifest_path, preserve_raw_input=False, dtype="string")
+        chunks = list(df_utils.load_df_chunks(manifest_path, 2, preserve_raw_input=False, dtype="string"))
+
+        # rows keep their position in the manifest as index, across chunks
+        assert [chunk.index.tolist() for chunk in chunks] == [[0, 1], [2]]
+        assert_frame_equal(pd.concat(chunks).astype(str), df.astype(str))
+
     def test_update_dataframe(self):
         input_df = pd.DataFrame(
             {
@@ -1,13 +1,22 @@
 import os
+import json
 import logging
 import re
 import jsonschema
 import pytest
 from pathlib import Path
 import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
 
 from schematic.models.validate_attribute import ValidateAttribute, GenerateError
+from schematic.models import validate_manifest
 from schematic.models.validate_manifest import ValidateManifest
+from schematic.models.json_schema_checks import compile_validity_check, get_valid_rows, UndecidedInstance
+from schematic.models.validation_plan import get_validation_plan, UNIMPLEMENTED_EXPECTATIONS
+from schematic.models.GE_Helpers import GreatExpectationsHelpers
 from schematic.models.metadata import MetadataModel
 from schematic.store.synapse import SynapseStorage
 from schematic.schemas.generator import SchemaGenerator
@@ -273,8 +282,38 @@ class TestManifestValidation:
             invalid_entry = 'http://googlef.com/'
             ) in errors
 
+        assert GenerateError.generate_content_error(
+            val_rule = 'unique error', 
+            attribute_name = 'Check Unique',
+            sg = sg,
+            row_num = [2,3,4],
+            error_val = ['str1'],  
+            )[0] in errors
+
+        assert GenerateError.generate_content_error(
+            val_rule = 'inRange 50 100 error', 
+            attribute_name = 'Check Range',
+            sg = sg,
+            row_num = [3],
+            error_val = [30], 
+            )[0] in errors
+
         
         #Check Warnings
+        assert GenerateError.generate_content_error(
+            val_rule = 'recommended', 
+            attribute_name = 'Check Recommended',
+            sg = sg,
+            )[1] in warnings
+        
+        assert GenerateError.generate_content_error(
+            val_rule = 'protectAges', 
+            attribute_name = 'Check Ages',
+            sg = sg,
+            row_num = [2,3],
+            error_val = [6549,32851], 
+            )[1] in warnings
+
         assert GenerateError.generate_cross_warning(
             val_rule = 'matchAtLeastOne',
             row_num = '[3]',
@@ -362,4 +401,384 @@ class TestManifestValidation:
 
 
         
-        
\ No newline at end of file
+        
+
+class TestValidateAttribute:
+    def test_type_validation(self, helpers, sg):
+
+        va = ValidateAttribute()
+        manifest_col = pd.Series(
+            [1, np.int64(2), 2.5, "three", "", 0, True, np.nan, None], name="Check Type"
+        )
+
+        expected_invalid = {
+            "num": [(5, "three")],
+            "int": [(4, "2.5"), (5, "three"), (9, "nan")],
+            "float": [(2, "1"), (3, "2"), (5, "three"), (8, "True")],
+            "str": [(2, "1"), (3, "2"), (4, "2.5"), (8, "True"), (9, "nan")],
+        }
+        for val_rule, invalid_entries in expected_invalid.items():
+            errors, warnings = va.type_validation(val_rule, manifest_col)
+
+            assert warnings == []
+            assert errors == [
+                GenerateError.generate_type_error(
+                    val_rule,
+                    row_num=str(row_num),
+                    attribute_name="Check Type",
+                    invalid_entry=invalid_entry,
+                )
+                for (row_num, invalid_entry) in invalid_entries
+            ]
+
+        # columns of a numeric dtype are classified by their dtype
+        float_col = pd.Series([1.5, 0.0, np.nan], name="Check Float")
+        assert va.type_validation("float", float_col) == ([], [])
+        assert [error[0] for error in va.type_validation("int", float_col)[0]] == ["2", "4"]
+
+    def test_regex_validation(self, sg):
+
+        vm = ValidateManifest([], None, None, sg, None)
+
+        manifest_col = pd.Series(["a", "b,c", "", "gh", 5], name="Check Regex Single")
+        errors, warnings = ValidateAttribute.regex_validation(vm, "regex search [a-f]", manifest_col)
+
+        assert warnings == []
+        assert errors == [
+            GenerateError.generate_regex_error(
+                "regex search [a-f]",
+                "[a-f]",
+                row_num=str(row_num),
+                module_to_call="search",
+                attribute_name="Check Regex Single",
+                invalid_entry=invalid_entry,
+            )
+            for (row_num, invalid_entry) in [(5, "gh"), (6, "5")]
+        ]
+
+        # list attributes are checked element by element, whether or not the list rule has split the values already
+        manifest_col = pd.Series(["a,b", "a, gh, xy", "c"], name="Check Regex List")
+        expected_errors = [
+            GenerateError.generate_regex_error(
+                "regex match [a-f]",
+                "[a-f]",
+                row_num="3",
+                module_to_call="match",
+                attribute_name="Check Regex List",
+                invalid_entry=["a", "gh", "xy"],
+            )
+        ] * 2
+
+        errors, _ = ValidateAttribute.regex_validation(vm, "regex match [a-f]", manifest_col)
+        assert errors == expected_errors
+
+        _, _, list_col = ValidateAttribute.list_validation(vm, "list strict", manifest_col)
+        errors, _ = ValidateAttribute.regex_validation(vm, "regex match [a-f]", list_col)
+        assert errors == expected_errors
+
+        with pytest.raises(jsonschema.ValidationError):
+            ValidateAttribute.regex_validation(vm, "regex match", manifest_col)
+
+
+class TestValidationPlan:
+    def test_validation_plan(self, helpers, sg):
+
+        validation_plan = get_validation_plan(sg, "MockComponent")
+
+        # plans are shared by the validations against the same component of the same data model
+        assert get_validation_plan(sg, "MockComponent") is validation_plan
+        assert get_validation_plan(SchemaGenerator(helpers.get_data_path("example.model.jsonld")), "MockComponent") is validation_plan
+        assert get_validation_plan(sg) is not validation_plan
+
+        column_plan = validation_plan.get_column("Check Regex List")
+        assert column_plan.is_list
+        assert [validation_rule.rule for validation_rule in column_plan.rules] == sg.get_node_validation_rules("Check Regex List")
+
+        list_rule, regex_rule = column_plan.rules
+        assert (list_rule.rule_type, list_rule.args, list_rule.method) == ("list", ("strict",), "list_validation")
+        assert (regex_rule.rule_type, regex_rule.args, regex_rule.method) == ("regex", ("match", "[a-f]"), "regex_validation")
+        assert not regex_rule.great_expectations and regex_rule.in_house
+        assert regex_rule.is_validated_in_house(restrict_rules=False)
+
+        unique_rule, = validation_plan.get_column("Check Unique").rules
+        assert unique_rule.great_expectations and unique_rule.in_house
+        assert not unique_rule.is_validated_in_house(restrict_rules=False)
+        assert unique_rule.is_validated_in_house(restrict_rules=True)
+        assert unique_rule.message_level == GenerateError.get_message_level(unique_rule.rule, sg, "Check Unique")
+
+        int_rule, = validation_plan.get_column("Check Int").rules
+        assert not int_rule.is_validated_in_house(restrict_rules=False)
+        assert int_rule.is_validated_in_house(restrict_rules=True)
+
+        # columns that are not attributes of the data model have no rules
+        assert validation_plan.get_column("Not An Attribute").rules == ()
+        assert not validation_plan.get_column("Check Regex Single").is_list
+
+
+class TestValidateManifestValues:
+    json_schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {
+            "Diagnosis": {"enum": ["Healthy", "Cancer"]},
+            "Cancer Type": {"enum": ["Breast", "Skin", ""]},
+            "Family History": {"type": "array", "items": {"enum": ["Breast", "Skin", ""]}, "maxItems": 2},
+            "Sex": {"not": {"type": "null"}, "minLength": 1},
+            "Notes": {},
+        },
+        "required": ["Diagnosis", "Sex"],
+        "allOf": [
+            {
+                "if": {"properties": {"Diagnosis": {"enum": ["Cancer"]}}, "required": ["Diagnosis"]},
+                "then": {"properties": {"Cancer Type": {}}, "required": ["Cancer Type"]},
+            }
+        ],
+    }
+
+    def get_manifest(self):
+        return pd.DataFrame(
+            {
+                "Diagnosis": ["Healthy", "Cancer", "Cancer", "Unknown", np.nan, "Cancer"],
+                "Cancer Type": [np.nan, "Skin", np.nan, "Lung", "", "Breast"],
+                "Family History": [["Breast"], ["Skin", "Lung"], np.nan, ["Breast", "Skin", ""], [""], ["Breast"]],
+                "Sex": ["Female", "", "Male", np.nan, "Male", "Female"],
+                "Notes": ["a", 1, 2.5, np.nan, "b", "c"],
+            }
+        )
+
+    def test_validate_manifest_values(self, sg):
+        vm = ValidateManifest([], None, None, sg, self.json_schema)
+
+        # errors of the rows, as validating each row, serialized to JSON, with jsonschema reports them
+        annotations = json.loads(self.get_manifest().astype({"Notes": str}).to_json(orient="records"))
+        expected_errors = [
+            [i + 2, error.path[-1], error.message, error.instance]
+            if len(error.path) > 0
+            else [i + 2, "Wrong schema", error.message, "Wrong schema"]
+            for i, annotation in enumerate(annotations)
+            for error in sorted(
+                jsonschema.Draft7Validator(self.json_schema).iter_errors(annotation),
+                key=jsonschema.exceptions.relevance,
+            )
+        ]
+        assert len(expected_errors) == 10
+
+        errors, warnings = vm.validate_manifest_values(self.get_manifest(), self.json_schema)
+        assert errors == expected_errors
+        assert warnings == []
+
+        errors, _ = vm.validate_manifest_values(self.get_manifest(), self.json_schema, n_workers=2)
+        assert errors == expected_errors
+
+    def test_compile_validity_check(self):
+        is_valid = compile_validity_check(self.json_schema)
+
+        assert is_valid({"Diagnosis": "Healthy", "Sex": "Male", "Family History": ["Skin"]})
+        assert not is_valid({"Diagnosis": "Cancer", "Sex": "Male"})
+        assert not is_valid({"Diagnosis": "Healthy", "Sex": None})
+        assert not is_valid({"Diagnosis": "Healthy", "Sex": "Male", "Family History": ["Skin", "Lung"]})
+        # values an enum is not checked against exactly are left to jsonschema
+        with pytest.raises(UndecidedInstance):
+            is_valid({"Diagnosis": 1, "Sex": "Male"})
+
+        assert compile_validity_check({"properties": {"Age": {"pattern": "[0-9]+"}}}) is None
+
+    def test_get_valid_rows(self):
+        manifest = self.get_manifest()
+
+        valid_rows = get_valid_rows(self.json_schema, manifest)
+        assert valid_rows.tolist() == [False, False, False, False, False, True]
+        # rows that are not certainly valid are validated with jsonschema, which finds errors in all of them here
+        validator = jsonschema.Draft7Validator(self.json_schema)
+        assert not any(validator.is_valid(instance) for instance in json.loads(manifest[~valid_rows].to_json(orient="records")))
+
+        # conditional requirements: "Cancer Type" is only required (and checked) if "Diagnosis" is "Cancer"
+        manifest = pd.DataFrame({"Diagnosis": ["Healthy", "Cancer", "Cancer"], "Sex": ["Female"] * 3})
+        assert get_valid_rows(self.json_schema, manifest).tolist() == [True, False, False]
+        manifest["Cancer Type"] = ["", "Skin", ""]
+        assert get_valid_rows(self.json_schema, manifest).tolist() == [True, True, True]
+
+        assert get_valid_rows({"properties": {"Sex": {}}, "anyOf": [{"required": ["Sex"]}]}, manifest) is None
+
+
+class TestValidateManifestRules:
+    def test_validate_manifest_rules_in_parallel(self, helpers, sg):
+        manifestPath = helpers.get_data_path("mock_manifests/Invalid_Test_Manifest.csv")
+        manifest = helpers.get_data_frame(manifestPath, preserve_raw_input=False)
+        # rules that need network access (url, cross manifest validation) are left out
+        manifest = manifest.drop(columns=[col for col in manifest.columns if "URL" in col or "Match" in col])
+
+        vm = ValidateManifest([], manifest, manifestPath, sg, None, get_validation_plan(sg, "MockComponent"))
+        expected_manifest, expected_errors, expected_warnings = vm.validate_manifest_rules(
+            manifest.copy(), sg, restrict_rules=True, project_scope=None
+        )
+        assert expected_errors
+
+        validated_manifest, errors, warnings = vm.validate_manifest_rules(
+            manifest.copy(), sg, restrict_rules=True, project_scope=None, n_workers=2
+        )
+        # same errors, in column order, and the same manifest (e.g. list columns split)
+        assert errors == expected_errors
+        assert warnings == expected_warnings
+        pd.testing.assert_frame_equal(validated_manifest, expected_manifest)
+        assert validated_manifest["Check List"].map(type).eq(list).all()
+
+
+class TestGreatExpectationsHelpers:
+    def test_expectation_suite_reuse(self, helpers, sg):
+        manifestPath = helpers.get_data_path("mock_manifests/Invalid_Test_Manifest.csv")
+        manifest = helpers.get_data_frame(manifestPath, preserve_raw_input=False)
+
+        def build_checkpoint(manifest):
+            ge_helpers = GreatExpectationsHelpers(
+                sg, UNIMPLEMENTED_EXPECTATIONS, manifest, manifestPath, component="MockComponent"
+            )
+            ge_helpers.build_context()
+            ge_helpers.build_expectation_suite()
+            ge_helpers.build_checkpoint()
+            return ge_helpers
+
+        ge_helpers = build_checkpoint(manifest)
+        assert ge_helpers.suite.expectations
+        assert ge_helpers.checkpoint_name in ge_helpers.context.list_checkpoints()
+
+        # the in-memory context, suite and checkpoint are reused for manifests with the same columns
+        reused_ge_helpers = build_checkpoint(manifest.copy())
+        assert reused_ge_helpers.context is ge_helpers.context
+        assert reused_ge_helpers.expectation_suite_name == ge_helpers.expectation_suite_name
+        assert reused_ge_helpers.checkpoint_name == ge_helpers.checkpoint_name
+
+        other_ge_helpers = build_checkpoint(manifest.drop(columns=["Check Unique"]))
+        assert other_ge_helpers.expectation_suite_name != ge_helpers.expectation_suite_name
+        assert len(other_ge_helpers.suite.expectations) == len(ge_helpers.suite.expectations) - 1
+
+        results = other_ge_helpers.context.run_checkpoint(
+            checkpoint_name=other_ge_helpers.checkpoint_name,
+            batch_request={
+                "runtime_parameters": {"batch_data": manifest},
+                "batch_identifiers": {"default_identifier_name": "manifestID"},
+            },
+            result_format={'result_format': 'COMPLETE'},
+        )
+        assert len(results.list_validation_results()[0]["results"]) == len(other_ge_helpers.suite.expectations)
+
+        for built_ge_helpers in [ge_helpers, reused_ge_helpers, other_ge_helpers]:
+            built_ge_helpers.release()
+
+    def test_evicted_suite_in_use(self, helpers, sg, monkeypatch):
+        manifestPath = helpers.get_data_path("mock_manifests/Invalid_Test_Manifest.csv")
+        manifest = helpers.get_data_frame(manifestPath, preserve_raw_input=False)
+        monkeypatch.setattr("schematic.models.GE_Helpers.MAX_CACHED_SUITES", 1)
+
+        def build_checkpoint(manifest):
+            ge_helpers = GreatExpectationsHelpers(
+                sg, UNIMPLEMENTED_EXPECTATIONS, manifest, manifestPath, component="MockComponent"
+            )
+            ge_helpers.build_context()
+            ge_helpers.build_expectation_suite()
+            ge_helpers.build_checkpoint()
+            return ge_helpers
+
+        ge_helpers = build_checkpoint(manifest.drop(columns=["Check Range"]))
+        checkpoint_name = ge_helpers.checkpoint_name
+
+        # another validation evicts the suite while its checkpoint is about to run: it is kept until released
+        build_checkpoint(manifest.drop(columns=["Check Ages"])).release()
+        results = ge_helpers.context.run_checkpoint(
+            checkpoint_name=checkpoint_name,
+            batch_request={
+                "runtime_parameters": {"batch_data": manifest},
+                "batch_identifiers": {"default_identifier_name": "manifestID"},
+            },
+            result_format={'result_format': 'COMPLETE'},
+        )
+        assert results.list_validation_results()
+
+        ge_helpers.release()
+        assert checkpoint_name not in ge_helpers.context.list_checkpoints()
+
+    def test_concurrent_validations(self, helpers, sg):
+        validations = []
+        for manifest_name in ["Valid_Test_Manifest.csv", "Invalid_Test_Manifest.csv"]:
+            manifestPath = helpers.get_data_path(f"mock_manifests/{manifest_name}")
+            manifest = helpers.get_data_frame(manifestPath, preserve_raw_input=False)
+            # rules that need network access (url, cross manifest validation) are left out
+            manifest = manifest.drop(columns=[col for col in manifest.columns if "URL" in col or "Match" in col])
+            vm = ValidateManifest([], manifest, manifestPath, sg, None, get_validation_plan(sg, "MockComponent"))
+            validations.append((vm, manifest))
+
+        def validate(validation):
+            vm, manifest = validation
+            _, errors, warnings = vm.validate_manifest_rules(manifest.copy(), sg, restrict_rules=False, project_scope=None)
+            return errors, warnings
+
+        expected_results = [validate(validation) for validation in validations]
+        assert not expected_results[0][0] and expected_results[1][0]
+
+        # the validations share the in-memory context, and do not get each other's results
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(validate, validations * 4))
+
+        assert results == expected_results * 4
+
+
+class TestChunkedManifestValidation:
+    def test_validate_manifest_in_chunks(self, helpers, sg, metadataModel, tmp_path):
+        manifest = pd.read_csv(helpers.get_data_path("mock_manifests/Invalid_Test_Manifest.csv"))
+        # rules that need network access (url, cross manifest validation) are left out
+        manifest = manifest.drop(columns=[col for col in manifest.columns if "URL" in col or "Match" in col])
+        manifestPath = str(tmp_path / "manifest.csv")
+        manifest.to_csv(manifestPath, index=False)
+
+        expected_errors, expected_warnings = metadataModel.validateModelManifest(
+            manifestPath=manifestPath, rootNode="MockComponent", restrict_rules=True,
+        )
+        assert expected_errors
+
+        chunks = list(
+            metadataModel.validateModelManifestChunks(
+                manifestPath=manifestPath, rootNode="MockComponent", chunksize=2,
+            )
+        )
+        # two chunks of rows, then the rules depending on all rows
+        assert len(chunks) == 3
+        errors = [error for chunk_errors, _ in chunks for error in chunk_errors]
+        warnings = [warning for _, chunk_warnings in chunks for warning in chunk_warnings]
+
+        # the same errors as when validating the whole manifest in house, with the same row numbers
+        assert sorted(map(str, errors)) == sorted(map(str, expected_errors))
+        assert sorted(map(str, warnings)) == sorted(map(str, expected_warnings))
+        assert GenerateError.generate_content_error(
+            val_rule = 'unique error',
+            attribute_name = 'Check Unique',
+            sg = sg,
+            row_num = [2,3,4],
+            error_val = ['str1'],
+            )[0] in chunks[-1][0]
+
+        assert metadataModel.validateModelManifest(
+            manifestPath=manifestPath, rootNode="MockComponent", restrict_rules=True, chunksize=2,
+        ) == (errors, warnings)
+
+    def test_validate_chunks_in_parallel(self, helpers, sg, metadataModel, tmp_path, mocker):
+        manifest = pd.read_csv(helpers.get_data_path("mock_manifests/Invalid_Test_Manifest.csv"))
+        # rules that need network access (url, cross manifest validation) are left out
+        manifest = manifest.drop(columns=[col for col in manifest.columns if "URL" in col or "Match" in col])
+        manifestPath = str(tmp_path / "manifest.csv")
+        manifest.to_csv(manifestPath, index=False)
+
+        expected_chunks = list(
+            metadataModel.validateModelManifestChunks(
+                manifestPath=manifestPath, rootNode="MockComponent", chunksize=2,
+            )
+        )
+
+        create_worker_pool = mocker.spy(validate_manifest, "create_worker_pool")
+        chunks = list(
+            metadataModel.validateModelManifestChunks(
+                manifestPath=manifestPath, rootNode="MockComponent", chunksize=2, n_workers=2,
+            )
+        )
+        assert chunks == expected_chunks
+        # one pool of processes for both phases of all chunks
+        create_worker_pool.assert_called_once()